@@ -0,0 +1,42 @@
+"""
+Benchmark of @object fast path against general loading pipeline.
+Document is @object part of docs/example/same.moon scaled up.
+
+python -m benchmarks.bench_fastpath
+"""
+
+import io
+import timeit
+from pathlib import Path
+
+import moon
+
+EXAMPLE = Path(__file__).parent.parent / "docs" / "example" / "same.moon"
+
+
+def scaled_document(copies: int) -> str:
+    """@object tag of example repeated with unique identifiers."""
+    block = EXAMPLE.read_text().split("\n\n")[0]
+    name = block.split("\n", 1)[0]
+    return "\n\n".join(block.replace(name, f"{name}_{i}", 1) for i in range(copies))
+
+
+def main() -> None:
+    for copies in (100, 1_000, 10_000):
+        content = scaled_document(copies)
+        assert moon.load(io.StringIO(content), fast=True) == moon.load(
+            io.StringIO(content)
+        )
+        number = max(1, 10_000 // copies)
+        general = timeit.timeit(lambda: moon.load(io.StringIO(content)), number=number)
+        fast = timeit.timeit(
+            lambda: moon.load(io.StringIO(content), fast=True), number=number
+        )
+        print(
+            f"{copies:>6} objects: general {general / number * 1000:8.2f} ms, "
+            f"fast {fast / number * 1000:8.2f} ms, x{general / fast:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
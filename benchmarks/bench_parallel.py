@@ -0,0 +1,39 @@
+"""
+Benchmark of parallel loading by number of worker processes.
+Document is a catalogue of @object parts of docs/example/same.moon.
+
+python -m benchmarks.bench_parallel
+"""
+
+import io
+import os
+import timeit
+
+import moon
+from benchmarks.bench_fastpath import scaled_document
+
+
+def main() -> None:
+    content = scaled_document(20_000)
+    expected = moon.load(io.StringIO(content))
+    single = min(timeit.repeat(lambda: moon.load(io.StringIO(content)), number=1))
+    print(
+        f"{len(content) / 1e6:.1f} MB, {len(expected)} objects, {os.cpu_count()} cores"
+    )
+    print(f"  sequential: {single * 1000:8.1f} ms")
+
+    counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    for workers in counts:
+        assert moon.load(io.StringIO(content), workers=workers) == expected
+        seconds = min(
+            timeit.repeat(
+                lambda: moon.load(io.StringIO(content), workers=workers), number=1
+            )
+        )
+        print(
+            f"{workers:>3} workers: {seconds * 1000:8.1f} ms, x{single / seconds:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark of schema loading against generic type resolving.
+Document is a number of services with numeric, boolean and string fields.
+
+python -m benchmarks.bench_schema
+"""
+
+import io
+import timeit
+from dataclasses import dataclass
+
+import moon
+
+
+@dataclass
+class Service:
+    host: str
+    port: int
+    workers: int
+    timeout: float
+    debug: bool
+
+
+def services_document(copies: int) -> str:
+    """@object tags of services with distinct values."""
+    return "\n\n".join(
+        f"@object service_{i}\n  host: node-{i}.internal\n  port: {8000 + i}\n"
+        f"  workers: {i % 32}\n  timeout: {i / 7:.3f}\n  debug: {str(i % 2 == 0).lower()}"
+        for i in range(copies)
+    )
+
+
+def main() -> None:
+    for copies in (100, 1_000, 10_000):
+        content = services_document(copies)
+        schema = {f"service_{i}": Service for i in range(copies)}
+        loaded = moon.load(io.StringIO(content), schema=schema)
+        assert {k: vars(v) for k, v in loaded.items()} == moon.load(
+            io.StringIO(content)
+        )
+        number = max(1, 10_000 // copies)
+        for name, kwargs in (("generic", {}), ("schema", {"schema": schema})):
+            seconds = min(
+                timeit.repeat(
+                    lambda: moon.load(io.StringIO(content), **kwargs),
+                    number=number,
+                    repeat=5,
+                )
+            )
+            print(f"{copies:>6} services {name:>8}: {seconds / number * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
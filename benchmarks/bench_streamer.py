@@ -0,0 +1,51 @@
+"""
+Per-stage benchmark of streaming pipeline: tokenizer, parser, composer and emitter.
+Each stage is fed with materialized output of the previous one,
+so only its own streaming and hook work is measured.
+Document is @object part of docs/example/same.moon scaled up.
+
+python -m benchmarks.bench_streamer
+"""
+
+import timeit
+from pathlib import Path
+
+from moon.core.composer import ASTComposer
+from moon.core.constructor import construct
+from moon.core.emitter import EventEmitter
+from moon.core.parser import EventParser
+from moon.core.representer import represent
+from moon.core.serializer import serialize
+from moon.core.tokenizer import Tokenizer
+
+EXAMPLE = Path(__file__).parent.parent / "docs" / "example" / "same.moon"
+
+
+def scaled_document(copies: int) -> str:
+    """@object tag of example repeated with unique identifiers."""
+    block = EXAMPLE.read_text().split("\n\n")[0]
+    name = block.split("\n", 1)[0]
+    return "\n\n".join(block.replace(name, f"{name}_{i}", 1) for i in range(copies))
+
+
+def measure(name: str, stage, number: int) -> None:
+    seconds = min(timeit.repeat(lambda: list(stage()), number=number, repeat=10))
+    print(f"{name:>10}: {seconds / number * 1000:8.2f} ms")
+
+
+def main() -> None:
+    content = scaled_document(1_000)
+    tokens = list(Tokenizer(content))
+    events = list(EventParser(tokens))
+    nodes = list(ASTComposer(events))
+    dumped = list(serialize(represent(construct(nodes))))
+    print(f"{len(tokens)} tokens, {len(events)} events, {len(dumped)} dump events")
+
+    measure("tokenizer", lambda: Tokenizer(content), 5)
+    measure("parser", lambda: EventParser(tokens), 5)
+    measure("composer", lambda: ASTComposer(events), 5)
+    measure("emitter", lambda: EventEmitter(dumped), 5)
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,26 @@ print(config["context"])
 
 """
 
-from ._api import dump, load
-
-__all__ = ["load", "dump"]
+from ._api import dump, iter_load_many, load, load_many
+from ._version import __version__
+from .core.cache import Cache
+from .core.diskcache import DiskCache
+from .core.document import Document
+from .core.intern import InternTable
+from .core.records import RecordFactory
+from .core.reload import Changes, Reloader
+
+__all__ = [
+    "load",
+    "load_many",
+    "iter_load_many",
+    "dump",
+    "RecordFactory",
+    "InternTable",
+    "Cache",
+    "DiskCache",
+    "Reloader",
+    "Changes",
+    "Document",
+    "__version__",
+]
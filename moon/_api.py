@@ -8,36 +8,257 @@ from moon import load, dump
 Shouldn`t be imported directly.
 """
 
-from typing import Any, Dict, Optional
+from os import PathLike
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
 
-from moon.core.composer import ASTComposer
-from moon.core.constructor import construct
+from moon.core.bulk import EXECUTORS, load_files
+from moon.core.cache import Cache, default_cache
+from moon.core.constructor import construct_events
+from moon.core.diskcache import DiskCache
 from moon.core.emitter import EventEmitter
-from moon.core.fileio import FileOrPath, read, write
+from moon.core.fastpath import fast_construct
+from moon.core.fileio import FileOrPath, map_file, read, read_chunks, write
+from moon.core.intern import InternTable
+from moon.core.lazy import LazyDocument
+from moon.core.parallel import load_parallel
 from moon.core.parser import EventParser
+from moon.core.records import (
+    ObjectFactory,
+    ObjectHook,
+    ObjectPairsHook,
+    convert_objects,
+    object_factory,
+)
 from moon.core.representer import represent
+from moon.core.schema import Schema, construct_schema
 from moon.core.serializer import serialize
-from moon.core.tokenizer import Tokenizer
+from moon.core.tokenizer import Buffer, Tokenizer
+from moon.schemas import ArgumentsError
 
 
 def load(
     fp: FileOrPath,
     *,
     encoding: Optional[str] = None,
-) -> Dict[str, Any]:
+    chunk_size: Optional[int] = None,
+    memory_map: bool = False,
+    fast: bool = False,
+    lazy: bool = False,
+    only: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    schema: Optional[Schema] = None,
+    object_hook: Optional[ObjectHook] = None,
+    object_pairs_hook: Optional[ObjectPairsHook] = None,
+    intern: Optional[InternTable] = None,
+    cache: Union[bool, Cache] = False,
+    disk_cache: Union[bool, DiskCache] = False,
+) -> Union[Dict[str, Any], LazyDocument, Any]:
     """
     Load MOON file and convert to python object.
     :param fp: path to MOON file or file-like object.
     :param encoding: file encoding, defaults to utf-8.
-    :return: python dict.
+    :param chunk_size: if set, file is read and tokenized by blocks of this size
+        instead of reading whole content at once.
+    :param memory_map: if True, UTF-8 file is memory-mapped and tokenized as bytes
+        without decoding whole content.
+    :param fast: if True, document written only with @object tags is loaded
+        by fused single-pass fast path. Other documents are loaded as usual.
+    :param lazy: if True, returns read-only mapping, which loads each top-level tag
+        on the first access to its identifier.
+    :param only: top-level identifiers to load, other tags are skipped
+        without parsing them. Identifiers missing in file are ignored.
+    :param workers: if set, top-level tags are loaded by this number of processes.
+    :param schema: dataclass, TypedDict or dict of identifiers to types.
+        Scalars are converted by declared types, unknown keys are rejected.
+    :param object_hook: called with dict of each object, nested ones first,
+        its result replaces the object.
+    :param object_pairs_hook: called with list of key value pairs of each object,
+        takes priority over `object_hook`. `RecordFactory` makes records of them.
+    :param intern: table sharing equal keys and short values, see `InternTable`.
+        Keys are shared within a load anyway, a table given here can be
+        inspected after load or shared by several loads.
+    :param cache: `Cache` to get document from or put it to, True for shared
+        default cache. File is loaded again when its modification time or size
+        changes. Only a path can be cached.
+    :param disk_cache: `DiskCache` to store document in files, True for
+        __mooncache__ directory next to loaded file. Tokenizing and parsing
+        are skipped while file content, moon version and hooks are the same.
+    :return: python dict, or dataclass instance of schema.
     """
 
-    content = read(fp=fp, encoding=encoding)
+    if cache is not False or disk_cache is not False:
+        if not isinstance(cache, (bool, Cache)):
+            raise ArgumentsError(f"'cache' must be a bool or Cache, got {cache!r}")
+        if not isinstance(disk_cache, (bool, DiskCache)):
+            raise ArgumentsError(
+                f"'disk_cache' must be a bool or DiskCache, got {disk_cache!r}"
+            )
+        if not isinstance(fp, (PathLike, str, bytes)):
+            raise ArgumentsError("Only a file path can be loaded with cache")
+        if (
+            lazy
+            or only is not None
+            or schema is not None
+            or object_hook is not None
+            or object_pairs_hook is not None
+            or intern is not None
+        ):
+            raise ArgumentsError(
+                "Cache can be used only with 'encoding', 'chunk_size', "
+                "'memory_map', 'fast' and 'workers'"
+            )
+
+        def loader(source: FileOrPath = fp) -> Dict[str, Any]:
+            return load(
+                source,
+                encoding=encoding,
+                chunk_size=chunk_size,
+                memory_map=memory_map,
+                fast=fast,
+                workers=workers,
+            )
+
+        if disk_cache is not False:
+            disk = DiskCache() if disk_cache is True else disk_cache
+            disk_loader = loader
+
+            def loader() -> Dict[str, Any]:
+                return disk.load(fp, encoding, disk_loader)
+
+        if cache is False:
+            return loader()
+        store = default_cache if cache is True else cache
+        return store.load(fp, encoding, loader)
+
+    # Objects are made by hooks as they are built, fast path, workers and `only`
+    # build plain dicts, which are converted after load
+    objects = object_factory(object_hook, object_pairs_hook)
+    if objects is not None and (lazy or schema is not None):
+        raise ArgumentsError("Object hooks cannot be used with 'lazy' or 'schema'")
+
+    if fast and (chunk_size is not None or memory_map):
+        raise ArgumentsError("'fast' cannot be used with 'chunk_size' or 'memory_map'")
+    if (lazy or only is not None) and (chunk_size is not None or memory_map or fast):
+        raise ArgumentsError(
+            "'lazy' and 'only' cannot be used with 'chunk_size', 'memory_map' or 'fast'"
+        )
+    if schema is not None and (fast or lazy or only is not None or workers is not None):
+        raise ArgumentsError(
+            "'schema' cannot be used with 'fast', 'lazy', 'only' or 'workers'"
+        )
+    if intern is not None and (
+        lazy or only is not None or workers is not None or schema is not None
+    ):
+        raise ArgumentsError(
+            "'intern' cannot be used with 'lazy', 'only', 'workers' or 'schema'"
+        )
+    if workers is not None:
+        if not isinstance(workers, int) or workers < 1:
+            raise ArgumentsError(f"'workers' must be a positive int, got {workers}")
+        if chunk_size is not None or memory_map or fast or lazy or only is not None:
+            raise ArgumentsError("'workers' can be used only with 'encoding'")
+        document = load_parallel(read(fp=fp, encoding=encoding), workers)
+        return convert_objects(document, object_hook, object_pairs_hook)
+    if isinstance(only, str):
+        raise ArgumentsError("'only' must be an iterable of identifiers, not a string")
+    if lazy or only is not None:
+        document = LazyDocument(read(fp=fp, encoding=encoding), only=only)
+        if lazy:
+            return document
+        return convert_objects(dict(document), object_hook, object_pairs_hook)
+
+    if memory_map:
+        if chunk_size is not None:
+            raise ArgumentsError("'chunk_size' cannot be used with 'memory_map'")
+        with map_file(fp=fp, encoding=encoding) as mapped:
+            return _load(mapped, schema, intern, objects)
+
+    if chunk_size is None:
+        content = read(fp=fp, encoding=encoding)
+        if fast:
+            result = fast_construct(content, intern)
+            if result is not None:
+                return convert_objects(result, object_hook, object_pairs_hook)
+    else:
+        content = read_chunks(fp=fp, encoding=encoding, chunk_size=chunk_size)
+    return _load(content, schema, intern, objects)
+
+
+def _load(
+    content: Union[str, Iterable[str], Buffer],
+    schema: Optional[Schema] = None,
+    intern: Optional[InternTable] = None,
+    objects: Optional[ObjectFactory] = None,
+) -> Any:
     tokenizer = Tokenizer(content)
-    events = EventParser(tokenizer)
-    ast = ASTComposer(events)
-    result = construct(ast)
-    return result
+    # Whole string is tabulated and parsed by indexes, streams are parsed as they go
+    events = EventParser(
+        tokenizer.tabulate() if isinstance(content, str) else tokenizer
+    )
+    try:
+        if schema is not None:
+            return construct_schema(events, schema)
+        return construct_events(events, intern, objects)
+    finally:
+        # Scanner of a memory map holds its buffer until closed,
+        # frames of a raised error would keep it after map is closed
+        tokenizer.close()
+
+
+def load_many(
+    paths: Iterable[FileOrPath],
+    *,
+    workers: Optional[int] = None,
+    executor: str = "thread",
+    errors: str = "raise",
+    encoding: Optional[str] = None,
+) -> Dict[FileOrPath, Union[Dict[str, Any], Exception]]:
+    """
+    Load many MOON files by a pool of workers.
+    :param paths: paths to MOON files.
+    :param workers: number of workers, defaults to executor default.
+    :param executor: "thread" or "process" pool.
+    :param errors: "raise" to raise the first error and cancel the rest files,
+        "collect" to return errors as results of failed files.
+    :param encoding: files encoding, defaults to utf-8.
+    :return: dict of paths to python dicts or errors, in order of paths.
+    """
+
+    paths = list(paths)
+    results = dict(
+        iter_load_many(
+            paths, workers=workers, executor=executor, errors=errors, encoding=encoding
+        )
+    )
+    return {fp: results[fp] for fp in paths}
+
+
+def iter_load_many(
+    paths: Iterable[FileOrPath],
+    *,
+    workers: Optional[int] = None,
+    executor: str = "thread",
+    errors: str = "raise",
+    encoding: Optional[str] = None,
+) -> Iterator[Tuple[FileOrPath, Union[Dict[str, Any], Exception]]]:
+    """
+    Load many MOON files by a pool of workers, streaming results as they complete.
+    Arguments are the same as of `load_many`.
+    :return: iterator of paths and python dicts or errors, in order of completion.
+    """
+
+    if executor not in EXECUTORS:
+        raise ArgumentsError(
+            f"'executor' must be one of {', '.join(EXECUTORS)}, got {executor!r}"
+        )
+    if errors not in ("raise", "collect"):
+        raise ArgumentsError(f"'errors' must be 'raise' or 'collect', got {errors!r}")
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise ArgumentsError(f"'workers' must be a positive int, got {workers}")
+
+    paths = list(paths)
+    results = load_files(paths, workers, executor, errors == "raise", encoding)
+    return ((paths[index], result) for index, result in results)
 
 
 def dump(
@@ -1,7 +1,22 @@
 # SPDX-License-Identifier: Apache-2.0
+"""
+Base of streaming stages. Stage reads upstream items one by one with bounded lookahead.
+"""
 
 from abc import ABC, abstractmethod
-from typing import Generic, Iterable, Iterator, Optional, TypeVar, Union
+from collections import deque
+from typing import (
+    ClassVar,
+    Deque,
+    Final,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 from moon.schemas import ArgumentsError
 
@@ -9,39 +24,137 @@ T = TypeVar("T")
 R = TypeVar("R")
 
 
-class StatefulStreamer(ABC, Generic[T, R]):
-    def __init__(self, stream: Union[Iterable[T]]) -> None:
+class _End:
+    """
+    End of stream sentinel. Is falsy and is the only instance of its class.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "END"
+
+
+END: Final = _End()
+# Current item is not pulled from upstream yet
+_UNSET: Final = object()
+
+
+class LookaheadStreamer(ABC, Generic[T, R]):
+    """
+    Stream to stream stage with current item and up to `lookahead` next items.
+    Next items wait in deque used as ring buffer of at most `lookahead` items
+    (more only after `reset`). End of stream is END sentinel,
+    so reading past the end never raises.
+    Items can be re-read after `mark` and `reset`.
+    """
+
+    lookahead: ClassVar[int] = 2
+
+    def __init__(self, stream: Iterable[T]) -> None:
         if isinstance(stream, Iterator):
-            self.__stream = stream
+            self._stream = stream
         elif isinstance(stream, Iterable):
-            self.__stream = iter(stream)
+            self._stream = iter(stream)
         else:
             raise ArgumentsError(
                 f"Stream must be an iterator or an iterable but got {type(stream)}"
             )
-        self.__current: Optional[T] = None
-        self.__next: Optional[T] = None
+        self._current: Union[T, _End, object] = _UNSET
+        # Items pulled from upstream after current one
+        self._ahead: Deque[T] = deque()
+        # Items consumed since the first mark
+        self._history: Optional[List[T]] = None
 
-    def next(self) -> T:
-        if self.__next is not None:
-            self.__current = self.__next
-            self.__next = None
-        else:
-            self.__current = next(self.__stream)
-        return self.__current
-
-    def read(self) -> T:
-        if self.__current is None:
-            self.__current = self.__next or next(self.__stream)
-        return self.__current
-
-    def peek(self) -> Optional[T]:
-        if self.__next is None:
-            try:
-                self.__next = next(self.__stream)
-            except StopIteration:
-                self.__next = None
-        return self.__next
+    def read(self) -> Union[T, _End]:
+        """
+        :return: current item or END.
+        """
+        current = self._current
+        if current is _UNSET:
+            current = self._current = next(self._stream, END)
+        return current
+
+    def next(self) -> Union[T, _End]:
+        """
+        Moves to the next item.
+        :return: new current item or END.
+        """
+        current = self._current
+        if current is _UNSET:
+            current = self.read()
+        # Marked stream keeps consumed items for `reset`
+        if self._history is not None and current is not END:
+            self._history.append(current)
+        ahead = self._ahead
+        current = self._current = ahead.popleft() if ahead else next(self._stream, END)
+        return current
+
+    def peek(self, k: int = 1) -> Union[T, _End]:
+        """
+        :param k: how far to look ahead, 1 is the item after current one.
+        :return: k-th item after current one or END.
+        """
+        ahead = self._ahead
+        if k == 1 and self._current is not _UNSET:
+            if ahead:
+                return ahead[0]
+            item = next(self._stream, END)
+            if item is not END:
+                ahead.append(item)
+            return item
+        if not 0 < k <= self.lookahead:
+            raise ArgumentsError(
+                f"Lookahead must be from 1 to {self.lookahead}, got {k}"
+            )
+        if k <= len(ahead):
+            return ahead[k - 1]
+        if self.read() is END:
+            return END
+
+        while len(ahead) < k:
+            item = next(self._stream, END)
+            if item is END:
+                return END
+            ahead.append(item)
+        return ahead[k - 1]
+
+    def mark(self) -> int:
+        """
+        Starts keeping consumed items so that stream can be reset to current item.
+        :return: mark for `reset`.
+        """
+        self.read()
+        if self._history is None:
+            self._history = []
+        return len(self._history)
+
+    def reset(self, mark: int) -> None:
+        """
+        Moves back to the item where mark was made.
+        :param mark: value returned by `mark`.
+        """
+        if self._history is None or not 0 <= mark <= len(self._history):
+            raise ArgumentsError(f"Cannot reset stream to mark {mark}")
+
+        items = self._history[mark:]
+        del self._history[mark:]
+        if not items:
+            return
+        if self._current is not END:
+            items.append(self._current)
+        items.extend(self._ahead)
+        self._current = items[0]
+        self._ahead = deque(items[1:])
+
+    def release(self) -> None:
+        """
+        Forgets all marks and consumed items.
+        """
+        self._history = None
 
     @abstractmethod
     def __iter__(self) -> Iterator[R]:
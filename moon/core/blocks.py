@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Top-level blocks scanning. Block is a part of normalized content
+from a line starting with registered tag up to the next such line.
+Blocks are found without tokenizing, so that they can be loaded separately.
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, Final, Iterator, List, Match, Optional, Pattern
+
+from moon.core.constructor import construct_events
+from moon.core.parser import EventParser
+from moon.core.tokenizer import Tokenizer
+from moon.hooks.tags import resolve_tag
+
+# First word of a line and the word after it
+_tag_line: Final[Pattern[str]] = re.compile(
+    r"^ *(@[^ ,:'\"\r\n]+)(?: +([^ ,:'\"\r\n]+))?", re.MULTILINE
+)
+
+# Comment starts are searched, so that content between them is not scanned
+_comment_start: Final[Pattern[str]] = re.compile(r"/[/*]")
+# Comment as tokenizer matches it, block comment without end lasts to content end
+_comment: Final[Pattern[str]] = re.compile(
+    r"//[^\n]*|/\*(?:.*?\*/|(?P<open>.*))", re.DOTALL
+)
+# Chars after which a lexeme starts, a comment start inside a word is a word
+_lexeme_ends: Final[str] = " \n\r,:'\""
+
+
+def block_comments(content: str) -> Iterator[Match[str]]:
+    """
+    Find block comments of normalized content the same as tokenizer does,
+    without scanning words between them.
+    Group `open` of comment without end is not None.
+    :param content: normalized MOON content.
+    :return: matches of block comments in order of content.
+    """
+    end = 0
+    start = _comment_start.search(content)
+    while start is not None:
+        i = start.start()
+        if i > 0 and i != end and content[i - 1] not in _lexeme_ends:
+            start = _comment_start.search(content, i + 1)
+            continue
+        match = _comment.match(content, i)
+        end = match.end()
+        if content.startswith("/*", i):
+            yield match
+        start = _comment_start.search(content, end)
+
+
+@dataclass(slots=True)
+class Block:
+    """
+    Top-level tag block.
+    Name is None when tag header has no plain identifier.
+    """
+
+    tag: str
+    name: Optional[str]
+    start: int
+    end: int
+
+
+def scan_blocks(content: str) -> List[Block]:
+    """
+    Find top-level tag blocks of normalized content.
+    Content before the first block is not covered by blocks.
+    :param content: normalized MOON content.
+    :return: blocks in order of content.
+    """
+    starts: List[int] = []
+    ends: List[int] = []
+    if "/*" in content:
+        # Tag lines inside block comments are not tags
+        for match in block_comments(content):
+            if "\n" in match.group():
+                starts.append(match.start())
+                ends.append(match.end())
+
+    blocks: List[Block] = []
+    for match in _tag_line.finditer(content):
+        tag = match.group(1)
+        if resolve_tag(tag) is None:
+            continue
+        if starts:
+            i = bisect_right(starts, match.start()) - 1
+            if i >= 0 and match.start() < ends[i]:
+                continue
+
+        name = match.group(2)
+        if name is not None and name.startswith(("//", "/*")):
+            name = None
+        if blocks:
+            blocks[-1].end = match.start()
+        blocks.append(Block(tag, name, match.start(), len(content)))
+
+    return blocks
+
+
+def load_part(part: str, first_line: int = 1) -> Dict[str, Any]:
+    """
+    Load a part of normalized content, made of whole blocks.
+    :param part: MOON content part.
+    :param first_line: number of the part first line in document, used in errors.
+    :return: Python dict of tags of the part.
+    """
+    return construct_events(EventParser(Tokenizer(part, first_line).tabulate()))
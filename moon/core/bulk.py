@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Bulk loading of many files by a pool of threads or processes.
+Paths are sent to workers in batches to pay tasks overhead once per batch,
+each file is read and loaded inside worker by the usual pipeline.
+"""
+
+import os
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from typing import Any, Dict, Final, Iterator, List, Optional, Sequence, Tuple, Union
+
+from moon.core.constructor import construct_events
+from moon.core.fileio import FileOrPath, read
+from moon.core.parser import EventParser
+from moon.core.tokenizer import Tokenizer
+
+EXECUTORS: Final[Dict[str, type]] = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+# Upper bound of files in one task
+MAX_BATCH_SIZE: Final[int] = 32
+
+Loaded = Union[Dict[str, Any], Exception]
+
+
+def load_file(fp: FileOrPath, encoding: Optional[str] = None) -> Dict[str, Any]:
+    """Read and load a single MOON file."""
+    content = read(fp=fp, encoding=encoding)
+    return construct_events(EventParser(Tokenizer(content).tabulate()))
+
+
+def _load_batch(
+    batch: List[Tuple[int, FileOrPath]], encoding: Optional[str]
+) -> List[Tuple[int, Loaded]]:
+    """Load files of a batch, errors are returned instead of results."""
+    results: List[Tuple[int, Loaded]] = []
+    for index, fp in batch:
+        try:
+            results.append((index, load_file(fp, encoding)))
+        except Exception as e:
+            results.append((index, e))
+    return results
+
+
+def load_files(
+    paths: Sequence[FileOrPath],
+    workers: Optional[int],
+    executor: str,
+    fail_fast: bool,
+    encoding: Optional[str] = None,
+) -> Iterator[Tuple[int, Loaded]]:
+    """
+    Load files by a pool of workers.
+    :param paths: files to load.
+    :param workers: pool size, executor default if None.
+    :param executor: "thread" or "process".
+    :param fail_fast: if True, the first error is raised and pending files
+        are cancelled, otherwise errors are yielded as results.
+    :param encoding: files encoding.
+    :return: iterator of paths indexes and results in order of completion.
+    """
+    pool_size = workers or os.cpu_count() or 1
+    size = max(1, min(MAX_BATCH_SIZE, len(paths) // (pool_size * 4)))
+    indexed = list(enumerate(paths))
+    batches = [indexed[i : i + size] for i in range(0, len(indexed), size)]
+
+    pool: Executor = EXECUTORS[executor](max_workers=workers)
+    try:
+        futures = [pool.submit(_load_batch, batch, encoding) for batch in batches]
+        for future in as_completed(futures):
+            for index, result in future.result():
+                if fail_fast and isinstance(result, Exception):
+                    raise result
+                yield index, result
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
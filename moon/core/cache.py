@@ -0,0 +1,178 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+In-process cache of loaded documents. Entry is keyed by resolved path,
+modification time, size and encoding of file, so a changed file is loaded again.
+Callers get a deep copy or a read-only view of cached document,
+so they cannot corrupt each other.
+"""
+
+import copy
+import os
+import sys
+from collections import OrderedDict
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Tuple
+
+from moon.core.fileio import FileOrPath
+from moon.schemas import ArgumentsError, ReadError
+
+CacheKey = Tuple[str, int, int, Optional[str]]
+
+# Scalars which are not copied, hooks may resolve others
+_immutable = (str, int, float, bool, type(None))
+
+
+class CacheStats(NamedTuple):
+    """Statistics of documents cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+class Cache:
+    """
+    LRU cache of loaded documents, bounded by number of entries
+    and optionally by estimated size of documents in bytes.
+    With `copy` each caller gets a deep copy of cached document,
+    otherwise a shared read-only view of nested mappings.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: Optional[int] = None,
+        copy: bool = True,
+    ) -> None:
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise ArgumentsError(
+                f"'max_entries' must be a positive int, got {max_entries}"
+            )
+        if max_bytes is not None and (not isinstance(max_bytes, int) or max_bytes < 1):
+            raise ArgumentsError(f"'max_bytes' must be a positive int, got {max_bytes}")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.copy = copy
+        # Keys to documents and their sizes, the least recently used first
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = Lock()
+
+    def load(
+        self,
+        fp: FileOrPath,
+        encoding: Optional[str],
+        loader: Callable[[], Dict[str, Any]],
+    ) -> Any:
+        """
+        Get cached document of file or load it by `loader`.
+        Document is not cached if file changed while it was loaded.
+        :param fp: path to MOON file.
+        :param encoding: file encoding, a part of key.
+        :param loader: loads document of file.
+        :return: copy or view of document.
+        """
+        key = self._key(fp, encoding)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if entry is not None:
+            return self._hand_out(entry[0])
+
+        document = loader()
+        stored = document if self.copy else _freeze(document)
+        if self._key(fp, encoding) == key:
+            self._put(key, stored, _estimate_size(document))
+        return self._hand_out(stored)
+
+    def stats(self) -> CacheStats:
+        """:return: hits, misses, evictions, entries and their estimated bytes."""
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._bytes,
+            )
+
+    def clear(self) -> None:
+        """Forget cached documents and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"<Cache {self.stats()}>"
+
+    def _key(self, fp: FileOrPath, encoding: Optional[str]) -> CacheKey:
+        if isinstance(fp, bytes):
+            fp = fp.decode()
+        path = os.path.realpath(fp)
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            raise ReadError(f"Cannot read file {fp!r}: {e}") from e
+        return path, stat.st_mtime_ns, stat.st_size, encoding
+
+    def _hand_out(self, document: Any) -> Any:
+        return _copy(document) if self.copy else document
+
+    def _put(self, key: Hashable, document: Any, size: int) -> None:
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (document, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self._evictions += 1
+
+
+# Cache of `load(cache=True)`
+default_cache = Cache()
+
+
+def _copy(value: Any) -> Any:
+    """Deep copy of document, immutable scalars are shared."""
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, _immutable):
+        return value
+    return copy.deepcopy(value)
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only view of document with read-only views of nested dicts."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _estimate_size(value: Any) -> int:
+    """Size of dicts, keys and scalars of document in bytes."""
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            sys.getsizeof(key) + _estimate_size(item) for key, item in value.items()
+        )
+    return sys.getsizeof(value)
@@ -5,7 +5,7 @@ AST (Abstract Syntax Tree) Composer. Is a pre-final stage of loading MOON.
 
 from typing import Iterator
 
-from moon.core.base import StatefulStreamer
+from moon.core.base import END, LookaheadStreamer
 from moon.hooks.tags import resolve_tag
 from moon.schemas import (
     ASTError,
@@ -17,31 +17,27 @@ from moon.schemas import (
 )
 
 
-class ASTComposer(StatefulStreamer[Event, ASTNode]):
+class ASTComposer(LookaheadStreamer[Event, ASTNode]):
     """
     Stateful AST composer. Turns stream of events into stream of AST nodes.
     """
 
     def __iter__(self) -> Iterator[ASTNode]:
-        while True:
-            try:
-                event = self.read()
+        event = self.read()
+        while event is not END:
+            if event.type == EventType.tag_start:
+                tag_hook = resolve_tag(event.value)
+                if not tag_hook:
+                    raise UnknownEvent(f"Unknown event: {event}")
 
-                if event.type == EventType.tag_start:
-                    tag_hook = resolve_tag(event.value)
-                    if not tag_hook:
-                        raise UnknownEvent(f"Unknown event: {event}")
+                yield tag_hook.compose(self)
 
-                    yield tag_hook.compose(self)
+            elif event.type == EventType.document_end:
+                return
 
-                elif event.type == EventType.document_end:
-                    return
+            else:
+                raise UnexpectedEvent(f"Unexpected event: {event}. Expected: tag start")
 
-                else:
-                    raise UnexpectedEvent(
-                        f"Unexpected event: {event}. Expected: tag start"
-                    )
+            event = self.next()
 
-                self.next()
-            except StopIteration:
-                raise ASTError("Unexpected end of stream of events.")
+        raise ASTError("Unexpected end of stream of events.")
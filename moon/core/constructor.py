@@ -1,16 +1,24 @@
 # SPDX-License-Identifier: Apache-2.0
 """
-Final loading stage. Python object construction from MOON AST.
+Final loading stage. Python object construction from MOON AST
+or directly from stream of events.
 """
 
-from typing import Any, Dict, Iterable
+from typing import Any, Callable, ClassVar, Dict, Iterable, Iterator, Optional, Tuple
 
+from moon.core.base import END, LookaheadStreamer
+from moon.core.intern import InternTable
 from moon.hooks.tags import resolve_tag
 from moon.schemas import (
+    ASTError,
     ASTNode,
     DuplicateIdentifierNode,
+    Event,
+    EventType,
     TagNode,
+    UnexpectedEvent,
     UnexpectedNode,
+    UnknownEvent,
     UnknownNode,
 )
 
@@ -38,3 +46,76 @@ def construct(ast: Iterable[ASTNode]) -> Dict[str, Any]:
             )
 
     return res
+
+
+class EventConstructor(LookaheadStreamer[Event, Tuple[str, Any]]):
+    """
+    Stateful constructor. Turns stream of events into stream of
+    tag identifiers and Python values using tag hooks `build`, without AST.
+    Hooks share keys through `strings` table, a new one if it is not given.
+    Objects are made by `objects` of their built dicts, when it is given.
+    """
+
+    # Scalars are kept as strings by tag hooks `build_raw`
+    raw: ClassVar[bool] = False
+
+    def __init__(
+        self,
+        stream: Iterable[Event],
+        strings: Optional[InternTable] = None,
+        objects: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> None:
+        super().__init__(stream)
+        self.strings = InternTable() if strings is None else strings
+        self.objects = objects
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        event = self.read()
+        while event is not END:
+            if event.type == EventType.tag_start:
+                tag_hook = resolve_tag(event.value)
+                if not tag_hook:
+                    raise UnknownEvent(f"Unknown event: {event}")
+
+                yield tag_hook.build_raw(self) if self.raw else tag_hook.build(self)
+
+            elif event.type == EventType.document_end:
+                return
+
+            else:
+                raise UnexpectedEvent(f"Unexpected event: {event}. Expected: tag start")
+
+            event = self.next()
+
+        raise ASTError("Unexpected end of stream of events.")
+
+
+class RawEventConstructor(EventConstructor):
+    """
+    Event constructor which keeps scalars as source strings.
+    """
+
+    raw = True
+
+
+def construct_events(
+    events: Iterable[Event],
+    strings: Optional[InternTable] = None,
+    objects: Optional[Callable[[Dict[str, Any]], Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Builds Python dict from MOON events, skipping AST.
+    :param events: MOON events.
+    :param strings: table of shared keys and values, a new one if not given.
+    :param objects: makes objects of built dicts, e.g. records.
+    :return: Python dict.
+    """
+
+    res = dict()
+
+    for name, value in EventConstructor(events, strings, objects):
+        if name in res:
+            raise DuplicateIdentifierNode(f"Duplicate identifier: {name}")
+        res[name] = value
+
+    return res
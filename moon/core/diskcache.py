@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+On-disk cache of loaded documents, like .pyc files of Python modules.
+Document is stored by `marshal` with a header of source modification time,
+size and content hash. Header also holds hash of moon version, registered hooks
+with their versions and encoding, so cache written by other setup is not used.
+Code of hooks is not hashed, hook changing its results without bumping
+its `version` gets stale documents from cache.
+Cache is checked by file stat, and by content hash when stat differs.
+"""
+
+import hashlib
+import marshal
+import os
+import struct
+from io import BytesIO
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Final, Optional, Tuple, Union
+
+from moon._version import __version__
+from moon.core.fileio import FileOrPath
+from moon.hooks.tags.hook import _parsing_hooks
+from moon.hooks.types.hook import _hooks as _type_hooks
+from moon.schemas import ArgumentsError, ReadError
+
+MAGIC: Final[bytes] = b"MOON"
+# Bumped when cache files layout changes
+FORMAT: Final[int] = 1
+# Magic, format, setup hash, source mtime_ns, source size, source hash
+_header: Final[struct.Struct] = struct.Struct("<4sH16sQQ16s")
+CACHE_DIR: Final[str] = "__mooncache__"
+SUFFIX: Final[str] = ".moonc"
+_MISS: Final = object()
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def setup_digest(encoding: Optional[str]) -> bytes:
+    """Hash of moon version, registered hooks with their versions and encoding."""
+    hooks = [*_parsing_hooks.values(), *_type_hooks]
+    names = ",".join(
+        f"{hook.__module__}.{hook.__qualname__}:{hook.version}" for hook in hooks
+    )
+    return _digest(f"{__version__}|{names}|{encoding}".encode())
+
+
+class DiskCache:
+    """
+    Persistent cache of loaded documents.
+    Files are kept in `directory`, or in __mooncache__ next to loaded file
+    when it is None. Documents which `marshal` cannot store are not cached,
+    unreadable or stale cache files are ignored and rewritten.
+    `marshal` data is trusted, cache directory must not be writable by others.
+    """
+
+    def __init__(self, directory: Optional[Union[str, os.PathLike]] = None) -> None:
+        if directory is not None and not isinstance(directory, (str, os.PathLike)):
+            raise ArgumentsError(f"'directory' must be a path, got {directory!r}")
+        self.directory = None if directory is None else Path(directory)
+        self.hits = 0
+        self.misses = 0
+
+    def load(
+        self,
+        fp: FileOrPath,
+        encoding: Optional[str],
+        loader: Callable[[BinaryIO], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Get document from cache file or load it by `loader` and store it.
+        Source is read once, the hashed content is the loaded one.
+        :param fp: path to MOON file.
+        :param encoding: file encoding, a part of key.
+        :param loader: loads document of binary file of read content.
+        :return: python dict.
+        """
+        if isinstance(fp, bytes):
+            fp = fp.decode()
+        source = Path(os.path.realpath(fp))
+        stat = _stat(source)
+        cache_path = self.cache_path(source)
+        setup = setup_digest(encoding)
+
+        content: Optional[bytes] = None
+        header, payload = _read_cache(cache_path)
+        if header is not None and header[:3] == (MAGIC, FORMAT, setup):
+            document: Any = _MISS
+            if header[3:5] == (stat.st_mtime_ns, stat.st_size):
+                document = _unmarshal(payload)
+            else:
+                content = _read_source(source)
+                if _digest(content) == header[5]:
+                    document = _unmarshal(payload)
+                    if document is not _MISS:
+                        # Content is the same, next check is by stat again
+                        self._write(cache_path, setup, stat, header[5], payload)
+            if document is not _MISS:
+                self.hits += 1
+                return document
+
+        self.misses += 1
+        if content is None:
+            content = _read_source(source)
+        document = loader(BytesIO(content))
+        changed = _stat(source)
+        if (changed.st_mtime_ns, changed.st_size) != (stat.st_mtime_ns, stat.st_size):
+            return document
+        try:
+            payload = marshal.dumps(document)
+        except ValueError:
+            return document
+        self._write(cache_path, setup, stat, _digest(content), payload)
+        return document
+
+    def cache_path(self, source: Path) -> Path:
+        """:return: path of cache file of resolved source path."""
+        if self.directory is None:
+            return source.parent / CACHE_DIR / (source.name + SUFFIX)
+        name = _digest(str(source).encode()).hex()
+        return self.directory / (name + SUFFIX)
+
+    def _write(
+        self,
+        cache_path: Path,
+        setup: bytes,
+        stat: os.stat_result,
+        digest: bytes,
+        payload: bytes,
+    ) -> None:
+        header = _header.pack(
+            MAGIC, FORMAT, setup, stat.st_mtime_ns, stat.st_size, digest
+        )
+        temp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp.write_bytes(header + payload)
+            os.replace(temp, cache_path)
+        except OSError:
+            # Cache is optional, e.g. directory may be read-only
+            temp.unlink(missing_ok=True)
+
+    def __repr__(self) -> str:
+        return f"<DiskCache hits: {self.hits} misses: {self.misses}>"
+
+
+def _stat(source: Path) -> os.stat_result:
+    try:
+        return os.stat(source)
+    except OSError as e:
+        raise ReadError(f"Cannot read file {str(source)!r}: {e}") from e
+
+
+def _read_source(source: Path) -> bytes:
+    try:
+        return source.read_bytes()
+    except OSError as e:
+        raise ReadError(f"Cannot read file {str(source)!r}: {e}") from e
+
+
+def _read_cache(cache_path: Path) -> Tuple[Optional[tuple], bytes]:
+    try:
+        data = cache_path.read_bytes()
+        return _header.unpack_from(data), data[_header.size :]
+    except (OSError, struct.error):
+        return None, b""
+
+
+def _unmarshal(payload: bytes) -> Any:
+    try:
+        document = marshal.loads(payload)
+    except (EOFError, ValueError, TypeError):
+        return _MISS
+    return document if isinstance(document, dict) else _MISS
@@ -0,0 +1,311 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Editable document for editors and language servers. Content is kept as
+top-level tag blocks, each with its own tokens table and AST nodes.
+A text edit re-tokenizes and re-composes only blocks it touches,
+other blocks are moved to their new lines when they are looked up.
+"""
+
+import re
+from bisect import bisect_right
+from itertools import accumulate, compress
+from operator import attrgetter
+from typing import Any, Dict, Final, List, Optional, Pattern
+
+from moon.core.blocks import _tag_line, block_comments, scan_blocks
+from moon.core.composer import ASTComposer
+from moon.core.constructor import construct
+from moon.core.parser import EventParser
+from moon.core.tokenizer import Tokenizer
+from moon.hooks.tags import resolve_tag
+from moon.schemas import ArgumentsError, ASTNode, TokenTable
+from moon.schemas.errors import _MOONError
+
+# Line of position in error message, as tokens and indentation errors write it
+_message_line: Final[Pattern[str]] = re.compile(
+    r"(?<=' at line )\d+(?= column \d+>)|(?<=^Indentation error at )\d+(?=:\d)"
+)
+
+
+def _starts_block(text: str) -> bool:
+    match = _tag_line.match(text)
+    return match is not None and resolve_tag(match.group(1)) is not None
+
+
+def _shift_lines(message: str, lines: int) -> str:
+    """Move lines of positions in error message."""
+    return _message_line.sub(lambda match: str(int(match.group()) + lines), message)
+
+
+def _opens_comment(text: str) -> bool:
+    """Text has block comment without end, which hides tag lines after it."""
+    return any(match.group("open") is not None for match in block_comments(text))
+
+
+class _Part:
+    """Top-level block, or content before the first block, with its parse results."""
+
+    __slots__ = ("text", "lines", "first_line", "tokens", "nodes", "error")
+
+    def __init__(self, text: str, first_line: int) -> None:
+        self.text = text
+        # Number of lines breaks in text
+        self.lines = text.count("\n")
+        # Line of document the part starts at, as of its last move
+        self.first_line = first_line
+        self.tokens: Optional[TokenTable] = None
+        self.nodes: List[ASTNode] = []
+        self.error: Optional[_MOONError] = None
+        self._parse()
+
+    def _parse(self) -> None:
+        stripped = self.text.lstrip()
+        if not stripped:
+            return
+        # Tokenizer strips leading whitespace, its lines are counted after it
+        skipped = self.text.count("\n", 0, len(self.text) - len(stripped))
+        try:
+            self.tokens = Tokenizer(self.text, self.first_line + skipped).tabulate()
+            self.nodes = list(ASTComposer(EventParser(self.tokens)))
+        except _MOONError as e:
+            self.nodes = []
+            self.error = e
+
+    def move(self, first_line: int) -> None:
+        """Move parse results to lines starting at `first_line`."""
+        lines = first_line - self.first_line
+        if not lines:
+            return
+        self.first_line = first_line
+        if self.tokens is not None:
+            # Tokens of the table and errors holding them resolve lines by it
+            self.tokens.lines.first_line += lines
+        if self.error is not None:
+            self.error.args = tuple(
+                _shift_lines(arg, lines) if isinstance(arg, str) else arg
+                for arg in self.error.args
+            )
+
+
+_part_lines = attrgetter("lines")
+
+
+class Document:
+    """
+    Parsed MOON document which is updated by text edits.
+    Text is kept as given, so offsets of edits are offsets of editor buffer,
+    it is normalized only when blocks are tokenized.
+    Offsets and lines of blocks after an edit are updated lazily,
+    when they are looked up, so an edit costs only blocks it touches.
+    Errors of blocks do not stop parsing of others, they are kept in `errors`
+    until blocks are fixed by next edits.
+    """
+
+    def __init__(self, content: str = "") -> None:
+        if not isinstance(content, str):
+            raise ArgumentsError(f"'content' must be str, got {content!r}")
+        self._parts: List[_Part] = []
+        # Offsets and first lines of parts in text, known for the first parts only
+        self._starts: List[int] = []
+        self._lines: List[int] = []
+        self._known_starts = 0
+        self._known_lines = 0
+        self._size = 0
+        # Top-level nodes of all parts, built on access after an edit
+        self._nodes: Optional[List[ASTNode]] = None
+        # Number of parts tokenized by the last edit
+        self.parsed = 0
+        self._build(content)
+
+    @property
+    def text(self) -> str:
+        return "".join(part.text for part in self._parts)
+
+    @property
+    def nodes(self) -> List[ASTNode]:
+        """Top-level AST nodes in order of text, list is built once after an edit."""
+        if self._nodes is None:
+            self._nodes = [node for part in self._parts for node in part.nodes]
+        return self._nodes
+
+    @property
+    def tokens(self) -> List[TokenTable]:
+        """Tokens tables of top-level blocks."""
+        return [part.tokens for part in self._moved("tokens")]
+
+    @property
+    def errors(self) -> List[_MOONError]:
+        """Errors of blocks in order of text."""
+        return [part.error for part in self._moved("error")]
+
+    def to_python(self) -> Dict[str, Any]:
+        """
+        Construct Python dict of document.
+        :return: Python dict.
+        """
+        for error in self.errors:
+            raise error
+        return construct(self.nodes)
+
+    def apply_edit(self, start: int, end: int, replacement: str) -> List[ASTNode]:
+        """
+        Replace text between offsets by `replacement` and reparse changed blocks.
+        :param start: offset of the first replaced char.
+        :param end: offset after the last replaced char.
+        :param replacement: new text.
+        :return: top-level AST nodes of reparsed blocks, other nodes are the same.
+        """
+        if not (
+            isinstance(start, int)
+            and isinstance(end, int)
+            and 0 <= start <= end <= self._size
+        ):
+            raise ArgumentsError(
+                f"Edit range must be within 0 and {self._size}, got {start}, {end}"
+            )
+        if not isinstance(replacement, str):
+            raise ArgumentsError(f"'replacement' must be str, got {replacement!r}")
+        if not self._parts:
+            self._build(replacement)
+            return self.nodes
+
+        # Parts touched by the edit, the first one and the one after the last
+        first = self._index(start)
+        stop = self._index(end - 1 if end > start else start) + 1
+        while True:
+            region_start = self._start(first)
+            old = self._region(first, stop)
+            new = old[: start - region_start] + replacement + old[end - region_start :]
+            # Region must start with a tag line, or text before it joins previous block
+            if first > 0 and not _starts_block(new):
+                first -= 1
+            # Next block tag line must stay at a line start
+            elif stop < len(self._parts) and new and not new.endswith("\n"):
+                stop += 1
+            # Comment without end joins all next blocks
+            elif stop < len(self._parts) and _opens_comment(new):
+                stop = len(self._parts)
+            else:
+                break
+
+        parts = self._split(new, self._line(first))
+        delta = len(new) - len(old)
+        lines = new.count("\n") - old.count("\n")
+        self._replace(first, stop, parts, region_start, delta, lines)
+        self._size += delta
+        return [node for part in parts for node in part.nodes]
+
+    def _build(self, text: str) -> None:
+        self._parts, self._starts, self._lines = [], [], []
+        self._known_starts = self._known_lines = 0
+        self._size = len(text)
+        self._replace(0, 0, self._split(text, 1), 0, len(text), text.count("\n"))
+
+    def _replace(
+        self,
+        first: int,
+        stop: int,
+        parts: List[_Part],
+        offset: int,
+        delta: int,
+        lines: int,
+    ) -> None:
+        """
+        Replace parts between indexes by parts starting at text offset,
+        which change size of text by `delta` and its lines by `lines`.
+        Offsets and lines of next parts are found again when looked up.
+        """
+        starts: List[int] = []
+        for part in parts:
+            starts.append(offset)
+            offset += len(part.text)
+        self._parts[first:stop] = parts
+        self._starts[first:stop] = starts
+        self._lines[first:stop] = [part.first_line for part in parts]
+        # Known values after replaced parts stay valid when text moves by nothing
+        moved = len(parts) - (stop - first)
+        if delta or self._known_starts < stop:
+            self._known_starts = first + len(parts)
+        else:
+            self._known_starts += moved
+        if lines or self._known_lines < stop:
+            self._known_lines = first + len(parts)
+        else:
+            self._known_lines += moved
+        self._nodes = None
+        self.parsed = len(parts)
+
+    def _start(self, index: int) -> int:
+        starts = self._starts
+        while self._known_starts <= index:
+            known = self._known_starts
+            if known:
+                starts[known] = starts[known - 1] + len(self._parts[known - 1].text)
+            else:
+                starts[known] = 0
+            self._known_starts += 1
+        return starts[index]
+
+    def _line(self, index: int) -> int:
+        lines = self._lines
+        while self._known_lines <= index:
+            known = self._known_lines
+            if known:
+                lines[known] = lines[known - 1] + self._parts[known - 1].lines
+            else:
+                lines[known] = 1
+            self._known_lines += 1
+        return lines[index]
+
+    def _index(self, offset: int) -> int:
+        """Index of part holding offset, the last part for offset of text end."""
+        # Offsets are found up to the first part after offset
+        while self._known_starts < len(self._parts):
+            if self._start(self._known_starts) > offset:
+                break
+        return max(bisect_right(self._starts, offset, 0, self._known_starts) - 1, 0)
+
+    def _moved(self, result: str) -> List[_Part]:
+        """Parts having parse `result`, moved to their lines in document."""
+        self._know_lines()
+        # Errors and tokens tables, which hold eof token at least, are true
+        results = map(attrgetter(result), self._parts)
+        res: List[_Part] = []
+        for part, line in compress(zip(self._parts, self._lines), results):
+            part.move(line)
+            res.append(part)
+        return res
+
+    def _know_lines(self) -> None:
+        """Find first lines of all parts at once."""
+        known = self._known_lines
+        parts = self._parts
+        if known == len(parts):
+            return
+        line = self._lines[known - 1] + parts[known - 1].lines if known else 1
+        self._lines[known:] = accumulate(
+            map(_part_lines, parts[known:-1]), initial=line
+        )
+        self._known_lines = len(parts)
+
+    def _region(self, first: int, stop: int) -> str:
+        return "".join(part.text for part in self._parts[first:stop])
+
+    @staticmethod
+    def _split(text: str, first_line: int) -> List[_Part]:
+        """Split text starting at a line start into parsed parts."""
+        if not text:
+            return []
+        bounds = [block.start for block in scan_blocks(text)]
+        if not bounds or bounds[0] != 0:
+            bounds.insert(0, 0)
+        bounds.append(len(text))
+        parts: List[_Part] = []
+        for start, end in zip(bounds, bounds[1:]):
+            part = _Part(text[start:end], first_line)
+            first_line += part.lines
+            parts.append(part)
+        return parts
+
+    def __repr__(self) -> str:
+        return f"<Document blocks: {len(self._parts)} errors: {len(self.errors)}>"
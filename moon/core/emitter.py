@@ -5,34 +5,37 @@ Final dump stage. Turns events into text.
 
 from typing import Iterator
 
-from moon.core.base import StatefulStreamer
+from moon.core.base import END, LookaheadStreamer
 from moon.hooks.tags import resolve_tag
 from moon.schemas import EmitterError, Event, EventType
 
 
-class EventEmitter(StatefulStreamer[Event, str]):
+class EventEmitter(LookaheadStreamer[Event, str]):
+    """
+    Stateful emitter. Turns stream of events into stream of small text chunks
+    by tag hooks `emit_chunks`, so that tags text is never built at once.
+    """
+
     def __iter__(self) -> Iterator[str]:
-        while True:
-            try:
-                event = self.read()
-                if event.type == EventType.document_end:
-                    break
-                if event.type == EventType.tag_start:
-                    hook = resolve_tag(event.value)
-                    yield hook.emit(self)
-                    peaked = self.peek()
-                    if peaked is None:
-                        raise EmitterError("Unexpected end of stream.")
-                    else:
-                        if peaked.type == EventType.tag_start:
-                            yield "\n"
-                        elif peaked.type == EventType.document_end:
-                            break
-                        else:
-                            raise EmitterError(f"Unknown event type: {peaked.type}")
+        event = self.read()
+        while event is not END:
+            if event.type == EventType.document_end:
+                return
+            if event.type == EventType.tag_start:
+                hook = resolve_tag(event.value)
+                yield from hook.emit_chunks(self)
+                peeked = self.peek()
+                if peeked is END:
+                    raise EmitterError("Unexpected end of stream.")
+                elif peeked.type == EventType.tag_start:
+                    yield "\n"
+                elif peeked.type == EventType.document_end:
+                    return
                 else:
-                    raise EmitterError(f"Unknown event type: {self.read().type}")
+                    raise EmitterError(f"Unknown event type: {peeked.type}")
+            else:
+                raise EmitterError(f"Unknown event type: {event.type}")
+
+            event = self.next()
 
-                self.next()
-            except StopIteration:
-                raise EmitterError("Unexpected end of stream")
+        raise EmitterError("Unexpected end of stream")
@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Fused fast path of loading for documents written only with @object tags.
+Reads content line by line, measures indentation, splits pairs on the first colon
+and builds nested dicts directly, without tokens, events and AST.
+Anything except plain @object syntax falls back to the general hooks pipeline.
+"""
+
+import re
+from typing import Any, Dict, Final, List, Optional, Pattern
+
+from moon.core.intern import InternTable
+from moon.core.tokenizer import _normalize
+from moon.hooks.tags import resolve_tag
+from moon.hooks.tags.object import ObjectHook
+from moon.hooks.types import resolve_type
+
+_pair: Final[Pattern[str]] = re.compile(r"( *)([^ ,:'\"]+) *:(.*)")
+_header: Final[Pattern[str]] = re.compile(r" +(?!//)([^ ,:'\"]+) *(?://.*)?")
+_word: Final[Pattern[str]] = re.compile(r"[^ ,:'\"]+")
+# Comment starts only at the beginning of a lexeme
+_comment: Final[Pattern[str]] = re.compile(r"(?<![^ ,:'\"])//")
+
+
+class _Fallback(Exception):
+    """
+    Raised when content cannot be loaded by fast path.
+    """
+
+
+def fast_construct(
+    content: str, strings: Optional[InternTable] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Builds Python dict from MOON content containing only @object tags.
+    :param content: MOON content.
+    :param strings: table of shared keys and values.
+    :return: Python dict or None if content must be loaded by general pipeline.
+    """
+
+    try:
+        return _construct(_normalize(content), strings)
+    except _Fallback:
+        return None
+
+
+def _construct(content: str, strings: Optional[InternTable]) -> Dict[str, Any]:
+    if "/*" in content:
+        raise _Fallback()
+    resolve = resolve_type
+    if strings is not None and strings.max_value_length:
+        resolve = strings.resolve
+
+    res: Dict[str, Any] = {}
+    # Open dicts and their indentation levels, first is the tag object
+    objects: List[Dict[str, Any]] = []
+    indents: List[int] = []
+    # Last pair waits for the next line to know whether it is nested object
+    last: Optional[Dict[str, Any]] = None
+    last_key = ""
+
+    for line in content.split("\n"):
+        pair = _pair.match(line)
+        if pair is None:
+            stripped = line.lstrip(" ")
+            if not stripped or stripped.startswith("//"):
+                continue
+
+            word = _word.match(stripped)
+            if word is None or resolve_tag(word.group()) is not ObjectHook:
+                raise _Fallback()
+            header = _header.fullmatch(stripped, word.end())
+            if header is None or header.group(1) in res:
+                raise _Fallback()
+
+            if last is not None:
+                last[last_key] = resolve(last[last_key])
+                last = None
+            obj: Dict[str, Any] = {}
+            res[header.group(1)] = obj
+            objects = [obj]
+            indents = []
+            continue
+
+        key = pair.group(2)
+        if key.startswith("//"):
+            continue
+        if strings is not None:
+            key = strings.key(key)
+        if not objects or (key[0] == "@" and resolve_tag(key)):
+            raise _Fallback()
+
+        indent = len(pair.group(1))
+        if not indents:
+            indents.append(indent)
+
+        if indent > indents[-1]:
+            # Previous pair value is nested object
+            if last is None:
+                raise _Fallback()
+            nested: Dict[str, Any] = {}
+            last[last_key] = nested
+            objects.append(nested)
+            indents.append(indent)
+        else:
+            if last is not None:
+                last[last_key] = resolve(last[last_key])
+            if indent < indents[-1]:
+                if indent not in indents:
+                    raise _Fallback()
+                level = indents.index(indent) + 1
+                del indents[level:]
+                del objects[level:]
+
+        current = objects[-1]
+        if key in current:
+            raise _Fallback()
+
+        value = pair.group(3)
+        if "//" in value:
+            comment = _comment.search(value)
+            if comment is not None:
+                value = value[: comment.start()]
+        current[key] = value.lstrip(" ")
+        last = current
+        last_key = key
+
+    if last is not None:
+        last[last_key] = resolve(last[last_key])
+
+    return res
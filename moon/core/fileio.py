@@ -3,10 +3,23 @@
 Files IO module. Define read and write methods.
 """
 
-from io import BufferedIOBase, TextIOBase
-from os import PathLike
+from codecs import getincrementaldecoder, lookup
+from contextlib import contextmanager
+from io import BufferedIOBase, TextIOBase, UnsupportedOperation
+from mmap import ACCESS_READ, mmap
+from os import PathLike, fstat
 from pathlib import Path
-from typing import AnyStr, BinaryIO, Iterable, Optional, TextIO, Union
+from typing import (
+    IO,
+    AnyStr,
+    BinaryIO,
+    Final,
+    Iterable,
+    Iterator,
+    Optional,
+    TextIO,
+    Union,
+)
 
 from moon.schemas import ArgumentsError, ReadError, WriteError
 
@@ -19,6 +32,8 @@ FileOrPath = Union[
     BufferedIOBase,
 ]
 
+DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024
+
 
 def read(
     fp: FileOrPath,
@@ -73,30 +88,190 @@ def read(
     return content
 
 
+def read_chunks(
+    fp: FileOrPath,
+    encoding: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Read str content by fixed-size blocks using filepath or file-like object.
+    Bytes are decoded incrementally, so memory is bounded by chunk size.
+
+    :param fp: File path or file-like object.
+    :param encoding: File encoding, defaults to utf-8.
+    :param chunk_size: Size of block read at once.
+    :raises ArgumentsError: If fp is not a path or file-like object.
+    :raises ReadError: If any error occurs.
+    :return: Iterator of content chunks.
+    """
+
+    if chunk_size <= 0:
+        raise ArgumentsError(f"'chunk_size' must be positive. Got {chunk_size}")
+
+    if isinstance(fp, (PathLike, str, bytes)):
+        if isinstance(fp, bytes):
+            fp = fp.decode()
+        if not Path(fp).exists():
+            raise ReadError(f"File {fp!r} does not exist.")
+        if not Path(fp).is_file():
+            raise ReadError(f"File {fp!r} is not a file.")
+        return _read_path_chunks(fp, encoding, chunk_size)
+
+    elif isinstance(fp, (TextIO, BinaryIO, TextIOBase, BufferedIOBase)):
+        return _read_file_chunks(fp, encoding, chunk_size)
+
+    else:
+        raise ArgumentsError(
+            f"'fp' argument must be a file-like or path-like object. Got {type(fp)}"
+        )
+
+
+def _read_path_chunks(
+    fp: Union[str, PathLike[str]],
+    encoding: Optional[str],
+    chunk_size: int,
+) -> Iterator[str]:
+    try:
+        with open(fp, "rb") as f:
+            yield from _decode_chunks(f, encoding, chunk_size)
+    except FileNotFoundError as e:
+        raise ReadError(f"File {fp!r} not found") from e
+    except PermissionError as e:
+        raise ReadError(f"Cannot read {fp!r} because access denied") from e
+    except UnicodeDecodeError as e:
+        raise ReadError(f"Cannot read {fp!r} because encoding error") from e
+    except OSError as e:
+        raise ReadError(f"Cannot read {fp!r} because {e}") from e
+
+
+def _read_file_chunks(
+    fp: IO,
+    encoding: Optional[str],
+    chunk_size: int,
+) -> Iterator[str]:
+    try:
+        yield from _decode_chunks(fp, encoding, chunk_size)
+    except UnicodeDecodeError as e:
+        raise ReadError(f"Cannot read {fp} because encoding error") from e
+    except IOError as e:
+        raise ReadError(f"Cannot read {fp} because {e}") from e
+
+
+def _decode_chunks(f: IO, encoding: Optional[str], chunk_size: int) -> Iterator[str]:
+    decoder = None
+    while True:
+        raw = f.read(chunk_size)
+        if not raw:
+            break
+        if isinstance(raw, bytes):
+            if decoder is None:
+                # Default encoding UTF-8
+                decoder = getincrementaldecoder(encoding or "utf-8")()
+            raw = decoder.decode(raw)
+        if raw:
+            yield raw
+    if decoder is not None:
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+
+@contextmanager
+def map_file(
+    fp: FileOrPath,
+    encoding: Optional[str] = None,
+) -> Iterator[Union[mmap, bytes]]:
+    """
+    Memory-map file read-only. Content is not copied nor decoded,
+    pages are loaded by OS on access and shared between processes.
+    File-like object without file descriptor is read into bytes instead.
+
+    :param fp: File path or binary file-like object.
+    :param encoding: File encoding, only utf-8 compatible encodings allowed.
+    :raises ArgumentsError: If fp is not a path or binary file-like object
+        or encoding is not utf-8 compatible.
+    :raises ReadError: If any error occurs.
+    :return: Context manager of mapped content. Map is closed on exit.
+    """
+
+    if encoding is not None and lookup(encoding).name not in ("utf-8", "ascii"):
+        raise ArgumentsError(f"Cannot map {encoding!r} file. Only utf-8 allowed.")
+
+    if isinstance(fp, (PathLike, str, bytes)):
+        if isinstance(fp, bytes):
+            fp = fp.decode()
+        if not Path(fp).exists():
+            raise ReadError(f"File {fp!r} does not exist.")
+        if not Path(fp).is_file():
+            raise ReadError(f"File {fp!r} is not a file.")
+        try:
+            with open(fp, "rb") as f:
+                mapped = _map(f)
+        except PermissionError as e:
+            raise ReadError(f"Cannot read {fp!r} because access denied") from e
+        except OSError as e:
+            raise ReadError(f"Cannot read {fp!r} because {e}") from e
+
+    elif isinstance(fp, (BinaryIO, BufferedIOBase)):
+        try:
+            mapped = _map(fp)
+        except (UnsupportedOperation, AttributeError):
+            mapped = fp.read()
+        except IOError as e:
+            raise ReadError(f"Cannot read {fp} because {e}") from e
+
+    else:
+        raise ArgumentsError(
+            f"'fp' argument must be a binary file-like or path-like object. "
+            f"Got {type(fp)}"
+        )
+
+    try:
+        yield mapped
+    finally:
+        if isinstance(mapped, mmap):
+            mapped.close()
+
+
+def _map(f: IO) -> Union[mmap, bytes]:
+    fileno = f.fileno()
+    # Empty file cannot be mapped
+    if fstat(fileno).st_size == 0:
+        return b""
+    return mmap(fileno, 0, access=ACCESS_READ)
+
+
 def write(
     content: Union[Iterable[str], str],
     fo: FileOrPath,
     encoding: Optional[str] = None,
+    buffer_size: int = DEFAULT_CHUNK_SIZE,
 ) -> None:
     """
     Write str content using filepath or file-like object.
+    Iterator of small strings is joined into blocks of about `buffer_size` chars,
+    so that file is written by few calls and content is never held at once.
 
     :param content: Text content or iterator of strings.
     :param fo: File object or file-like object.
     :param encoding: File encoding.
+    :param buffer_size: Number of chars collected before writing.
     :raises ArgumentsError: If fo is not a path or file-like object.
     :raises WriteError: If any other error occurs.
     :return: Content string.
     """
 
+    if buffer_size <= 0:
+        raise ArgumentsError(f"'buffer_size' must be positive. Got {buffer_size}")
+
+    if isinstance(content, str):
+        content = (content,)
+
     if isinstance(fo, (str, bytes, PathLike)):
         try:
             with open(fo, "w", encoding=encoding) as f:
-                if isinstance(content, str):
-                    f.write(content)
-                else:
-                    for chunk in content:
-                        f.write(chunk)
+                for block in _buffered(content, buffer_size):
+                    f.write(block)
         except PermissionError as e:
             raise WriteError(f"Cannot write {fo!r} because access denied") from e
         except OSError as e:
@@ -104,21 +279,15 @@ def write(
 
     elif isinstance(fo, (TextIO, TextIOBase)):
         try:
-            if isinstance(content, str):
-                fo.write(content)
-            else:
-                for chunk in content:
-                    fo.write(chunk)
+            for block in _buffered(content, buffer_size):
+                fo.write(block)
         except IOError as e:
             raise WriteError(f"Cannot write {fo} because {e}") from e
 
     elif isinstance(fo, (BinaryIO, BufferedIOBase)):
         try:
-            if isinstance(content, str):
-                fo.write(content.encode("utf-8"))
-            else:
-                for chunk in content:
-                    fo.write(chunk.encode("utf-8"))
+            for block in _buffered(content, buffer_size):
+                fo.write(block.encode("utf-8"))
         except IOError as e:
             raise WriteError(f"Cannot write {fo} because {e}") from e
 
@@ -126,3 +295,21 @@ def write(
         raise ArgumentsError(
             f"'fo' argument must be a file-like or path-like object. Got {type(fo)}"
         )
+
+
+def _buffered(chunks: Iterable[str], buffer_size: int) -> Iterator[str]:
+    """Join small chunks into blocks of at least `buffer_size` chars."""
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        if len(chunk) >= buffer_size and not buffer:
+            yield chunk
+            continue
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size:
+            yield "".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer)
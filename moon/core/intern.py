@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Strings interning. Equal keys, and optionally short string values,
+of loaded objects share one string object of a table.
+"""
+
+from typing import Any, Dict, Union
+
+from moon.hooks.types import resolve_type
+from moon.schemas import ArgumentsError, Span
+
+
+class InternTable:
+    """
+    Table of shared strings, one per load unless passed to several loads.
+    String values not longer than `max_value_length` are shared too,
+    0 keeps values as they are resolved.
+    """
+
+    __slots__ = ("_keys", "_values", "max_value_length")
+
+    def __init__(self, max_value_length: int = 0) -> None:
+        if (
+            not isinstance(max_value_length, int)
+            or isinstance(max_value_length, bool)
+            or max_value_length < 0
+        ):
+            raise ArgumentsError(
+                f"'max_value_length' must be a non-negative int, got {max_value_length}"
+            )
+        self.max_value_length = max_value_length
+        self._keys: Dict[str, str] = {}
+        self._values: Dict[str, str] = {}
+
+    def key(self, key: Union[str, Span]) -> str:
+        """:return: shared string of key."""
+        key = str(key)
+        return self._keys.setdefault(key, key)
+
+    def resolve(self, value: str) -> Any:
+        """:return: resolved type of scalar value, shared if it is a short string."""
+        res = resolve_type(value)
+        if type(res) is str and len(res) <= self.max_value_length:
+            return self._values.setdefault(res, res)
+        return res
+
+    @property
+    def distinct_keys(self) -> int:
+        """Number of distinct keys seen."""
+        return len(self._keys)
+
+    @property
+    def distinct_values(self) -> int:
+        """Number of distinct shared values."""
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return (
+            f"<InternTable keys: {self.distinct_keys} values: {self.distinct_values}>"
+        )
@@ -0,0 +1,96 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Lazy loading. Document is split into top-level tag blocks by a quick scan,
+each block is tokenized, parsed and constructed only on first access.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Set
+
+from moon.core.blocks import Block, load_part, scan_blocks
+from moon.core.tokenizer import _normalize
+from moon.schemas import DuplicateIdentifierNode, ParserError
+
+
+def load_block(content: str, start: int, end: int) -> Dict[str, Any]:
+    """
+    Load a part of normalized content keeping document lines numbers in errors.
+    :param content: normalized MOON content.
+    :param start: offset of the part start, must be a line start.
+    :param end: offset of the part end.
+    :return: Python dict of tags of the part.
+    """
+    first_line = content.count("\n", 0, start) + 1
+    return load_part(content[start:end], first_line)
+
+
+class LazyDocument(Mapping[str, Any]):
+    """
+    Read-only mapping of top-level identifiers to tags values.
+    Value is loaded on the first access and kept, errors of a tag block
+    are raised on access to it. Content before the first tag block
+    and blocks without plain identifier are loaded at once.
+    When `only` is given, other blocks are skipped without tokenizing them.
+    """
+
+    def __init__(self, content: str, only: Optional[Iterable[str]] = None) -> None:
+        self._content = _normalize(content)
+        self._only = None if only is None else frozenset(only)
+        # Blocks in document order, None for already loaded ones
+        self._blocks: Dict[str, Optional[Block]] = {}
+        self._values: Dict[str, Any] = {}
+        # Identifiers of all blocks, including skipped ones
+        names: Set[str] = set()
+
+        blocks = scan_blocks(self._content)
+        head = blocks[0].start if blocks else len(self._content)
+        if self._content[:head].strip():
+            self._add_loaded(load_block(self._content, 0, head), names)
+
+        for block in blocks:
+            if block.name is None:
+                loaded = load_block(self._content, block.start, block.end)
+                self._add_loaded(loaded, names)
+            elif block.name in names:
+                raise DuplicateIdentifierNode(f"Duplicate identifier: {block.name}")
+            else:
+                names.add(block.name)
+                if self._only is None or block.name in self._only:
+                    self._blocks[block.name] = block
+
+    def _add_loaded(self, loaded: Dict[str, Any], names: Set[str]) -> None:
+        for name, value in loaded.items():
+            if name in names:
+                raise DuplicateIdentifierNode(f"Duplicate identifier: {name}")
+            names.add(name)
+            if self._only is None or name in self._only:
+                self._blocks[name] = None
+                self._values[name] = value
+
+    def __getitem__(self, name: str) -> Any:
+        block = self._blocks[name]
+        if block is None:
+            return self._values[name]
+
+        loaded = load_block(self._content, block.start, block.end)
+        if name not in loaded:
+            raise ParserError(f"Tag {block.tag} {name} cannot be loaded separately")
+        self._values[name] = loaded[name]
+        self._blocks[name] = None
+        return loaded[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._blocks
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._blocks)
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    @property
+    def loaded(self) -> int:
+        """Number of loaded tags."""
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"<LazyDocument tags: {len(self)} loaded: {self.loaded}>"
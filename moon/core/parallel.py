@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Parallel loading. Top-level tags are independent, so document is split
+at tag blocks boundaries into parts, which are loaded by a pool of processes
+and merged in document order.
+Workers see hooks registered on import of modules, with "spawn" start method
+custom hooks must be registered by modules importable in workers.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Final, List, Tuple
+
+from moon.core.blocks import Block, load_part, scan_blocks
+from moon.core.tokenizer import _normalize
+from moon.schemas import DuplicateIdentifierNode
+
+# Parts per worker, smaller parts balance blocks of uneven size
+PARTS_PER_WORKER: Final[int] = 4
+
+
+def split_parts(content: str, blocks: List[Block], count: int) -> List[Tuple[int, int]]:
+    """
+    Split content into up to `count` contiguous parts of similar size.
+    Parts start at blocks starts, the first one covers content before blocks.
+    :return: parts start and end offsets.
+    """
+    size = len(content) / count
+    bounds = [0]
+    for block in blocks[1:]:
+        if block.start - bounds[-1] >= size:
+            bounds.append(block.start)
+    bounds.append(len(content))
+    return list(zip(bounds, bounds[1:]))
+
+
+def load_parallel(content: str, workers: int) -> Dict[str, Any]:
+    """
+    Load MOON content by a pool of worker processes.
+    :param content: MOON content.
+    :param workers: number of processes.
+    :return: Python dict.
+    """
+    content = _normalize(content)
+    parts = split_parts(content, scan_blocks(content), workers * PARTS_PER_WORKER)
+    if workers == 1 or len(parts) == 1:
+        return load_part(content)
+
+    texts = []
+    first_lines = []
+    line = 1
+    previous = 0
+    for start, end in parts:
+        line += content.count("\n", previous, start)
+        previous = start
+        texts.append(content[start:end])
+        first_lines.append(line)
+
+    res: Dict[str, Any] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for loaded in executor.map(load_part, texts, first_lines):
+            for name, value in loaded.items():
+                if name in res:
+                    raise DuplicateIdentifierNode(f"Duplicate identifier: {name}")
+                res[name] = value
+
+    return res
@@ -3,40 +3,62 @@
 Events parsing stage. Events are logical parts of MOON file between tokens and AST.
 """
 
-from typing import Iterator
+from typing import Final, FrozenSet, Iterable, Iterator, Optional, Union
 
-from moon.core.base import StatefulStreamer
+from moon.core.base import END, LookaheadStreamer
 from moon.hooks.tags import resolve_tag
 from moon.schemas import Event, EventType, ParserError, UnexpectedEOF, UnexpectedToken
-from moon.schemas.tokens import Token, TokenType
+from moon.schemas.tokens import Buffer, Token, TokenTable, TokenType, _token_codes
 
+_skipped: Final[FrozenSet[TokenType]] = frozenset(
+    [TokenType.indent, TokenType.whitespace, TokenType.newline, TokenType.comment]
+)
+_skipped_codes: Final[FrozenSet[int]] = frozenset(_token_codes[t] for t in _skipped)
+_word: Final[int] = _token_codes[TokenType.word]
+_eof: Final[int] = _token_codes[TokenType.eof]
 
-class EventParser(StatefulStreamer[Token, Event]):
+
+class EventParser(LookaheadStreamer[Token, Event]):
     """
     Stateful event parser. Turns a stream of tokens into a stream of events.
+    Source of tokens is available to hooks as `source` and `offset`,
+    `source` is None when tokens do not come from whole content.
+    Table of tokens is walked by indexes with hooks `parse_table`,
+    so that no token objects are created.
     """
 
+    def __init__(self, stream: Iterable[Token]) -> None:
+        super().__init__(stream)
+        self._tokens = stream
+
+    @property
+    def source(self) -> Optional[Union[str, Buffer]]:
+        return getattr(self._tokens, "source", None)
+
+    @property
+    def offset(self) -> int:
+        """Index of the first char of normalized content in source."""
+        return getattr(self._tokens, "offset", 0)
+
     def __iter__(self) -> Iterator[Event]:
-        while True:
-            try:
+        if isinstance(self._tokens, TokenTable):
+            yield from self._parse_table(self._tokens)
+            return
+
+        token = self.read()
+        while token is not END:
+            if token.type == TokenType.word:
+                yield from self._parse_tag()
                 token = self.read()
-                if token.type in [
-                    TokenType.space,
-                    TokenType.newline,
-                    TokenType.comment,
-                ]:
-                    pass
-                elif token.type == TokenType.eof:
-                    yield Event(type=EventType.document_end)
-                    return
-                elif token.type == TokenType.word:
-                    yield from self._parse_tag()
-                    continue
-                else:
-                    raise UnexpectedToken(token)
-                self.next()
-            except StopIteration:
-                raise UnexpectedEOF("Unexpected EOF")
+                continue
+            elif token.type == TokenType.eof:
+                yield Event(type=EventType.document_end)
+                return
+            elif token.type not in _skipped:
+                raise UnexpectedToken(token)
+            token = self.next()
+
+        raise UnexpectedEOF("Unexpected EOF")
 
     def _parse_tag(self) -> Iterator[Event]:
         """Parse tag struct from tokens using resolved tag hook."""
@@ -49,3 +71,29 @@ class EventParser(StatefulStreamer[Token, Event]):
             raise ParserError(f"Unknown tag: {tag}")
         yield from hook.parse(self)
         yield Event(type=EventType.tag_end, value=tag.value)
+
+    @staticmethod
+    def _parse_table(table: TokenTable) -> Iterator[Event]:
+        """Parse tags of table of tokens by indexes."""
+        types = table.types
+        index = 0
+        while index < len(types):
+            code = types[index]
+            if code == _word:
+                tag = table.value_at(index)
+                yield Event(type=EventType.tag_start, value=tag)
+
+                hook = resolve_tag(tag)
+                if hook is None:
+                    raise ParserError(f"Unknown tag: {table[index]}")
+                index = yield from hook.parse_table(table, index + 1)
+                yield Event(type=EventType.tag_end, value=tag)
+                continue
+            elif code == _eof:
+                yield Event(type=EventType.document_end)
+                return
+            elif code not in _skipped_codes:
+                raise UnexpectedToken(table[index])
+            index += 1
+
+        raise UnexpectedEOF("Unexpected EOF")
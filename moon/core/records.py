@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Objects factories. Loaded objects can be replaced by results of hooks,
+as `object_hook` and `object_pairs_hook` of json do, or by records
+of a class per distinct keys tuple, which take far less memory than dicts.
+"""
+
+import keyword
+from collections import namedtuple
+from dataclasses import make_dataclass
+from typing import Any, Callable, Dict, Final, FrozenSet, List, Optional, Tuple
+
+from moon.schemas import ArgumentsError
+
+ObjectHook = Callable[[Dict[str, Any]], Any]
+ObjectPairsHook = Callable[[List[Tuple[str, Any]]], Any]
+# Makes object of a built dict
+ObjectFactory = Callable[[Dict[str, Any]], Any]
+
+RECORD_KINDS: Final[Tuple[str, ...]] = ("slots", "namedtuple")
+_MISS: Final = object()
+# Attributes of records classes which fields must not shadow
+_RESERVED: Final[Dict[str, FrozenSet[str]]] = {
+    "slots": frozenset(dir(object)),
+    "namedtuple": frozenset(dir(tuple)) | frozenset(dir(namedtuple("Record", ""))),
+}
+
+
+def _field_name(key: str, reserved: FrozenSet[str]) -> bool:
+    return (
+        key.isidentifier()
+        and not keyword.iskeyword(key)
+        and not (key.startswith("__") and key.endswith("__"))
+        and key not in reserved
+    )
+
+
+class RecordFactory:
+    """
+    Objects pairs hook creating a record per object.
+    Records of the same keys tuple share one class, created on the first
+    such object: a slots dataclass or a namedtuple, depending on `kind`.
+    Objects with keys which are not valid field names, dunder names or
+    names of class attributes, stay dicts.
+    """
+
+    def __init__(self, kind: str = "slots") -> None:
+        if kind not in RECORD_KINDS:
+            raise ArgumentsError(
+                f"'kind' must be one of {', '.join(RECORD_KINDS)}, got {kind!r}"
+            )
+        self.kind = kind
+        # Keys tuple to record class, None for keys not fitting a class
+        self._classes: Dict[Tuple[str, ...], Optional[type]] = {}
+
+    def __call__(self, pairs: List[Tuple[str, Any]]) -> Any:
+        keys = tuple(key for key, _ in pairs)
+        cls = self._classes.get(keys, _MISS)
+        if cls is _MISS:
+            cls = self._classes[keys] = self._make_class(keys)
+        if cls is None:
+            return dict(pairs)
+        return cls(*[value for _, value in pairs])
+
+    @property
+    def classes(self) -> int:
+        """Number of created record classes."""
+        return sum(cls is not None for cls in self._classes.values())
+
+    def _make_class(self, keys: Tuple[str, ...]) -> Optional[type]:
+        reserved = _RESERVED[self.kind]
+        if not all(_field_name(key, reserved) for key in keys):
+            return None
+        if self.kind == "namedtuple":
+            if any(key.startswith("_") for key in keys):
+                return None
+            return namedtuple("Record", keys)
+        return make_dataclass("Record", keys, slots=True)
+
+
+def object_factory(
+    object_hook: Optional[ObjectHook] = None,
+    object_pairs_hook: Optional[ObjectPairsHook] = None,
+) -> Optional[ObjectFactory]:
+    """
+    Function making an object of a built dict by hooks.
+    :param object_hook: called with dict of object.
+    :param object_pairs_hook: called with list of key value pairs of object,
+        takes priority over `object_hook`.
+    :return: object factory, None without hooks.
+    """
+    if object_pairs_hook is not None:
+        return lambda obj: object_pairs_hook(list(obj.items()))
+    return object_hook
+
+
+def make_objects(value: Any, make: ObjectFactory) -> Any:
+    """
+    Replace built dict and its nested dicts by objects of `make`, nested ones first.
+    :param value: built value.
+    :param make: object factory.
+    :return: value with objects.
+    """
+    if not isinstance(value, dict):
+        return value
+    return make({key: make_objects(item, make) for key, item in value.items()})
+
+
+def convert_objects(
+    document: Dict[str, Any],
+    object_hook: Optional[ObjectHook] = None,
+    object_pairs_hook: Optional[ObjectPairsHook] = None,
+) -> Dict[str, Any]:
+    """
+    Replace objects of top-level tags values by hooks results, nested objects first.
+    For loaded documents which objects cannot be made by hooks while built.
+    :param document: loaded document.
+    :param object_hook: called with dict of each object.
+    :param object_pairs_hook: called with list of key value pairs of each object,
+        takes priority over `object_hook`.
+    :return: dict of top-level identifiers to converted values.
+    """
+
+    make = object_factory(object_hook, object_pairs_hook)
+    if make is None:
+        return document
+    return {name: make_objects(value, make) for name, value in document.items()}
@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Incremental reloading. Document is split into top-level tag blocks,
+values of blocks with the same text as on previous load are reused,
+only changed blocks are tokenized, parsed and constructed again.
+"""
+
+import hashlib
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional
+
+from moon.core.blocks import scan_blocks
+from moon.core.fileio import FileOrPath, read
+from moon.core.lazy import load_block
+from moon.core.tokenizer import _normalize
+from moon.schemas import DuplicateIdentifierNode
+
+
+class Changes(NamedTuple):
+    """Top-level identifiers changed by reload."""
+
+    added: FrozenSet[str]
+    changed: FrozenSet[str]
+    removed: FrozenSet[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+Subscriber = Callable[[Changes, Dict[str, Any]], None]
+
+
+class Reloader:
+    """
+    Loads file and reloads it, parsing only top-level blocks which text changed.
+    Subscribers are called with changes and new document after each reload
+    which changed any top-level value.
+    """
+
+    def __init__(self, fp: FileOrPath, *, encoding: Optional[str] = None) -> None:
+        self.fp = fp
+        self.encoding = encoding
+        self.document: Dict[str, Any] = {}
+        # Number of blocks parsed by the last load
+        self.parsed = 0
+        self._source: Optional[str] = None
+        # Hashes of blocks texts to their loaded tags
+        self._blocks: Dict[bytes, Dict[str, Any]] = {}
+        self._subscribers: List[Subscriber] = []
+        self.reload()
+
+    def subscribe(self, subscriber: Subscriber) -> None:
+        """Call `subscriber` with changes and document after each change."""
+        self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self._subscribers.remove(subscriber)
+
+    def reload(self, content: Optional[str] = None) -> Changes:
+        """
+        Reload file, or given content, reusing values of unchanged blocks.
+        On errors previous document is kept.
+        :param content: MOON content to load instead of reading file.
+        :return: changed top-level identifiers.
+        """
+        if content is None:
+            content = read(fp=self.fp, encoding=self.encoding)
+        source = _normalize(content)
+        if source == self._source:
+            self.parsed = 0
+            return Changes(frozenset(), frozenset(), frozenset())
+
+        blocks = scan_blocks(source)
+        bounds = [block.start for block in blocks]
+        if not blocks or source[: blocks[0].start].strip():
+            bounds.insert(0, 0)
+        bounds.append(len(source))
+
+        loaded: Dict[bytes, Dict[str, Any]] = {}
+        document: Dict[str, Any] = {}
+        parsed = 0
+        for start, end in zip(bounds, bounds[1:]):
+            digest = hashlib.blake2b(
+                source[start:end].encode(), digest_size=16
+            ).digest()
+            tags = self._blocks.get(digest)
+            if tags is None:
+                tags = load_block(source, start, end)
+                parsed += 1
+            loaded[digest] = tags
+            for name, value in tags.items():
+                if name in document:
+                    raise DuplicateIdentifierNode(f"Duplicate identifier: {name}")
+                document[name] = value
+
+        previous = self.document
+        changes = Changes(
+            added=frozenset(document.keys() - previous.keys()),
+            changed=frozenset(
+                name
+                for name, value in document.items()
+                if name in previous
+                and previous[name] is not value
+                and previous[name] != value
+            ),
+            removed=frozenset(previous.keys() - document.keys()),
+        )
+        self.document = document
+        self.parsed = parsed
+        self._source = source
+        self._blocks = loaded
+
+        if changes:
+            for subscriber in list(self._subscribers):
+                subscriber(changes, document)
+        return changes
+
+    def __repr__(self) -> str:
+        return f"<Reloader {self.fp!r} tags: {len(self.document)}>"
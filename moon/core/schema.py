@@ -0,0 +1,313 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Schema loading. Shape of document is described by a dataclass, TypedDict
+or a dict of keys to types, and compiled once into a loader, which converts
+each scalar by its declared type instead of generic type resolving.
+
+@object server       @dataclass
+  host: localhost    class Server:       class Config:
+  port: 8080             host: str           server: Server
+                         port: int
+"""
+
+import dataclasses
+import types
+from collections.abc import Mapping
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Hashable,
+    Iterable,
+    Set,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+    is_typeddict,
+)
+
+from moon.core.constructor import RawEventConstructor
+from moon.hooks.types import resolve_type
+from moon.schemas import DuplicateIdentifierNode, Event, SchemaError
+
+Schema = Union[type, Dict[str, Any]]
+Converter = Callable[[Any], Any]
+# Document loader, takes pairs of top-level identifiers and raw values
+Loader = Callable[[Iterable[Tuple[str, Any]]], Any]
+
+_bool_kw: Final[Dict[str, bool]] = {"true": True, "false": False}
+
+# Compiled loaders by schema key
+_loaders: Dict[Hashable, Loader] = {}
+
+
+def compile_schema(schema: Schema) -> Loader:
+    """
+    Compile schema into document loader, compiled loaders are cached.
+    :param schema: dataclass, TypedDict or dict of top-level identifiers
+        to types or nested dicts.
+    :return: loader of pairs of top-level identifiers and raw values.
+    """
+    key = _schema_key(schema)
+    loader = _loaders.get(key)
+    if loader is None:
+        record = _compile_record(schema, "", set())
+        loader = _loaders[key] = _document_loader(record)
+    return loader
+
+
+def construct_schema(events: Iterable[Event], schema: Schema) -> Any:
+    """
+    Builds schema object from MOON events.
+    :param events: MOON events.
+    :param schema: document schema, see `compile_schema`.
+    :return: dataclass instance or dict of schema.
+    """
+    return compile_schema(schema)(RawEventConstructor(events))
+
+
+def _schema_key(schema: Any) -> Hashable:
+    """Hashable key of schema, dicts are keyed by their items."""
+    if isinstance(schema, Mapping):
+        return (dict, tuple((k, _schema_key(v)) for k, v in schema.items()))
+    try:
+        hash(schema)
+    except TypeError:
+        raise SchemaError(f"Unsupported schema: {schema!r}") from None
+    return schema
+
+
+class _Record:
+    """Compiled object schema: converters of keys and factory of result."""
+
+    __slots__ = ("path", "fields", "required", "factory")
+
+    def __init__(
+        self,
+        path: str,
+        fields: Dict[str, Converter],
+        required: Set[str],
+        factory: Callable[..., Any],
+    ) -> None:
+        self.path = path
+        self.fields = fields
+        self.required = required
+        self.factory = factory
+
+    def __call__(self, value: Any) -> Any:
+        if not isinstance(value, dict):
+            raise SchemaError(f"{self.path or 'document'}: expected object")
+        fields = self.fields
+        try:
+            res = {key: fields[key](item) for key, item in value.items()}
+        except KeyError:
+            unknown = next((key for key in value if key not in fields), None)
+            if unknown is None:
+                raise
+            raise SchemaError(f"{self._key_path(unknown)}: unknown key") from None
+        self._check_required(res)
+        return self.factory(**res)
+
+    def _key_path(self, key: str) -> str:
+        return f"{self.path}.{key}" if self.path else key
+
+    def _check_required(self, res: Dict[str, Any]) -> None:
+        if not self.required.issubset(res):
+            missing = next(key for key in self.required if key not in res)
+            raise SchemaError(f"{self._key_path(missing)}: missing key")
+
+
+def _document_loader(record: _Record) -> Loader:
+    """Loader converting each top-level tag as soon as it is built."""
+
+    def load(pairs: Iterable[Tuple[str, Any]]) -> Any:
+        fields = record.fields
+        res = {}
+        for name, value in pairs:
+            convert = fields.get(name)
+            if convert is None:
+                raise SchemaError(f"{name}: unknown identifier")
+            if name in res:
+                raise DuplicateIdentifierNode(f"Duplicate identifier: {name}")
+            res[name] = convert(value)
+        record._check_required(res)
+        return record.factory(**res)
+
+    return load
+
+
+def _compile_record(schema: Any, path: str, compiling: Set[int]) -> _Record:
+    """Compile dataclass, TypedDict or dict description of an object."""
+    if id(schema) in compiling:
+        raise SchemaError(f"{path}: recursive schema is not supported")
+    compiling.add(id(schema))
+
+    if isinstance(schema, Mapping):
+        hints = dict(schema)
+        required = {k for k, v in hints.items() if not _is_optional(v)}
+        factory = dict
+    elif isinstance(schema, type) and dataclasses.is_dataclass(schema):
+        hints = get_type_hints(schema)
+        fields = [f for f in dataclasses.fields(schema) if f.init]
+        hints = {f.name: hints[f.name] for f in fields}
+        required = {
+            f.name
+            for f in fields
+            if f.default is dataclasses.MISSING
+            and f.default_factory is dataclasses.MISSING
+        }
+        factory = schema
+    elif is_typeddict(schema):
+        hints = get_type_hints(schema)
+        required = set(schema.__required_keys__)
+        factory = dict
+    else:
+        raise SchemaError(f"{path or 'document'}: unsupported schema {schema!r}")
+
+    converters = {
+        key: _compile(tp, f"{path}.{key}" if path else key, compiling)
+        for key, tp in hints.items()
+    }
+    compiling.discard(id(schema))
+    return _Record(path, converters, required, factory)
+
+
+def _is_union(tp: Any) -> bool:
+    origin = get_origin(tp)
+    return origin is Union or origin is types.UnionType
+
+
+def _is_optional(tp: Any) -> bool:
+    return _is_union(tp) and type(None) in get_args(tp)
+
+
+def _compile(tp: Any, path: str, compiling: Set[int]) -> Converter:
+    """Compile converter of a value of declared type."""
+    if (
+        isinstance(tp, Mapping)
+        or isinstance(tp, type)
+        and dataclasses.is_dataclass(tp)
+        or is_typeddict(tp)
+    ):
+        return _compile_record(tp, path, compiling)
+    if tp is Any or tp is object:
+        return _resolve_any
+    if tp in _scalars:
+        return _scalars[tp](path)
+    if tp is dict:
+        return _compile_dict(_resolve_any, path)
+
+    if _is_union(tp):
+        # null is checked first, as str accepts it too
+        args = sorted(get_args(tp), key=lambda arg: arg is not type(None))
+        return _compile_union([_compile(arg, path, compiling) for arg in args], path)
+    origin = get_origin(tp)
+    if origin is dict or origin is Mapping:
+        args = get_args(tp)
+        if args and args[0] is not str:
+            raise SchemaError(f"{path}: keys must be str, got {args[0]!r}")
+        convert = _compile(args[1], f"{path}.*", compiling) if args else _resolve_any
+        return _compile_dict(convert, path)
+
+    raise SchemaError(f"{path}: unsupported type {tp!r}")
+
+
+def _resolve_any(value: Any) -> Any:
+    """Generic resolving of raw value, as loading without schema does."""
+    if isinstance(value, str):
+        return resolve_type(value)
+    if isinstance(value, dict):
+        return {key: _resolve_any(item) for key, item in value.items()}
+    return value
+
+
+def _compile_dict(convert: Converter, path: str) -> Converter:
+    def to_dict(value: Any) -> Dict[str, Any]:
+        if not isinstance(value, dict):
+            raise SchemaError(f"{path}: expected object")
+        return {key: convert(item) for key, item in value.items()}
+
+    return to_dict
+
+
+def _compile_union(converters: list, path: str) -> Converter:
+    def to_union(value: Any) -> Any:
+        for convert in converters:
+            try:
+                return convert(value)
+            except SchemaError:
+                pass
+        raise SchemaError(f"{path}: {value!r} matches no type of union")
+
+    return to_union
+
+
+def _compile_str(path: str) -> Converter:
+    def to_str(value: Any) -> str:
+        if not isinstance(value, str):
+            raise SchemaError(f"{path}: expected str, got {type(value)}")
+        return value
+
+    return to_str
+
+
+def _compile_int(path: str) -> Converter:
+    def to_int(value: Any) -> int:
+        if type(value) is int:
+            return value
+        if isinstance(value, str):
+            try:
+                return int(value)
+            except ValueError:
+                pass
+        raise SchemaError(f"{path}: expected int, got {value!r}")
+
+    return to_int
+
+
+def _compile_float(path: str) -> Converter:
+    def to_float(value: Any) -> float:
+        if type(value) is float or type(value) is int:
+            return float(value)
+        if isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                pass
+        raise SchemaError(f"{path}: expected float, got {value!r}")
+
+    return to_float
+
+
+def _compile_bool(path: str) -> Converter:
+    def to_bool(value: Any) -> bool:
+        if type(value) is bool:
+            return value
+        res = _bool_kw.get(value) if isinstance(value, str) else None
+        if res is None:
+            raise SchemaError(f"{path}: expected bool, got {value!r}")
+        return res
+
+    return to_bool
+
+
+def _compile_none(path: str) -> Converter:
+    def to_none(value: Any) -> None:
+        if value is not None and value != "null":
+            raise SchemaError(f"{path}: expected null, got {value!r}")
+        return None
+
+    return to_none
+
+
+_scalars: Final[Dict[Any, Callable[[str], Converter]]] = {
+    str: _compile_str,
+    int: _compile_int,
+    float: _compile_float,
+    bool: _compile_bool,
+    type(None): _compile_none,
+    None: _compile_none,
+}
@@ -4,11 +4,77 @@ Tokenization is the first stage of MOON loading.
 It separates content into tokens (lexemes), lexical parts of text.
 """
 
-from typing import Dict, Iterator
+import re
+from mmap import mmap
+from typing import (
+    Dict,
+    Final,
+    Generator,
+    Iterable,
+    Iterator,
+    Optional,
+    Pattern,
+    Union,
+)
 
-from moon.core.base import StatefulStreamer
+from moon.core.base import END, LookaheadStreamer
 from moon.schemas import TokenizerError
-from moon.schemas.tokens import Token, TokenType
+from moon.schemas.tokens import (
+    Buffer,
+    LineIndex,
+    Token,
+    TokenTable,
+    TokenType,
+    _token_codes,
+)
+
+_spec_tokens: Final[Dict[str, TokenType]] = {
+    "\n": TokenType.newline,
+    ",": TokenType.comma,
+    ":": TokenType.colon,
+    "'": TokenType.quote,
+    '"': TokenType.d_quote,
+}
+
+
+def _compile_scanner(spec_tokens: Dict[str, TokenType]) -> Pattern[str]:
+    """
+    Compile lexemes scanner. Every character of normalized content is matched
+    by exactly one alternative, so scanning is a contiguous run of matches.
+    Spaces are matched as runs, not one by one.
+    """
+    spec = re.escape("".join(spec_tokens))
+    return re.compile(
+        r"(?P<comment>//[^\n]*|/\*(?:.*?\*/|.*))"
+        r"|(?P<spaces> +)"
+        rf"|(?P<word>[^ {spec}]+)"
+        rf"|(?P<spec>[{spec}])",
+        re.DOTALL,
+    )
+
+
+def _compile_bytes_scanner(spec_tokens: Dict[str, TokenType]) -> Pattern[bytes]:
+    """
+    Compile lexemes scanner for UTF-8 bytes. Content is not normalized,
+    so any of "\r\n", "\r" and "\n" is matched as a newline.
+    """
+    spec = re.escape("".join(spec_tokens)).encode()
+    return re.compile(
+        rb"(?P<comment>//[^\r\n]*|/\*(?:.*?\*/|.*))"
+        rb"|(?P<spaces> +)"
+        rb"|(?P<newline>\r\n?)"
+        rb"|(?P<word>[^ \r" + spec + rb"]+)"
+        rb"|(?P<spec>[" + spec + rb"])",
+        re.DOTALL,
+    )
+
+
+_scanner: Final[Pattern[str]] = _compile_scanner(_spec_tokens)
+_bytes_scanner: Final[Pattern[bytes]] = _compile_bytes_scanner(_spec_tokens)
+_bytes_leading: Final[Pattern[bytes]] = re.compile(rb"[\s\x1c-\x1f]*")
+_bytes_non_ascii: Final[Pattern[bytes]] = re.compile(rb"[\x80-\xff]")
+_bytes_bom: Final[bytes] = b"\xef\xbb\xbf"
+_bytes_newline: Final[Pattern[bytes]] = re.compile(rb"\r\n?|\n")
 
 
 def _normalize(raw: str) -> str:
@@ -27,89 +93,264 @@ def _normalize(raw: str) -> str:
     return norm
 
 
-class Tokenizer(StatefulStreamer[str, Token]):
+def _normalize_chunks(chunks: Iterable[str]) -> Iterator[str]:
+    """Normalize input content chunk by chunk, same as `_normalize` does at once"""
+    started = False
+    carriage = False
+
+    for chunk in chunks:
+        if carriage:
+            chunk = "\r" + chunk
+            carriage = False
+
+        if not started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            started = True
+            # Removing BOM
+            if chunk.startswith("\ufeff"):
+                chunk = chunk[1:]
+
+        if "\r" in chunk:
+            # "\r\n" may be split between chunks, so the last "\r" waits for the next
+            if chunk.endswith("\r"):
+                chunk = chunk[:-1]
+                carriage = True
+            chunk = chunk.replace("\r\n", "\n").replace("\r", "\n")
+
+        if chunk:
+            yield chunk
+
+    if carriage:
+        yield "\n"
+
+    if not started:
+        raise TokenizerError("Empty content")
+
+
+class Tokenizer(LookaheadStreamer[str, Token]):
     """
-    Stateful tokenizer. Turns string into stream of tokens.
+    Stateful tokenizer. Turns string or stream of string chunks into stream of tokens.
+    Lexemes are sliced from normalized content in bulk by precompiled scanner
+    instead of reading it char by char.
+    Lexeme cut by the end of a chunk is rescanned together with the next chunk.
+
+    UTF-8 bytes buffer (e.g. memory mapped file) is scanned as is,
+    without decoding whole content. Only sliced lexemes are decoded.
+    Token positions of a bytes buffer are byte offsets.
+
+    Tokens store only offsets, lines and columns are resolved on demand
+    by lines index, filled once per line.
+
+    Whole content is kept as `source`, so that later stages can slice spans
+    of it by tokens positions, shifted by `offset`. Chunks are not kept.
     """
 
-    spec_tokens: Dict[str, TokenType] = {
-        "\n": TokenType.newline,
-        " ": TokenType.space,
-        ",": TokenType.comma,
-        ":": TokenType.colon,
-        "'": TokenType.quote,
-        '"': TokenType.d_quote,
-    }
-
-    def __init__(self, stream: str) -> None:
-        super().__init__(_normalize(stream))
-        self._pos = 1
-        self._line = 1
-        self._column = 1
-
-    def _tok(self, ttype: TokenType, value: str = "") -> Token:
-        val_len = len(value)
-        offset = val_len - 1
-        return Token(
-            self._pos - offset,
-            self._line,
-            self._column - offset,
-            ttype,
-            value,
-        )
-
-    def _advance(self) -> None:
-        self.next()
-        self._column += 1
-        self._pos += 1
+    spec_tokens: Dict[str, TokenType] = _spec_tokens
+
+    def __init__(
+        self, stream: Union[str, Iterable[str], Buffer], first_line: int = 1
+    ) -> None:
+        """
+        :param stream: content, chunks of content or UTF-8 bytes buffer.
+        :param first_line: number of the first line, when content is a part
+            of document, e.g. a single tag block.
+        """
+        self._buffer = None
+        self._content = None
+        # Generator of tokens, which holds the scanner of content
+        self._scan: Optional[Generator[Token, None, None]] = None
+        self.lines = LineIndex(first_line=first_line)
+        self.source: Optional[Union[str, Buffer]] = None
+        self.offset = 0
+        if isinstance(stream, str):
+            self._content = self.source = _normalize(stream)
+            super().__init__((self._content,))
+        elif isinstance(stream, (bytes, bytearray, memoryview, mmap)):
+            self._buffer = self.source = stream
+            super().__init__(())
+        else:
+            super().__init__(_normalize_chunks(stream))
 
     def __iter__(self) -> Iterator[Token]:
+        if self._buffer is not None:
+            self._scan = self._scan_bytes(self._buffer)
+        else:
+            self._scan = self._scan_chunks()
+        return self._scan
+
+    def close(self) -> None:
+        """
+        Stop tokenizing, scanner releases content buffer,
+        so memory map of it can be closed.
+        """
+        if self._scan is not None:
+            self._scan.close()
+
+    def tabulate(self) -> TokenTable:
+        """
+        Tokenize whole string content into compact table
+        without creating token objects.
+        """
+        content = self._content
+        if content is None:
+            raise TokenizerError("Only string content can be tabulated")
+
+        table = TokenTable(content)
+        table.lines.first_line = self.lines.first_line
+        offsets = table.offsets.append
+        lengths = table.lengths.append
+        types = table.types.append
+        lines = table.lines.append
+        codes = {char: _token_codes[ttype] for char, ttype in self.spec_tokens.items()}
+        newline = codes["\n"]
+        word = _token_codes[TokenType.word]
+        comment = _token_codes[TokenType.comment]
+        indent = _token_codes[TokenType.indent]
+        whitespace = _token_codes[TokenType.whitespace]
+        line_start = 0
+
+        for match in _scanner.finditer(content):
+            start, end = match.span()
+            kind = match.lastgroup
+            offsets(start)
+            lengths(end - start)
+
+            if kind == "word":
+                types(word)
+            elif kind == "spec":
+                code = codes[content[start]]
+                types(code)
+                if code == newline:
+                    line_start = end
+                    lines(end)
+            elif kind == "spaces":
+                types(indent if start == line_start else whitespace)
+            else:
+                types(comment)
+                newline_at = content.find("\n", start, end)
+                while newline_at != -1:
+                    lines(newline_at + 1)
+                    newline_at = content.find("\n", newline_at + 1, end)
+
+        offsets(len(content))
+        lengths(0)
+        types(_token_codes[TokenType.eof])
+        return table
+
+    def _scan_chunks(self) -> Iterator[Token]:
+        spec_tokens = self.spec_tokens
+        lines = self.lines
+        line_start = 0
+        base = 0
+        carry = ""
+
+        chunk = self.read()
+        if chunk is END:
+            # Content was only BOM
+            chunk = ""
+
         while True:
-            try:
-                char = self.read()
-
-                tt = self.spec_tokens.get(char)
-                if tt:
-                    yield self._tok(tt, char)
-                    if tt == TokenType.newline:
-                        self._line += 1
-                        self._column = 0
-                elif char == "/" and self.peek() in [
-                    "/",
-                    "*",
-                ]:
-                    yield self._scan_comment()
+            buffer = carry + chunk
+            final = self.peek() is END
+            carry = ""
+
+            for match in _scanner.finditer(buffer):
+                if not final and match.end() == len(buffer):
+                    carry = buffer[match.start() :]
+                    break
+
+                start = base + match.start()
+                value = match.group()
+                kind = match.lastgroup
+
+                if kind == "spec":
+                    ttype = spec_tokens[value]
+                    yield Token(start + 1, ttype, value, lines)
+                    if ttype == TokenType.newline:
+                        line_start = start + 1
+                        lines.append(line_start)
+                elif kind == "word":
+                    yield Token(start + 1, TokenType.word, value, lines)
+                elif kind == "spaces":
+                    ttype = (
+                        TokenType.indent
+                        if start == line_start
+                        else TokenType.whitespace
+                    )
+                    yield Token(start + 1, ttype, value, lines)
                 else:
-                    yield self._scan_word()
-                self._advance()
-            except StopIteration:
+                    yield Token(start + 1, TokenType.comment, value, lines)
+                    newline_at = value.find("\n")
+                    while newline_at != -1:
+                        lines.append(start + newline_at + 1)
+                        newline_at = value.find("\n", newline_at + 1)
+
+            base += len(buffer) - len(carry)
+            if final:
                 break
+            chunk = self.next()
 
-        yield self._tok(TokenType.eof)
+        yield Token(base + 1, TokenType.eof, "", lines)
 
-    def _scan_comment(
-        self,
-    ) -> Token:
-        is_multiline = self.peek() == "*"
-        val = ""
-        while True:
-            char = self.read()
-            val += char
-            if is_multiline:
-                if char == "*" and self.peek() == "/":
-                    return self._tok(TokenType.comment, val)
-            elif self.peek() == "\n":
-                return self._tok(TokenType.comment, val)
-
-            self._advance()
-
-    def _scan_word(self) -> Token:
-        """Scan word (directive, key, value or other anything)"""
-        val = ""
-        while True:
-            char = self.read()
-            val += char
-            if self.peek() in self.spec_tokens or self.peek() is None:
-                return self._tok(TokenType.word, val)
+    def _scan_bytes(self, buffer: Buffer) -> Iterator[Token]:
+        start = _bytes_leading.match(buffer).end()
+        if start == len(buffer):
+            raise TokenizerError("Empty content")
+
+        # Removing BOM
+        if buffer[start : start + 3] == _bytes_bom:
+            start += 3
+        self.offset = start
+
+        # Pure ASCII content is decoded by the cheapest codec
+        # and columns are equal to offsets
+        if _bytes_non_ascii.search(buffer, start) is None:
+            codec = "ascii"
+        else:
+            codec = "utf-8"
+            self.lines = LineIndex(buffer, start, self.lines.first_line)
+
+        spec_tokens = self.spec_tokens
+        lines = self.lines
+        line_start = start
+        try:
+            for match in _bytes_scanner.finditer(buffer, start):
+                pos = match.start() - start + 1
+                kind = match.lastgroup
+
+                if kind == "newline":
+                    yield Token(pos, TokenType.newline, "\n", lines)
+                    line_start = match.end()
+                    lines.append(line_start - start)
+                    continue
+
+                value = match.group().decode(codec)
+                if kind == "spec":
+                    ttype = spec_tokens[value]
+                    yield Token(pos, ttype, value, lines)
+                    if ttype == TokenType.newline:
+                        line_start = match.end()
+                        lines.append(line_start - start)
+                elif kind == "word":
+                    yield Token(pos, TokenType.word, value, lines)
+                elif kind == "spaces":
+                    ttype = (
+                        TokenType.indent
+                        if match.start() == line_start
+                        else TokenType.whitespace
+                    )
+                    yield Token(pos, ttype, value, lines)
+                else:
+                    raw = match.group()
+                    if "\r" in value:
+                        value = value.replace("\r\n", "\n").replace("\r", "\n")
+                    yield Token(pos, TokenType.comment, value, lines)
+                    for newline in _bytes_newline.finditer(raw):
+                        lines.append(pos - 1 + newline.end())
+        except UnicodeDecodeError as e:
+            raise TokenizerError(f"Cannot decode content: {e}") from e
 
-            self._advance()
+        end = len(buffer) - start
+        yield Token(end + 1, TokenType.eof, "", lines)
@@ -1,18 +1,35 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar, Dict, Iterator, Optional, Tuple, Type, Union
-
-from moon.core.base import StatefulStreamer
+from bisect import bisect_left
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Generator,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from moon.core.base import END, LookaheadStreamer
+from moon.core.records import make_objects
 from moon.schemas import ASTNode, Event, TagNode
-from moon.schemas.tokens import Token
+from moon.schemas.tokens import Token, TokenTable
 
 
 class TagHook(ABC):
-    """Base class for tag hooks."""
+    """
+    Base class for tag hooks.
+    Hook must bump `version` when its results change, documents stored
+    by disk cache are keyed by it.
+    """
 
     tag: ClassVar[str]
     object_type: ClassVar[Union[Type, Tuple[Type]]]
+    version: ClassVar[int] = 0
 
     def __init_subclass__(cls, **kwargs) -> None:
         if not hasattr(cls, "tag"):
@@ -48,12 +65,24 @@ class TagHook(ABC):
 
     @classmethod
     @abstractmethod
-    def parse(cls, streamer: StatefulStreamer[Token, Event]) -> Iterator[Event]:
+    def parse(cls, streamer: LookaheadStreamer[Token, Event]) -> Iterator[Event]:
         pass
 
+    @classmethod
+    def parse_table(cls, table: TokenTable, index: int) -> Generator[Event, None, int]:
+        """
+        Parses tag from compact table of tokens by indexes, without token objects.
+        Starts at the token after tag word, as `parse` does.
+        Default implementation parses token objects of the table by `parse`.
+        :return: index of the first token after tag.
+        """
+        streamer = _TableStreamer(table, index)
+        yield from cls.parse(streamer)
+        return streamer.index()
+
     @classmethod
     @abstractmethod
-    def compose(cls, streamer: StatefulStreamer[Event, ASTNode]) -> TagNode:
+    def compose(cls, streamer: LookaheadStreamer[Event, ASTNode]) -> TagNode:
         pass
 
     @classmethod
@@ -61,6 +90,31 @@ class TagHook(ABC):
     def construct(cls, node: ASTNode) -> Any:
         pass
 
+    @classmethod
+    def build(cls, streamer: LookaheadStreamer[Event, Any]) -> Tuple[str, Any]:
+        """
+        Builds Python value of a tag straight from events, without AST.
+        Streamer is at tag start event and must be left at tag end event.
+        Default implementation composes tag node and constructs it,
+        hooks override it to skip node allocations.
+        Dicts of constructed value are replaced by `objects` of streamer, if set.
+        :return: tag identifier and its value.
+        """
+        node = cls.compose(streamer)
+        value = cls.construct(node)
+        make = getattr(streamer, "objects", None)
+        return node.name, value if make is None else make_objects(value, make)
+
+    @classmethod
+    def build_raw(cls, streamer: LookaheadStreamer[Event, Any]) -> Tuple[str, Any]:
+        """
+        Builds Python value of a tag keeping scalars as source strings,
+        for schema loaders which convert them by declared types.
+        Default implementation resolves scalars as `build` does.
+        :return: tag identifier and its value.
+        """
+        return cls.build(streamer)
+
     @classmethod
     @abstractmethod
     def represent(cls, name: str, value: Any) -> TagNode:
@@ -73,9 +127,39 @@ class TagHook(ABC):
 
     @classmethod
     @abstractmethod
-    def emit(cls, stream: StatefulStreamer[Event, str]) -> str:
+    def emit(cls, stream: LookaheadStreamer[Event, str]) -> str:
         pass
 
+    @classmethod
+    def emit_chunks(cls, stream: LookaheadStreamer[Event, str]) -> Iterator[str]:
+        """
+        Emits text of a tag by small chunks, e.g. lines or their fragments,
+        so that text of a huge tag is never built at once.
+        Default implementation yields whole text of `emit`.
+        :return: iterator of text chunks.
+        """
+        yield cls.emit(stream)
+
+
+class _TableStreamer(LookaheadStreamer[Token, Event]):
+    """Stream of token objects of a table from index, for hooks without `parse_table`."""
+
+    def __init__(self, table: TokenTable, index: int) -> None:
+        super().__init__(table[i] for i in range(index, len(table)))
+        self._table = table
+        self.source = table.source
+        self.offset = table.offset
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(())
+
+    def index(self) -> int:
+        """:return: index of current token in table."""
+        token = self.read()
+        if token is END:
+            return len(self._table)
+        return bisect_left(self._table.offsets, token.pos - 1)
+
 
 _parsing_hooks: Dict[str, Type[TagHook]] = {}
 _representing_hooks: Dict[Type, Type[TagHook]] = {}
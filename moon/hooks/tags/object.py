@@ -7,11 +7,24 @@ Object tah hook. Resolving as python dict with str keys.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Final, Iterator, List, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    FrozenSet,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from moon.core.base import StatefulStreamer
+from moon.core.base import END, LookaheadStreamer
 from moon.hooks.types import represent_type, resolve_type
 from moon.schemas import (
+    ASTError,
     ASTNode,
     DuplicateIdentifierNode,
     EmitterError,
@@ -22,18 +35,36 @@ from moon.schemas import (
     NodeType,
     ScalarNode,
     SerializationError,
+    Span,
     TagNode,
     Token,
     TokenType,
+    UnexpectedEOF,
     UnexpectedEvent,
     UnexpectedNode,
     UnexpectedToken,
 )
+from moon.schemas.tokens import Buffer, TokenTable, _token_codes
 
 from .hook import TagHook, resolve_tag
 
 INDENTATION: Final[int] = 4
 
+# Codes of tokens types of tokens table
+_WORD: Final[int] = _token_codes[TokenType.word]
+_COLON: Final[int] = _token_codes[TokenType.colon]
+_NEWLINE: Final[int] = _token_codes[TokenType.newline]
+_EOF: Final[int] = _token_codes[TokenType.eof]
+_COMMENT: Final[int] = _token_codes[TokenType.comment]
+_WHITESPACE: Final[int] = _token_codes[TokenType.whitespace]
+_SPACES: Final[FrozenSet[int]] = frozenset(
+    [_token_codes[TokenType.indent], _WHITESPACE]
+)
+# Pair, or tag header, ends on newline, comment or eof
+_PAIR_ENDS: Final[FrozenSet[int]] = frozenset([_NEWLINE, _COMMENT, _EOF])
+# Indentation strings of nesting levels, extended on demand
+_indents: List[str] = [" " * INDENTATION * level for level in range(16)]
+
 
 @dataclass(slots=True)
 class KeyValueNode(ASTNode):
@@ -71,67 +102,203 @@ class ObjectNode(TagNode):
     children: List[Union[KeyValueNode, NestedObjectNode]]
 
 
-def _parse_pair(streamer: StatefulStreamer[Token, Event]) -> Iterator[Event]:
+def _parse_pair(
+    streamer: LookaheadStreamer[Token, Event],
+    source: Optional[Union[str, Buffer]] = None,
+    offset: int = 0,
+) -> Iterator[Event]:
+    """
+    Parse key and value of a pair. When source of tokens is known,
+    key and value events carry spans of it instead of strings.
+    """
+    key = streamer.read()
+    token = streamer.next()
+    if source is None:
+        yield Event(type=EventType.key, value=key.value)
+    else:
+        start = offset + key.pos - 1
+        end = offset + token.pos - 1
+        yield Event(type=EventType.key, value=Span(source, start, end))
+
     value_started = False
-    token = streamer.read()
-    yield Event(type=EventType.key, value=token.value)
-    streamer.next()
     value = ""
+    value_pos = 0
     while True:
-        token = streamer.read()
+        if token is END:
+            raise UnexpectedEOF("Unexpected EOF")
 
         if not value_started:
             if token.type == TokenType.colon:
                 value_started = True
-            elif token.type != TokenType.space:
+            elif token.type != TokenType.whitespace:
                 raise UnexpectedToken(f"Unexpected token: {token}. Expected colon.")
+        elif token.type not in [TokenType.newline, TokenType.comment, TokenType.eof]:
+            if source is not None:
+                # Value starts from the first non whitespace token
+                if not value_pos and token.type != TokenType.whitespace:
+                    value_pos = token.pos
+            elif token.type != TokenType.whitespace or len(value) > 0:
+                value += token.value
         else:
-            if token.type not in [TokenType.newline, TokenType.comment, TokenType.eof]:
-                if token.type != TokenType.space or (
-                    token.type == TokenType.space and len(value) > 0
-                ):
-                    value += token.value
+            if source is not None:
+                start = offset + (value_pos or token.pos) - 1
+                end = offset + token.pos - 1
+                yield Event(type=EventType.value, value=Span(source, start, end))
             else:
                 yield Event(type=EventType.value, value=value)
-                return
+            return
+
+        token = streamer.next()
 
-        streamer.next()
+
+def _parse_table_pair(table: TokenTable, index: int) -> Generator[Event, None, int]:
+    """
+    Parse key and value of a pair of tokens table, as `_parse_pair` does.
+    :return: index of the token ending the pair.
+    """
+    types = table.types
+    offsets = table.offsets
+    source = table.source
+    offset = table.offset
+    key = offsets[index]
+    index += 1
+    yield Event(
+        type=EventType.key, value=Span(source, offset + key, offset + offsets[index])
+    )
+
+    value_started = False
+    value_pos = -1
+    while True:
+        code = types[index]
+        if not value_started:
+            if code == _COLON:
+                value_started = True
+            elif code != _WHITESPACE:
+                raise UnexpectedToken(
+                    f"Unexpected token: {table[index]}. Expected colon."
+                )
+        elif code not in _PAIR_ENDS:
+            # Value starts from the first non whitespace token
+            if value_pos < 0 and code != _WHITESPACE:
+                value_pos = offsets[index]
+        else:
+            start = offset + (value_pos if value_pos >= 0 else offsets[index])
+            end = offset + offsets[index]
+            yield Event(type=EventType.value, value=Span(source, start, end))
+            return index
+
+        index += 1
 
 
 def _compose_object_nodes(
-    streamer: StatefulStreamer[Event, ASTNode],
+    streamer: LookaheadStreamer[Event, ASTNode],
 ) -> List[KeyValueNode]:
     nodes = []
+    event = streamer.read()
     while True:
-        event = streamer.read()
-        if event.type == EventType.key:
-            value_event = streamer.next()
-            if streamer.peek().type == EventType.nesting_start:
-                streamer.next()
-                nodes.append(
-                    KeyValueNode(
-                        key=ScalarNode(value=event.value),
-                        value=NestedObjectNode(
-                            children=_compose_object_nodes(streamer),
-                        ),
-                    )
-                )
-            elif value_event.type == EventType.value:
-                nodes.append(
-                    KeyValueNode(
-                        key=ScalarNode(value=event.value),
-                        value=ScalarNode(value=value_event.value),
-                    )
-                )
-            else:
-                raise UnexpectedEvent(f"Unexpected event type {value_event.type}")
-        if streamer.read().type == EventType.tag_end:
+        if event is END:
+            raise ASTError("Unexpected end of stream of events.")
+        if event.type == EventType.tag_end:
             return nodes
-        elif streamer.read().type == EventType.nesting_end:
+        elif event.type == EventType.nesting_end:
             streamer.next()
             return nodes
         elif event.type != EventType.key:
+            event = streamer.next()
+            continue
+
+        value_event = streamer.next()
+        if value_event is END:
+            raise ASTError("Unexpected end of stream of events.")
+        peeked = streamer.peek()
+        if peeked is not END and peeked.type == EventType.nesting_start:
             streamer.next()
+            nodes.append(
+                KeyValueNode(
+                    key=ScalarNode(value=event.value),
+                    value=NestedObjectNode(
+                        children=_compose_object_nodes(streamer),
+                    ),
+                )
+            )
+        elif value_event.type == EventType.value:
+            nodes.append(
+                KeyValueNode(
+                    key=ScalarNode(value=event.value),
+                    value=ScalarNode(value=value_event.value),
+                )
+            )
+        else:
+            raise UnexpectedEvent(f"Unexpected event type {value_event.type}")
+        event = streamer.read()
+
+
+def _build_tag(
+    streamer: LookaheadStreamer[Event, Any],
+    resolve: Callable[[str], Any],
+    key: Callable[[Any], str] = str,
+    make: Optional[Callable[[Dict[str, Any]], Any]] = None,
+) -> Tuple[str, Any]:
+    """Builds identifier and dict of a tag from identifier event up to tag end."""
+    ident = streamer.next()
+    if ident is END:
+        raise ASTError("Unexpected end of stream of events.")
+    if ident.type != EventType.ident:
+        raise UnexpectedEvent(f"Unexpected event type {ident.type}")
+
+    duplicates: List[str] = []
+    res = _build_object(streamer, duplicates, resolve, key, make)
+    if duplicates:
+        raise DuplicateIdentifierNode(f"Duplicate keys {duplicates[0]}.")
+    return ident.value, res
+
+
+def _build_object(
+    streamer: LookaheadStreamer[Event, Any],
+    duplicates: List[str],
+    resolve: Callable[[str], Any] = resolve_type,
+    key: Callable[[Any], str] = str,
+    make: Optional[Callable[[Dict[str, Any]], Any]] = None,
+) -> Any:
+    """
+    Builds dict of pairs events up to tag or nesting end.
+    Duplicate keys are collected to be raised when whole tag is read,
+    as construction from AST does.
+    Scalars are passed to `resolve`, `str` keeps them as strings.
+    Keys are materialized by `key`, which may share equal ones.
+    Built dict is replaced by result of `make`, when it is given.
+    """
+    to_key = key
+    res = {}
+    event = streamer.read()
+    while True:
+        if event is END:
+            raise ASTError("Unexpected end of stream of events.")
+        if event.type == EventType.tag_end:
+            return res if make is None else make(res)
+        elif event.type == EventType.nesting_end:
+            streamer.next()
+            return res if make is None else make(res)
+        elif event.type != EventType.key:
+            event = streamer.next()
+            continue
+
+        key = to_key(event.value)
+        value_event = streamer.next()
+        if value_event is END:
+            raise ASTError("Unexpected end of stream of events.")
+        peeked = streamer.peek()
+        if peeked is not END and peeked.type == EventType.nesting_start:
+            streamer.next()
+            res[key] = _build_object(streamer, duplicates, resolve, to_key, make)
+        elif value_event.type == EventType.value:
+            if key in res:
+                duplicates.append(key)
+            else:
+                res[key] = resolve(str(value_event.value))
+        else:
+            raise UnexpectedEvent(f"Unexpected event type {value_event.type}")
+        event = streamer.read()
 
 
 def _represent_object(
@@ -178,15 +345,24 @@ def _serialize_object(node: Union[ObjectNode, NestedObjectNode]) -> Iterator[Eve
             raise SerializationError(f"Expected KeyValueNode. Got {type(child)}")
 
 
+def _indent(level: int) -> str:
+    """Indentation string of nesting level."""
+    while level >= len(_indents):
+        _indents.append(" " * INDENTATION * len(_indents))
+    return _indents[level]
+
+
 class ObjectHook(TagHook):
     tag = "@object"
     object_type = dict
 
     @classmethod
-    def parse(cls, streamer: StatefulStreamer[Token, Event]) -> Iterator[Event]:
+    def parse(cls, streamer: LookaheadStreamer[Token, Event]) -> Iterator[Event]:
         identified = False
+        token = streamer.read()
         while True:
-            token = streamer.read()
+            if token is END:
+                raise UnexpectedEOF("Unexpected EOF")
 
             if token.type == TokenType.word and not identified:
                 yield Event(type=EventType.ident, value=token.value)
@@ -196,58 +372,121 @@ class ObjectHook(TagHook):
                 and identified
             ):
                 break
-            elif token.type != TokenType.space:
+            elif token.type != TokenType.whitespace:
                 raise UnexpectedToken(
                     f"Unexpected token: {token}. Expected identifier."
                 )
 
-            streamer.next()
+            token = streamer.next()
 
+        source = getattr(streamer, "source", None)
+        offset = getattr(streamer, "offset", 0)
         indent_level = 0
         indents: List[int] = []
         while True:
-            token = streamer.read()
+            if token is END:
+                raise UnexpectedEOF("Unexpected EOF")
             if token.type == TokenType.word:
+                if resolve_tag(token.value):
+                    # Next tag ends the object
+                    break
                 if not indents:
                     indents.append(indent_level)
                 if indent_level == indents[-1]:
-                    yield from _parse_pair(streamer)
+                    yield from _parse_pair(streamer, source, offset)
                 elif indent_level < indents[-1] and indent_level in indents:
                     for i in range(len(indents[indents.index(indent_level) + 1 :])):
                         yield Event(type=EventType.nesting_end)
                     del indents[indents.index(indent_level) + 1 :]
-                    yield from _parse_pair(streamer)
+                    yield from _parse_pair(streamer, source, offset)
                 elif indent_level > indents[-1]:
                     yield Event(type=EventType.nesting_start)
-                    yield from _parse_pair(streamer)
+                    yield from _parse_pair(streamer, source, offset)
                     indents.append(indent_level)
                 else:
                     raise LevelIndentationError(
                         f"Indentation error at {token.line}:{token.column}"
                     )
                 indent_level = 0
-            elif token.type == TokenType.space:
-                indent_level += 1
-            elif token.type not in [
-                TokenType.eof,
-                TokenType.newline,
-                TokenType.comment,
-            ]:
+                # Pair ends on newline, comment or eof
+                token = streamer.read()
+                continue
+            elif token.type in [TokenType.indent, TokenType.whitespace]:
+                indent_level += len(token.value)
+            elif token.type == TokenType.newline:
+                indent_level = 0
+            elif token.type == TokenType.eof:
+                break
+            elif token.type != TokenType.comment:
                 raise UnexpectedToken(f"Unexpected token: {token}. Expected field key.")
 
-            peeked = streamer.peek()
-            if (
-                streamer.read().type == TokenType.eof
-                or peeked.type == TokenType.word
-                and resolve_tag(peeked.value)
-            ):
+            token = streamer.next()
+
+    @classmethod
+    def parse_table(cls, table: TokenTable, index: int) -> Generator[Event, None, int]:
+        types = table.types
+        offsets = table.offsets
+        source = table.source
+        identified = False
+        while True:
+            code = types[index]
+            if code == _WORD and not identified:
+                yield Event(type=EventType.ident, value=table.value_at(index))
+                identified = True
+            elif code in _PAIR_ENDS and identified:
                 break
+            elif code != _WHITESPACE:
+                raise UnexpectedToken(
+                    f"Unexpected token: {table[index]}. Expected identifier."
+                )
+            index += 1
 
-            streamer.next()
+        indent_level = 0
+        indents: List[int] = []
+        while True:
+            code = types[index]
+            if code == _WORD:
+                # Tags start with "@", other keys are not sliced to be resolved
+                if source[offsets[index]] == "@" and resolve_tag(table.value_at(index)):
+                    # Next tag ends the object
+                    break
+                if not indents:
+                    indents.append(indent_level)
+                if indent_level == indents[-1]:
+                    index = yield from _parse_table_pair(table, index)
+                elif indent_level < indents[-1] and indent_level in indents:
+                    for i in range(len(indents[indents.index(indent_level) + 1 :])):
+                        yield Event(type=EventType.nesting_end)
+                    del indents[indents.index(indent_level) + 1 :]
+                    index = yield from _parse_table_pair(table, index)
+                elif indent_level > indents[-1]:
+                    yield Event(type=EventType.nesting_start)
+                    index = yield from _parse_table_pair(table, index)
+                    indents.append(indent_level)
+                else:
+                    line, column = table.position(offsets[index])
+                    raise LevelIndentationError(f"Indentation error at {line}:{column}")
+                indent_level = 0
+                continue
+            elif code in _SPACES:
+                indent_level += table.lengths[index]
+            elif code == _NEWLINE:
+                indent_level = 0
+            elif code == _EOF:
+                break
+            elif code != _COMMENT:
+                raise UnexpectedToken(
+                    f"Unexpected token: {table[index]}. Expected field key."
+                )
+
+            index += 1
+        return index
 
     @classmethod
-    def compose(cls, streamer: StatefulStreamer[Event, ASTNode]) -> TagNode:
+    def compose(cls, streamer: LookaheadStreamer[Event, ASTNode]) -> TagNode:
         ident = streamer.next()
+        if ident is END:
+            raise ASTError("Unexpected end of stream of events.")
         if ident.type != EventType.ident:
             raise UnexpectedEvent(f"Unexpected event type {ident.type}")
 
@@ -255,6 +494,20 @@ class ObjectHook(TagHook):
             tag=cls.tag, name=ident.value, children=_compose_object_nodes(streamer)
         )
 
+    @classmethod
+    def build(cls, streamer: LookaheadStreamer[Event, Any]) -> Tuple[str, Any]:
+        strings = getattr(streamer, "strings", None)
+        make = getattr(streamer, "objects", None)
+        if strings is None:
+            return _build_tag(streamer, resolve_type, str, make)
+        resolve = strings.resolve if strings.max_value_length else resolve_type
+        return _build_tag(streamer, resolve, strings.key, make)
+
+    @classmethod
+    def build_raw(cls, streamer: LookaheadStreamer[Event, Any]) -> Tuple[str, Any]:
+        strings = getattr(streamer, "strings", None)
+        return _build_tag(streamer, str, str if strings is None else strings.key)
+
     @classmethod
     def construct(cls, node: ASTNode) -> Any:
 
@@ -267,16 +520,16 @@ class ObjectHook(TagHook):
 
         for child in node.children:
             if isinstance(child, KeyValueNode):
+                # Spans of source are materialized here
+                key = str(child.key.value)
                 pair_value = child.value
                 if isinstance(pair_value, ScalarNode):
-                    if child.key.value not in res:
-                        res[child.key.value] = resolve_type(pair_value.value)
+                    if key not in res:
+                        res[key] = resolve_type(str(pair_value.value))
                     else:
-                        raise DuplicateIdentifierNode(
-                            f"Duplicate keys {child.key.value}."
-                        )
+                        raise DuplicateIdentifierNode(f"Duplicate keys {key}.")
                 elif isinstance(pair_value, NestedObjectNode):
-                    res[child.key.value] = cls.construct(pair_value)
+                    res[key] = cls.construct(pair_value)
                 else:
                     raise UnexpectedNode(f"Unexpected node: {pair_value}")
             else:
@@ -305,43 +558,49 @@ class ObjectHook(TagHook):
         yield Event(type=EventType.tag_end, value=cls.tag)
 
     @classmethod
-    def emit(cls, streamer: StatefulStreamer[Event, str]) -> str:
-        content = "" + cls.tag
+    def emit(cls, streamer: LookaheadStreamer[Event, str]) -> str:
+        return "".join(cls.emit_chunks(streamer))
+
+    @classmethod
+    def emit_chunks(cls, streamer: LookaheadStreamer[Event, str]) -> Iterator[str]:
         identified = False
         next_event = streamer.read()
+        if next_event is END:
+            raise EmitterError("Unexpected end of stream")
         if next_event.type != EventType.tag_start and next_event.value != cls.tag:
             raise EmitterError(f"Unexpected event type {next_event.type}")
 
-        streamer.next()
-
         indent_level = 1
+        indent = _indent(indent_level)
 
+        event = streamer.next()
         while True:
-            event = streamer.read()
+            if event is END:
+                raise EmitterError("Unexpected end of stream")
             if not identified:
                 if event.type == EventType.ident:
                     identified = True
-                    content += " " + event.value + "\n"
+                    yield cls.tag + " " + event.value + "\n"
                 else:
                     raise EmitterError(f"Unexpected event: {event}")
             else:
                 if event.type == EventType.key:
-                    content += " " * INDENTATION * indent_level + event.value + ":"
-                    if streamer.peek().type == EventType.nesting_start:
-                        content += "\n"
+                    peeked = streamer.peek()
+                    if peeked is not END and peeked.type == EventType.nesting_start:
+                        yield indent + event.value + ":\n"
                     else:
-                        content += " "
+                        yield indent + event.value + ": "
                 elif event.type == EventType.value:
-                    content += event.value + "\n"
+                    yield event.value + "\n"
                 elif event.type == EventType.tag_end:
                     break
                 elif event.type == EventType.nesting_start:
                     indent_level += 1
+                    indent = _indent(indent_level)
                 elif event.type == EventType.nesting_end:
                     indent_level -= 1
+                    indent = _indent(indent_level)
                 else:
                     raise EmitterError(f"Unexpected event: {event}")
 
-            streamer.next()
-
-        return content
+            event = streamer.next()
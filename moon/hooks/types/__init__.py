@@ -3,6 +3,22 @@
 Types hooks module. Define resolving, representing methods and Base TypeHook class.
 """
 
-from .hook import TypeHook, represent_type, resolve_type
+from .hook import (
+    CacheInfo,
+    TypeHook,
+    cache_clear,
+    cache_info,
+    configure_cache,
+    represent_type,
+    resolve_type,
+)
 
-__all__ = ["TypeHook", "resolve_type", "represent_type"]
+__all__ = [
+    "TypeHook",
+    "resolve_type",
+    "represent_type",
+    "CacheInfo",
+    "cache_info",
+    "cache_clear",
+    "configure_cache",
+]
@@ -1,17 +1,91 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import re
 from abc import ABC, abstractmethod
-from typing import Any, Final, List, Tuple, Type
+from collections import OrderedDict
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Final,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+)
+
+from moon.schemas import ArgumentsError
 
 _resolve_bool_kw: Final[dict[str, bool]] = {"true": True, "false": False}
 _represent_bool_kw: Final[dict[bool, str]] = {True: "true", False: "false"}
 
+# Built-in scalars of ASCII value in one match, same as `int` and `float` accept:
+# digits, then float with underscores and whitespace around, inf and nan
+_scalar: Final[Pattern[str]] = re.compile(
+    r"""
+    (?P<int>[0-9]+)
+    |(?P<float>
+        [\t-\r\x20]*[+-]?
+        (?:
+            (?:[0-9](?:_?[0-9])*(?:\.(?:[0-9](?:_?[0-9])*)?)?|\.[0-9](?:_?[0-9])*)
+            (?:[eE][+-]?[0-9](?:_?[0-9])*)?
+            |(?i:inf(?:inity)?|nan)
+        )
+        [\t-\r\x20]*
+    )
+    |(?P<bool>true|false)
+    |(?P<null>null)
+    """,
+    re.VERBOSE,
+)
+
 
 class TypeHook(ABC):
-    """Base class for type hooks."""
+    """
+    Base class for type hooks.
+    Resolved values are memoized by scalar string, hooks returning
+    mutable values must set `cacheable` to False.
+    Hook is asked to resolve only values starting with one of `first_chars`
+    and fully matching `pattern`, when they are set.
+    Hook is asked to represent only instances of `object_type`, when it is set.
+    Hook must bump `version` when its results change, documents stored
+    by disk cache are keyed by it.
+    """
+
+    cacheable: ClassVar[bool] = True
+    version: ClassVar[int] = 0
+    object_type: ClassVar[Optional[Union[Type, Tuple[Type, ...]]]] = None
+    first_chars: ClassVar[Optional[str]] = None
+    pattern: ClassVar[Optional[str]] = None
+    _pattern: ClassVar[Optional[Pattern[str]]] = None
 
     def __init_subclass__(cls, **kwargs) -> None:
+        if cls.first_chars is not None and not isinstance(cls.first_chars, str):
+            raise TypeError("'first_chars' attribute must be a string")
+        if cls.pattern is not None:
+            if not isinstance(cls.pattern, str):
+                raise TypeError("'pattern' attribute must be a string")
+            cls._pattern = re.compile(cls.pattern)
+        if cls.object_type is not None and not (
+            isinstance(cls.object_type, type)
+            or isinstance(cls.object_type, tuple)
+            and all(isinstance(t, type) for t in cls.object_type)
+        ):
+            raise TypeError(
+                "'object_type' attribute must be a type or a tuple of types"
+            )
+
         _hooks.append(cls)
+        _by_first_char.clear()
+        _by_type.clear()
+        # New hook may resolve already memoized scalars differently
+        with _lock:
+            _cache.clear()
 
     @classmethod
     @abstractmethod
@@ -25,6 +99,58 @@ class TypeHook(ABC):
 
 
 _hooks: List[Type[TypeHook]] = []
+# First character of value to hooks which may resolve it, filled on demand
+_by_first_char: Dict[str, Tuple[Type[TypeHook], ...]] = {}
+# Value type to hooks which may represent it and built-in representer,
+# resolved by type MRO and filled on demand
+_by_type: Dict[Type, Tuple[Tuple[Type[TypeHook], ...], Optional[Callable]]] = {}
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of resolved types memo."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+# Scalar string to resolved value, in order of use, the least recent first.
+# Memo and its statistics are shared by loading threads, so guarded by lock
+_cache: "OrderedDict[str, Any]" = OrderedDict()
+_lock: Final[Lock] = Lock()
+_cache_maxsize: int = 1024
+_hits: int = 0
+_misses: int = 0
+_MISS: Final = object()
+
+
+def configure_cache(maxsize: int) -> None:
+    """
+    Set bound of resolved types memo, 0 disables it.
+    :param maxsize: maximum number of memoized scalars.
+    """
+    global _cache_maxsize
+    if not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize < 0:
+        raise ArgumentsError(f"Cache size must be a non-negative int, got {maxsize}")
+    with _lock:
+        _cache_maxsize = maxsize
+        while len(_cache) > maxsize:
+            _cache.popitem(last=False)
+
+
+def cache_info() -> CacheInfo:
+    """:return: hits and misses of resolved types memo, its bound and size."""
+    with _lock:
+        return CacheInfo(_hits, _misses, _cache_maxsize, len(_cache))
+
+
+def cache_clear() -> None:
+    """Forget memoized types and reset statistics."""
+    global _hits, _misses
+    with _lock:
+        _cache.clear()
+        _hits = _misses = 0
 
 
 def _is_float(value: str) -> bool:
@@ -42,34 +168,115 @@ def resolve_type(value: str) -> Any:
     :param value: The value to resolve type.
     :return: The resolved scalar type.
     """
-    for hook in _hooks:
-        resolved, res = hook.resolve(value)
-        if resolved:
+    global _hits, _misses
+    with _lock:
+        res = _cache.get(value, _MISS)
+        if res is not _MISS:
+            _cache.move_to_end(value)
+            _hits += 1
             return res
+        _misses += 1
+
+    if _hooks:
+        first = value[:1]
+        hooks = _by_first_char.get(first)
+        if hooks is None:
+            hooks = _by_first_char[first] = _hooks_for(first)
+        for hook in hooks:
+            if hook._pattern is not None and hook._pattern.fullmatch(value) is None:
+                continue
+            resolved, res = hook.resolve(value)
+            if resolved:
+                if hook.cacheable:
+                    _remember(value, res)
+                return res
+
+    res = _resolve_builtin(value)
+    _remember(value, res)
+    return res
+
+
+def _hooks_for(first: str) -> Tuple[Type[TypeHook], ...]:
+    """Hooks in order of registration which accept the first character."""
+    return tuple(
+        hook
+        for hook in _hooks
+        if hook.first_chars is None or (first and first in hook.first_chars)
+    )
 
+
+def _resolve_builtin(value: str) -> Any:
+    match = _scalar.fullmatch(value)
+    if match is not None:
+        kind = match.lastgroup
+        if kind == "int":
+            return int(value)
+        elif kind == "float":
+            return float(value)
+        elif kind == "bool":
+            return _resolve_bool_kw[value]
+        else:
+            return None
+    if value.isascii():
+        return str(value)
+
+    # Unicode digits and whitespace are left to Python
     if value.isdigit():
         return int(value)
     elif _is_float(value):
         return float(value)
-    elif value in _resolve_bool_kw:
-        return _resolve_bool_kw[value]
-    elif value == "null":
-        return None
     else:
         return str(value)
 
 
+def _remember(value: str, res: Any) -> None:
+    with _lock:
+        if _cache_maxsize:
+            _cache[value] = res
+            while len(_cache) > _cache_maxsize:
+                _cache.popitem(last=False)
+
+
 def represent_type(value: Any) -> str:
-    for hook in _hooks:
+    """
+    Represent a scalar value as node value.
+    :param value: The value to represent.
+    :return: The represented scalar string.
+    """
+    value_type = type(value)
+    representers = _by_type.get(value_type)
+    if representers is None:
+        representers = _by_type[value_type] = _representers_for(value_type)
+
+    hooks, builtin = representers
+    for hook in hooks:
         represented, res = hook.represent(value)
         if represented:
             return res
 
-    if isinstance(value, bool):
-        return _represent_bool_kw[value]
-    elif isinstance(value, (int, float, str)):
-        return str(value)
-    elif value is None:
-        return "null"
+    if builtin is None:
+        raise TypeError(f"Cannot represent type {value_type}")
+    return builtin(value)
+
+
+def _representers_for(
+    value_type: Type,
+) -> Tuple[Tuple[Type[TypeHook], ...], Optional[Callable]]:
+    """Hooks in order of registration and built-in representer of a type."""
+    hooks = tuple(
+        hook
+        for hook in _hooks
+        if hook.object_type is None or issubclass(value_type, hook.object_type)
+    )
+    if issubclass(value_type, bool):
+        return hooks, _represent_bool_kw.__getitem__
+    elif issubclass(value_type, (int, float, str)):
+        return hooks, str
+    elif value_type is type(None):
+        return hooks, _represent_null
     else:
-        raise TypeError(f"Cannot represent type {type(value)}")
+        return hooks, None
+
+
+def _represent_null(value: None) -> str:
+    return "null"
@@ -13,6 +13,7 @@ from .errors import (
     LevelIndentationError,
     ParserError,
     ReadError,
+    SchemaError,
     SerializationError,
     TokenizerError,
     UnexpectedEOF,
@@ -25,7 +26,7 @@ from .errors import (
 )
 from .events import Event, EventType
 from .nodes import ASTNode, NodeType, ScalarNode, TagNode
-from .tokens import Token, TokenType
+from .tokens import Span, Token, TokenTable, TokenType
 
 __all__ = [
     "ArgumentsError",
@@ -34,6 +35,7 @@ __all__ = [
     "TokenizerError",
     "ParserError",
     "ReadError",
+    "SchemaError",
     "UnexpectedEOF",
     "UnexpectedEvent",
     "UnexpectedNode",
@@ -52,6 +54,8 @@ __all__ = [
     "NodeType",
     "ScalarNode",
     "TagNode",
+    "Span",
     "Token",
+    "TokenTable",
     "TokenType",
 ]
@@ -100,6 +100,12 @@ class DuplicateIdentifierNode(ConstructorError):
     """
 
 
+class SchemaError(ConstructorError):
+    """
+    Raised when schema is not supported or loaded values do not match it.
+    """
+
+
 class RepresenterError(_MOONError):
     """
     Base representer error.
@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from enum import StrEnum, auto
 from typing import Optional, Union
 
+from .tokens import Span
+
 
 class EventType(StrEnum):
     # Base events
@@ -31,7 +33,8 @@ class Event:
     """
     Event means smth happened into file.
     Ex. object start, type defined, etc
+    Value of key and value events may be a span of source.
     """
 
     type: Union[EventType, str]
-    value: Optional[str] = None
+    value: Optional[Union[str, Span]] = None
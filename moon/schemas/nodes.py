@@ -8,6 +8,8 @@ from dataclasses import dataclass, field
 from enum import StrEnum, auto
 from typing import List, Union
 
+from .tokens import Span
+
 
 class NodeType(StrEnum):
     """AST node types."""
@@ -34,10 +36,11 @@ class ScalarNode(ASTNode):
     """
     Scalar value node.
     End of AST branch
+    Value is str or span of source materialized on construction.
     """
 
     type: NodeType = field(default=NodeType.scalar, init=False)
-    value: str
+    value: Union[str, Span]
 
 
 @dataclass(slots=True)
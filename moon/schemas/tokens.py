@@ -3,16 +3,20 @@
 Tokens schema. Token is a lexical part of text content.
 """
 
-from dataclasses import dataclass
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from enum import StrEnum, auto
-from typing import Optional
+from mmap import mmap
+from typing import Dict, Final, Iterator, Optional, Sequence, Tuple, Union, overload
 
 
 class TokenType(StrEnum):
     # Base tokens
     eof = auto()
-    space = auto()
     newline = auto()
+    indent = auto()  # Run of spaces at line start, width is value length
+    whitespace = auto()  # Run of spaces inside line
 
     # Literals
     word = auto()
@@ -27,17 +31,167 @@ class TokenType(StrEnum):
     d_quote = auto()  # "
 
 
+Buffer = Union[bytes, bytearray, memoryview, mmap]
+
+
+class Span:
+    """
+    Slice of normalized source, e.g. key or value of a pair.
+    Span is compared and hashed as its string, but the string is sliced
+    (and decoded for bytes source) only when span is materialized with `str`.
+    """
+
+    __slots__ = ("source", "start", "end")
+
+    def __init__(self, source: Union[str, Buffer], start: int, end: int) -> None:
+        self.source = source
+        self.start = start
+        self.end = end
+
+    def __str__(self) -> str:
+        value = self.source[self.start : self.end]
+        if isinstance(value, str):
+            return value
+        return str(value, "utf-8")
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Span, str)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+
+class LineIndex:
+    """
+    Index of lines starts of a document, filled once while tokenizing.
+    Resolves source offsets to line and column only when position is requested.
+    Columns of bytes source are counted in chars.
+    Lines are counted from `first_line` when indexed content is a part of document.
+    """
+
+    __slots__ = ("starts", "source", "base", "first_line")
+
+    def __init__(
+        self, source: Optional[Buffer] = None, base: int = 0, first_line: int = 1
+    ) -> None:
+        self.starts = array("I", [0])
+        self.source = source
+        self.base = base
+        self.first_line = first_line
+
+    def append(self, offset: int) -> None:
+        self.starts.append(offset)
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        """Resolve source offset to line and column."""
+        index = bisect_right(self.starts, offset)
+        start = self.starts[index - 1]
+        line = index + self.first_line - 1
+        if self.source is None:
+            return line, offset - start + 1
+        prefix = bytes(self.source[self.base + start : self.base + offset])
+        return line, len(prefix.decode("utf-8", errors="replace")) + 1
+
+
 @dataclass(slots=True)
 class Token:
     """
     Base class for all tokens.
+    Token stores only offset, line and column are resolved using lines index.
     """
 
     pos: int
-    line: int
-    column: int
     type: TokenType
     value: Optional[str] = None
+    lines: Optional[LineIndex] = field(default=None, compare=False, repr=False)
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        """Line and column of token."""
+        if self.lines is None:
+            return 1, self.pos
+        return self.lines.position(self.pos - 1)
+
+    @property
+    def line(self) -> int:
+        return self.position[0]
+
+    @property
+    def column(self) -> int:
+        return self.position[1]
 
     def __repr__(self) -> str:
-        return f"<Token '{self.value}' type: '{self.type}' at line {self.line} column {self.column}>"
+        line, column = self.position
+        return (
+            f"<Token '{self.value}' type: '{self.type}' at line {line} column {column}>"
+        )
+
+
+_token_types: Final[Tuple[TokenType, ...]] = tuple(TokenType)
+_token_codes: Final[Dict[TokenType, int]] = {t: i for i, t in enumerate(_token_types)}
+
+
+class TokenTable(Sequence[Token]):
+    """
+    Compact table of tokens. Tokens are stored as parallel arrays of offsets,
+    lengths and types codes into the source string, about 9 bytes per token.
+    Values are sliced only when requested.
+    `EventParser` and tag hooks `parse_table` walk it by indexes.
+    Token objects are created on access, so table can be passed everywhere
+    a stream of tokens is expected.
+    """
+
+    __slots__ = ("source", "offsets", "lengths", "types", "lines")
+
+    # Index of the first char of normalized content in source
+    offset: Final[int] = 0
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.offsets = array("I")
+        self.lengths = array("I")
+        self.types = array("B")
+        self.lines = LineIndex()
+
+    def type_at(self, index: int) -> TokenType:
+        return _token_types[self.types[index]]
+
+    def value_at(self, index: int) -> str:
+        offset = self.offsets[index]
+        return self.source[offset : offset + self.lengths[index]]
+
+    def offset_at(self, index: int) -> int:
+        return self.offsets[index]
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        """Resolve source offset to line and column."""
+        return self.lines.position(offset)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    @overload
+    def __getitem__(self, index: int) -> Token: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Token]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        offset = self.offsets[index]
+        return Token(
+            offset + 1,
+            _token_types[self.types[index]],
+            self.source[offset : offset + self.lengths[index]],
+            self.lines,
+        )
+
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(len(self.types)):
+            yield self[index]
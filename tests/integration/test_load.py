@@ -2,10 +2,20 @@
 Test full load pipeline and compares to JSON analogue.
 """
 
+import io
 import json
+from dataclasses import dataclass
 from pathlib import Path
 
+import pytest
+
 import moon
+from moon.schemas import (
+    ArgumentsError,
+    DuplicateIdentifierNode,
+    ParserError,
+    SchemaError,
+)
 from tests.conftest import BaseFactory
 
 
@@ -21,3 +31,174 @@ class TestLoad(BaseFactory):
         json_obj = json.loads(json_file.read_text())
         moon_file = fixtures_path / "mixed.moon"
         assert moon.load(fp=open(moon_file, "r")) == json_obj
+
+    def test_load_chunks_positive(self, fixtures_path: Path):
+        json_file = fixtures_path / "mixed.json"
+        json_obj = json.loads(json_file.read_text())
+        moon_file = fixtures_path / "mixed.moon"
+        assert moon.load(fp=moon_file, chunk_size=16) == json_obj
+        assert moon.load(fp=open(moon_file, "rb"), chunk_size=16) == json_obj
+
+    def test_load_mapped_positive(self, fixtures_path: Path):
+        json_file = fixtures_path / "mixed.json"
+        json_obj = json.loads(json_file.read_text())
+        moon_file = fixtures_path / "mixed.moon"
+        assert moon.load(fp=moon_file, memory_map=True) == json_obj
+        with open(moon_file, "rb") as f:
+            assert moon.load(fp=f, memory_map=True) == json_obj
+
+    def test_load_mapped_negative(self, tmp_path: Path):
+        moon_file = tmp_path / "bad.moon"
+        moon_file.write_text("@object n0\n    a: 1\n  b: 2\n")
+        with pytest.raises(ParserError, match="at 3:3") as error:
+            moon.load(fp=moon_file, memory_map=True)
+        # Traceback keeps locals of frames
+        assert error.traceback[-1].frame.f_locals
+        with open(moon_file, "rb") as f:
+            with pytest.raises(ParserError, match="at 3:3"):
+                moon.load(fp=f, memory_map=True)
+
+        moon_file.write_text("@object n0\n    a: 1\n@object n0\n")
+        with pytest.raises(DuplicateIdentifierNode):
+            moon.load(fp=moon_file, memory_map=True)
+
+    def test_load_fast_positive(self, fixtures_path: Path):
+        json_file = fixtures_path / "mixed.json"
+        json_obj = json.loads(json_file.read_text())
+        assert moon.load(fp=fixtures_path / "mixed.moon", fast=True) == json_obj
+
+    def test_load_lazy_positive(self, fixtures_path: Path):
+        json_file = fixtures_path / "mixed.json"
+        json_obj = json.loads(json_file.read_text())
+        lazy = moon.load(fp=fixtures_path / "mixed.moon", lazy=True)
+        assert list(lazy) == list(json_obj)
+        assert lazy.loaded == 0
+        name = next(iter(json_obj))
+        assert lazy[name] == json_obj[name]
+        assert lazy.loaded == 1
+        assert dict(lazy) == json_obj
+
+    def test_load_lazy_negative(self):
+        content = "@object a\n  x: 1\n@object b\n  y: 2\n y: 3"
+        lazy = moon.load(io.StringIO(content), lazy=True)
+        assert lazy["a"] == {"x": 1}
+        with pytest.raises(ParserError, match="at 5:2"):
+            lazy["b"]
+        with pytest.raises(KeyError):
+            lazy["c"]
+        with pytest.raises(DuplicateIdentifierNode):
+            moon.load(io.StringIO("@object a\n@object a"), lazy=True)
+        with pytest.raises(ArgumentsError):
+            moon.load(io.StringIO(content), lazy=True, fast=True)
+
+    def test_load_only_positive(self, fixtures_path: Path):
+        json_file = fixtures_path / "mixed.json"
+        json_obj = json.loads(json_file.read_text())
+        name = next(iter(json_obj))
+        only = moon.load(fp=fixtures_path / "mixed.moon", only=[name, "missing"])
+        assert only == {name: json_obj[name]}
+
+        content = "@object a\n  x: 1\n@object b\n    y: 2\n  z: 3"
+        assert moon.load(io.StringIO(content), only={"a"}) == {"a": {"x": 1}}
+        lazy = moon.load(io.StringIO(content), only={"b"}, lazy=True)
+        assert list(lazy) == ["b"]
+
+    def test_load_only_negative(self):
+        content = "@object a\n  x: 1\n@object b\n    y: 2\n  z: 3"
+        with pytest.raises(ParserError):
+            moon.load(io.StringIO(content), only=["b"])
+        with pytest.raises(DuplicateIdentifierNode):
+            moon.load(io.StringIO("@object a\n@object b\n@object a"), only=["b"])
+        with pytest.raises(ArgumentsError):
+            moon.load(io.StringIO(content), only="a")
+
+    def test_load_workers_positive(self, fixtures_path: Path):
+        json_file = fixtures_path / "mixed.json"
+        json_obj = json.loads(json_file.read_text())
+        assert moon.load(fp=fixtures_path / "mixed.moon", workers=2) == json_obj
+
+        content = "\n".join(
+            f"@object o{i}\n  key: {i}\n  nested:\n    a: b" for i in range(40)
+        )
+        expected = moon.load(io.StringIO(content))
+        assert moon.load(io.StringIO(content), workers=2) == expected
+        assert list(moon.load(io.StringIO(content), workers=2)) == list(expected)
+
+    def test_load_workers_negative(self):
+        content = "\n".join(f"@object o{i}\n  key: {i}" for i in range(40))
+        with pytest.raises(DuplicateIdentifierNode):
+            moon.load(io.StringIO(content + "\n@object o0"), workers=2)
+        with pytest.raises(ParserError, match="at 83:2"):
+            moon.load(io.StringIO(content + "\n@object x\n  a: 1\n b: 2"), workers=2)
+        with pytest.raises(ArgumentsError):
+            moon.load(io.StringIO(content), workers=0)
+        with pytest.raises(ArgumentsError):
+            moon.load(io.StringIO(content), workers=2, lazy=True)
+
+    def test_load_schema(self):
+        @dataclass
+        class Server:
+            host: str
+            port: int
+
+        content = "@object server\n  host: localhost\n  port: 8080"
+        expected = {"server": Server("localhost", 8080)}
+        assert moon.load(io.StringIO(content), schema={"server": Server}) == expected
+        assert (
+            moon.load(io.StringIO(content), schema={"server": Server}, chunk_size=8)
+            == expected
+        )
+        with pytest.raises(SchemaError):
+            moon.load(io.StringIO(content + "\n  tls: true"), schema={"server": Server})
+        with pytest.raises(ArgumentsError):
+            moon.load(io.StringIO(content), schema={"server": Server}, lazy=True)
+
+    def test_load_object_hooks(self, fixtures_path: Path):
+        expected = moon.load(fp=fixtures_path / "mixed.moon")
+        modes = [
+            {},
+            {"fast": True},
+            {"workers": 2},
+            {"chunk_size": 16},
+            {"memory_map": True},
+            {"only": list(expected)},
+        ]
+        for kwargs in modes:
+            records = moon.load(
+                fp=fixtures_path / "mixed.moon",
+                object_pairs_hook=moon.RecordFactory(),
+                **kwargs,
+            )
+            assert list(records) == list(expected)
+            assert all(not isinstance(value, dict) for value in records.values())
+
+        content = "@object me\n  a: 1\n  nested:\n    b: 2"
+        assert moon.load(io.StringIO(content), object_hook=len) == {"me": 2}
+
+        # Nested objects are made before objects holding them
+        seen = []
+
+        def hook(obj):
+            seen.append(obj)
+            assert not any(isinstance(value, dict) for value in obj.values())
+            return tuple(obj)
+
+        for kwargs in [{}, {"fast": True}, {"chunk_size": 4}]:
+            seen.clear()
+            document = moon.load(io.StringIO(content), object_hook=hook, **kwargs)
+            assert document == {"me": ("a", "nested")}
+            assert seen == [{"b": 2}, {"a": 1, "nested": ("b",)}]
+        with pytest.raises(ArgumentsError):
+            moon.load(io.StringIO(content), object_hook=len, lazy=True)
+
+    def test_load_intern(self, fixtures_path: Path):
+        expected = moon.load(fp=fixtures_path / "mixed.moon")
+        strings = moon.InternTable(max_value_length=8)
+        for kwargs in [{}, {"fast": True}, {"chunk_size": 16}]:
+            assert (
+                moon.load(fp=fixtures_path / "mixed.moon", intern=strings, **kwargs)
+                == expected
+            )
+        assert strings.distinct_keys > 0
+        with pytest.raises(ArgumentsError):
+            moon.load(fp=fixtures_path / "mixed.moon", intern=strings, workers=2)
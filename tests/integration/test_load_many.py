@@ -0,0 +1,53 @@
+"""
+Test bulk loading of many files.
+"""
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import moon
+from moon.schemas import ArgumentsError, ParserError, ReadError
+from tests.conftest import BaseFactory
+
+
+class TestLoadMany(BaseFactory):
+    @pytest.fixture()
+    def paths(self, tmp_path: Path) -> List[Path]:
+        paths = []
+        for i in range(20):
+            path = tmp_path / f"tenant_{i}.moon"
+            path.write_text(f"@object tenant\n  id: {i}\n  name: t{i}")
+            paths.append(path)
+        return paths
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_load_many_positive(self, paths: List[Path], executor: str):
+        loaded = moon.load_many(paths, workers=2, executor=executor)
+        assert list(loaded) == paths
+        assert all(loaded[path] == moon.load(path) for path in paths)
+
+        streamed = dict(moon.iter_load_many(paths, workers=2, executor=executor))
+        assert streamed == loaded
+
+    def test_load_many_errors(self, paths: List[Path], tmp_path: Path):
+        broken = tmp_path / "broken.moon"
+        broken.write_text("@object broken\n    a: 1\n  b: 2")
+        missing = tmp_path / "missing.moon"
+
+        loaded = moon.load_many([*paths, broken, missing], errors="collect")
+        assert isinstance(loaded[broken], ParserError)
+        assert isinstance(loaded[missing], ReadError)
+        assert loaded[paths[0]] == {"tenant": {"id": 0, "name": "t0"}}
+
+        with pytest.raises(ParserError):
+            moon.load_many([*paths, broken], executor="process", workers=2)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"executor": "fiber"}, {"errors": "ignore"}, {"workers": 0}],
+    )
+    def test_load_many_negative(self, paths: List[Path], kwargs: dict):
+        with pytest.raises(ArgumentsError):
+            moon.iter_load_many(paths, **kwargs)
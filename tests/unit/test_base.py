@@ -0,0 +1,66 @@
+"""
+Test streaming stages base.
+"""
+
+from typing import Iterator, List
+
+import pytest
+
+from moon.core.base import END, LookaheadStreamer
+from moon.schemas import ArgumentsError
+from tests.conftest import BaseFactory
+
+
+class Streamer(LookaheadStreamer[int, int]):
+    def __iter__(self) -> Iterator[int]:
+        item = self.read()
+        while item is not END:
+            yield item
+            item = self.next()
+
+
+@pytest.mark.order(1)
+class TestLookaheadStreamer(BaseFactory):
+    @pytest.mark.parametrize("items", [[], [0], [1, 2, 3], [0, None, "", 0]])
+    def test_streamer_positive(self, items: List[int]):
+        assert list(Streamer(items)) == items
+        assert list(Streamer(iter(items))) == items
+
+    def test_streamer_lookahead(self):
+        streamer = Streamer([1, 2, 3])
+        assert streamer.peek(2) == 3
+        assert streamer.read() == 1
+        assert streamer.peek() == 2
+        assert streamer.next() == 2
+        assert streamer.peek(2) is END
+        assert streamer.next() == 3
+        assert streamer.peek() is END
+        assert streamer.next() is END
+        assert streamer.next() is END
+        assert streamer.read() is END
+
+    def test_streamer_reset(self):
+        streamer = Streamer(range(6))
+        streamer.next()
+        mark = streamer.mark()
+        streamer.next()
+        inner = streamer.mark()
+        streamer.peek(2)
+        streamer.next()
+        streamer.reset(inner)
+        assert streamer.read() == 2
+        streamer.reset(mark)
+        assert list(streamer) == [1, 2, 3, 4, 5]
+        streamer.reset(mark)
+        streamer.release()
+        assert list(streamer) == [1, 2, 3, 4, 5]
+        assert streamer.read() is END
+
+    @pytest.mark.parametrize("k", [0, -1, 4])
+    def test_streamer_negative(self, k: int):
+        with pytest.raises(ArgumentsError):
+            Streamer([1, 2, 3]).peek(k)
+        with pytest.raises(ArgumentsError):
+            Streamer([1, 2, 3]).reset(0)
+        with pytest.raises(ArgumentsError):
+            Streamer(1)
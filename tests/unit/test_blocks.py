@@ -0,0 +1,63 @@
+"""
+Test top-level blocks scanner.
+"""
+
+from typing import List, Optional, Tuple
+
+import pytest
+
+from moon.core.blocks import block_comments, scan_blocks
+from moon.core.tokenizer import _scanner
+from tests.conftest import BaseFactory
+
+
+@pytest.mark.order(2)
+class TestBlocks(BaseFactory):
+    @pytest.mark.parametrize(
+        ["content", "expected"],
+        [
+            ["@object me", [("me", 0, 10)]],
+            [
+                "// head\n@object me\n  key: 1\n  @object you // c\n@x: 1",
+                [("me", 8, 28), ("you", 28, 52)],
+            ],
+            [
+                "@object me\n/*\n@object you\n*/\n@object",
+                [("me", 0, 29), (None, 29, 36)],
+            ],
+            ["@object //c\n@unknown me\nkey: @object x", [(None, 0, 38)]],
+            # Comment start inside a word is a word
+            ["@object me\n  glob: a/*\n@object you", [("me", 0, 23), ("you", 23, 34)]],
+            ["@object me\n  glob: /*.txt\n@object you", [("me", 0, 37)]],
+            ["key: 1\n", []],
+        ],
+    )
+    def test_scan_blocks(
+        self, content: str, expected: List[Tuple[Optional[str], int, int]]
+    ):
+        blocks = scan_blocks(content)
+        assert [(block.name, block.start, block.end) for block in blocks] == expected
+        assert all(block.tag == "@object" for block in blocks)
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "a/* b */ /* c\n*/",
+            "/* a *//* b\n*/ x/* c",
+            "// /* a\n'/*' b */ c",
+            "a //* b\n:/*/ c",
+            ",/*",
+        ],
+    )
+    def test_block_comments(self, content: str):
+        expected = [
+            (match.start(), match.end())
+            for match in _scanner.finditer(content)
+            if match.lastgroup == "comment" and match.group().startswith("/*")
+        ]
+        comments = list(block_comments(content))
+        assert [(match.start(), match.end()) for match in comments] == expected
+        assert [match.group("open") is not None for match in comments] == [
+            not match.group().endswith("*/") or len(match.group()) < 4
+            for match in comments
+        ]
@@ -0,0 +1,75 @@
+"""
+Test loaded documents cache.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+import moon
+from moon.core.cache import Cache
+from moon.schemas import ArgumentsError, ReadError
+from tests.conftest import BaseFactory
+
+
+def write(path: Path, content: str, mtime_ns: int) -> None:
+    path.write_text(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.mark.order(6)
+class TestCache(BaseFactory):
+    def test_cache_copy(self, tmp_path: Path):
+        path = tmp_path / "a.moon"
+        write(path, "@object a\n  port: 1", 10**18)
+        cache = Cache()
+        first = moon.load(path, cache=cache)
+        first["a"]["port"] = 2
+        assert moon.load(str(path), cache=cache) == {"a": {"port": 1}}
+        assert cache.stats()[:4] == (1, 1, 0, 1)
+
+        write(path, "@object a\n  port: 3", 2 * 10**18)
+        assert moon.load(path, cache=cache) == {"a": {"port": 3}}
+        assert cache.stats().misses == 2
+
+    def test_cache_view(self, tmp_path: Path):
+        path = tmp_path / "a.moon"
+        write(path, "@object a\n  nested:\n    port: 1", 10**18)
+        cache = Cache(copy=False)
+        view = moon.load(path, cache=cache)
+        assert moon.load(path, cache=cache) is view
+        with pytest.raises(TypeError):
+            view["a"]["nested"]["port"] = 2
+
+    def test_cache_eviction(self, tmp_path: Path):
+        cache = Cache(max_entries=2)
+        paths = [tmp_path / f"{i}.moon" for i in range(3)]
+        for i, path in enumerate(paths):
+            path.write_text(f"@object a\n  key: {i}")
+            moon.load(path, cache=cache)
+        moon.load(paths[0], cache=cache)
+        stats = cache.stats()
+        assert (stats.misses, stats.evictions, stats.entries) == (4, 2, 2)
+
+        cache = Cache(max_bytes=cache.stats().bytes // 2 + 1)
+        for path in paths:
+            moon.load(path, cache=cache)
+        assert len(cache) == 1
+        assert cache.stats().bytes <= cache.max_bytes
+        cache.clear()
+        assert cache.stats() == (0, 0, 0, 0, 0)
+
+    def test_cache_negative(self, tmp_path: Path):
+        path = tmp_path / "a.moon"
+        path.write_text("@object a\n  key: 1")
+        with pytest.raises(ArgumentsError):
+            Cache(max_entries=0)
+        with pytest.raises(ArgumentsError):
+            moon.load(path, cache=Cache(), lazy=True)
+        with pytest.raises(ArgumentsError):
+            moon.load(path, cache="yes")
+        with path.open() as f, pytest.raises(ArgumentsError):
+            moon.load(f, cache=True)
+        with pytest.raises(ReadError):
+            moon.load(tmp_path / "missing.moon", cache=True)
@@ -5,7 +5,7 @@ Test final Python dict constructor. Turns AST into Python dict.
 import pytest
 
 from moon.core.composer import ASTComposer
-from moon.core.constructor import construct
+from moon.core.constructor import construct, construct_events
 from moon.core.parser import EventParser
 from moon.core.tokenizer import Tokenizer
 from moon.schemas import ConstructorError
@@ -30,17 +30,26 @@ class TestConstructor(BaseFactory):
                 "@object me\nkey1: value1\n\n@object you\nkey2: value2",
                 {"me": {"key1": "value1"}, "you": {"key2": "value2"}},
             ],
+            [
+                "@object me\n  key1:\n    key2:  a  b \n  \n  key3: c",
+                {"me": {"key1": {"key2": "a  b "}, "key3": "c"}},
+            ],
         ],
     )
     def test_constructor_positive(self, content: str, expected: object):
         assert construct(ASTComposer(EventParser(Tokenizer(content)))) == expected
+        assert construct_events(EventParser(Tokenizer(content))) == expected
 
     @pytest.mark.parametrize(
         "content",
         [
             "@object me\n@object me",
+            "@object me\nkey: 1\nkey: 2",
+            "@object me\nkey:\n  a: 1\n  a: 2",
         ],
     )
     def test_constructor_negative(self, content: str):
         with pytest.raises(ConstructorError):
             construct(ASTComposer(EventParser(Tokenizer(content))))
+        with pytest.raises(ConstructorError):
+            construct_events(EventParser(Tokenizer(content)))
@@ -0,0 +1,92 @@
+"""
+Test on-disk cache of loaded documents.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+import moon
+from moon.core.diskcache import CACHE_DIR, SUFFIX, DiskCache, setup_digest
+from moon.hooks.tags.object import ObjectHook
+from moon.schemas import ArgumentsError
+from tests.conftest import BaseFactory
+
+CONTENT = "@object a\n  port: 1\n  nested:\n    ratio: 0.5\n    on: true"
+
+
+@pytest.mark.order(6)
+class TestDiskCache(BaseFactory):
+    def test_disk_cache_positive(self, tmp_path: Path):
+        path = tmp_path / "a.moon"
+        path.write_text(CONTENT)
+        cache = DiskCache()
+        expected = moon.load(path)
+        assert moon.load(path, disk_cache=cache) == expected
+        assert (tmp_path / CACHE_DIR / ("a.moon" + SUFFIX)).is_file()
+        assert moon.load(str(path), disk_cache=cache) == expected
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # Same content with other stat is checked by hash
+        os.utime(path, ns=(10**18, 10**18))
+        assert moon.load(path, disk_cache=cache) == expected
+        assert cache.hits == 2
+
+        path.write_text(CONTENT.replace("1", "2"))
+        os.utime(path, ns=(2 * 10**18, 2 * 10**18))
+        assert moon.load(path, disk_cache=cache)["a"]["port"] == 2
+        assert cache.misses == 2
+
+    def test_disk_cache_directory(self, tmp_path: Path):
+        path = tmp_path / "a.moon"
+        path.write_text(CONTENT)
+        cache = DiskCache(tmp_path / "cache")
+        moon.load(path, disk_cache=cache, cache=moon.Cache())
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+
+        cache_file = next((tmp_path / "cache").iterdir())
+        cache_file.write_bytes(b"MOON broken")
+        assert moon.load(path, disk_cache=cache) == moon.load(path)
+        assert cache.misses == 2
+
+    def test_disk_cache_read_once(self, tmp_path: Path):
+        path = tmp_path / "a.moon"
+        path.write_text(CONTENT)
+        cache = DiskCache()
+        read = []
+
+        def loader(source):
+            # Loader gets content read for hash instead of the path
+            read.append(source.read())
+            return {"a": 1}
+
+        assert cache.load(path, None, loader) == {"a": 1}
+        assert read == [CONTENT.encode()]
+        assert cache.load(path, None, loader) == {"a": 1}
+        assert len(read) == 1
+
+    def test_disk_cache_hook_version(self, tmp_path: Path, monkeypatch):
+        path = tmp_path / "a.moon"
+        path.write_text(CONTENT)
+        cache = DiskCache()
+        digest = setup_digest(None)
+        moon.load(path, disk_cache=cache)
+        monkeypatch.setattr(ObjectHook, "version", ObjectHook.version + 1)
+        assert setup_digest(None) != digest
+        moon.load(path, disk_cache=cache)
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_disk_cache_negative(self, tmp_path: Path):
+        path = tmp_path / "a.moon"
+        path.write_text(CONTENT)
+        cache = DiskCache(tmp_path / "cache")
+        with pytest.raises(ArgumentsError):
+            moon.load(path, disk_cache=cache, object_hook=len)
+        with pytest.raises(ArgumentsError):
+            moon.load(path, disk_cache="yes")
+        with pytest.raises(ArgumentsError):
+            DiskCache(1)
+        with path.open() as f, pytest.raises(ArgumentsError):
+            moon.load(f, disk_cache=True)
+        assert not (tmp_path / "cache").exists()
@@ -0,0 +1,149 @@
+"""
+Test editable document.
+"""
+
+import io
+from typing import List
+
+import pytest
+
+import moon
+from moon.core.composer import ASTComposer
+from moon.core.document import Document
+from moon.core.parser import EventParser
+from moon.core.tokenizer import Tokenizer
+from moon.schemas import ArgumentsError, ASTNode, DuplicateIdentifierNode, ParserError
+from tests.conftest import BaseFactory
+
+CONTENT = (
+    "// head\n@object a\n  key: 1\n\n@object b\n  nested:\n    key: 2\n\n"
+    "@object c\n  key: 3\n"
+)
+
+
+def compose(content: str) -> List[ASTNode]:
+    return list(ASTComposer(EventParser(Tokenizer(content))))
+
+
+@pytest.mark.order(6)
+class TestDocument(BaseFactory):
+    @pytest.mark.parametrize(
+        ["old", "new", "parsed", "names"],
+        [
+            # Value of a block
+            ["key: 2", "key: 20", 1, ["b"]],
+            # New block inside of a block
+            ["    key: 2\n", "    key: 2\n@object d\n  key: 4\n", 2, ["b", "d"]],
+            # Tag line removed, block joins the previous one
+            ["@object b\n", "", 1, ["a"]],
+            # Newline before a tag line removed, blocks are joined
+            ["key: 1\n\n", "key: 1 ", 1, ["a"]],
+            # Text before a tag line joins it to the previous block
+            ["@object c", "x@object c", 1, []],
+            # Block comment hides tag lines of next blocks
+            ["// head\n", "/* head\n", 1, []],
+        ],
+    )
+    def test_apply_edit_positive(
+        self, old: str, new: str, parsed: int, names: List[str]
+    ):
+        doc = Document(CONTENT)
+        assert doc.parsed == 4
+        start = CONTENT.index(old)
+        if old.startswith("// head"):
+            content = CONTENT.replace(old, new) + "*/\n"
+            doc.apply_edit(len(CONTENT), len(CONTENT), "*/\n")
+            doc.apply_edit(start, start + len(old), new)
+            assert doc.parsed == 1
+        else:
+            content = CONTENT.replace(old, new)
+            nodes = doc.apply_edit(start, start + len(old), new)
+            # Only nodes of reparsed blocks are returned, they are nodes of document
+            assert [node.name for node in nodes] == names
+            assert all(any(node is other for other in doc.nodes) for node in nodes)
+            assert doc.parsed == parsed
+
+        assert doc.text == content
+        if doc.errors:
+            with pytest.raises(type(doc.errors[0])):
+                compose(content)
+        else:
+            assert doc.nodes == compose(content)
+            assert doc.to_python() == moon.load(io.StringIO(content))
+
+    def test_apply_edit_lines(self):
+        doc = Document(CONTENT)
+        doc.apply_edit(0, 0, "// one\n// two\n")
+        assert doc.parsed == 1
+        # Tokens of not changed blocks are shifted to lines of document
+        tags = [
+            token for table in doc.tokens for token in table if token.value == "@object"
+        ]
+        assert [token.line for token in tags] == [4, 7, 11]
+
+        broken = "  key: 3\n bad: 1\n"
+        doc.apply_edit(len(doc.text), len(doc.text), " bad: 1\n")
+        assert len(doc.errors) == 1
+        assert isinstance(doc.errors[0], ParserError)
+        with pytest.raises(ParserError):
+            doc.to_python()
+
+        # Errors of blocks after an edit move with their lines, without reparse
+        error = doc.errors[0]
+        assert str(error).endswith("at 13:2")
+        doc.apply_edit(0, 0, "// three\n")
+        assert doc.parsed == 1
+        assert doc.errors == [error]
+        assert str(error).endswith("at 14:2")
+        assert [str(e) for e in doc.errors] == [
+            str(e) for e in Document(doc.text).errors
+        ]
+        doc.apply_edit(0, len("// three\n"), "")
+
+        doc.apply_edit(len(doc.text) - len(broken), len(doc.text), "  key: 3\n")
+        assert not doc.errors
+        assert doc.to_python() == moon.load(io.StringIO(CONTENT))
+
+    def test_apply_edit_raw(self):
+        # Offsets are offsets of text as given, not of normalized one
+        content = "\n\n" + CONTENT.replace("\n", "\r\n")
+        doc = Document(content)
+        assert doc.text == content
+        start = content.index("key: 2")
+        doc.apply_edit(start + len("key: "), start + len("key: 2"), "20")
+        assert doc.parsed == 1
+        assert doc.text == content.replace("key: 2", "key: 20")
+        expected = moon.load(io.StringIO(CONTENT.replace("key: 2", "key: 20")))
+        assert doc.to_python() == expected
+
+        # Editor buffer starts empty
+        doc = Document()
+        assert (doc.text, doc.nodes, doc.errors) == ("", [], [])
+        assert doc.to_python() == {}
+        for i, char in enumerate(CONTENT):
+            doc.apply_edit(i, i, char)
+        assert doc.text == CONTENT
+        assert doc.to_python() == moon.load(io.StringIO(CONTENT))
+
+    def test_apply_edit_negative(self):
+        doc = Document(CONTENT)
+        size = len(CONTENT)
+        for start, end in [(-1, 0), (2, 1), (0, size + 1)]:
+            with pytest.raises(ArgumentsError):
+                doc.apply_edit(start, end, "")
+        with pytest.raises(ArgumentsError):
+            doc.apply_edit(0, 0, None)
+        with pytest.raises(ArgumentsError):
+            Document(None)
+
+        doc.apply_edit(size, size, "@object a\n  key: 5\n")
+        assert not doc.errors
+        with pytest.raises(DuplicateIdentifierNode):
+            doc.to_python()
+
+        # Whole text replaced and typed again
+        doc.apply_edit(0, len(doc.text), "")
+        assert doc.nodes == []
+        assert doc.to_python() == {}
+        doc.apply_edit(0, 0, CONTENT)
+        assert doc.to_python() == moon.load(io.StringIO(CONTENT))
@@ -58,6 +58,31 @@ class TestEmitter(BaseFactory):
     def test_emitter_positive(self, events: List[Event], expected: str):
         assert "".join(list(EventEmitter(events))) == expected
 
+    def test_emitter_chunks_positive(self):
+        depth = 20
+        events = [
+            Event(type=EventType.tag_start, value="@object"),
+            Event(type=EventType.ident, value="me"),
+        ]
+        for level in range(depth):
+            events.append(Event(type=EventType.key, value=f"key{level}"))
+            events.append(Event(type=EventType.nesting_start))
+        events.append(Event(type=EventType.key, value="last"))
+        events.append(Event(type=EventType.value, value="value"))
+        events.extend(Event(type=EventType.nesting_end) for _ in range(depth))
+        events.append(Event(type=EventType.key, value="after"))
+        events.append(Event(type=EventType.value, value="value"))
+        events.append(Event(type=EventType.tag_end, value="@object"))
+        events.append(Event(type=EventType.document_end))
+
+        chunks = list(EventEmitter(events))
+        lines = "".join(chunks).splitlines()
+        assert lines[0] == "@object me"
+        assert lines[depth + 1] == " " * 4 * (depth + 1) + "last: value"
+        assert lines[-1] == "    after: value"
+        # Tag text is emitted by fragments of lines
+        assert max(len(chunk) for chunk in chunks) < len(lines[depth + 1]) + 1
+
     @pytest.mark.parametrize(
         "events",
         [
@@ -0,0 +1,52 @@
+"""
+Test @object fast path. Should build the same dict as general pipeline.
+"""
+
+import pytest
+
+from moon.core.composer import ASTComposer
+from moon.core.constructor import construct
+from moon.core.fastpath import fast_construct
+from moon.core.parser import EventParser
+from moon.core.tokenizer import Tokenizer
+from moon.schemas import TokenizerError
+from tests.conftest import BaseFactory
+
+
+@pytest.mark.order(5)
+@pytest.mark.dependency(depends=["construct_ok"], scope="session")
+class TestFastPath(BaseFactory):
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "@object me",
+            "@object me\nkey1: value1",
+            "@object me // comment\n  key1: value1 // comment\n  key2:v//c",
+            "@object me\n  key1: a, 'b' c  \n  key2: 10\n  key3: http://host",
+            "@object me\nkey1:\n    key2: 1.5\n        key3: null\nkey4: true",
+            "  // comment\n\n@object me\n  key1: x\n    key2: y\n\n@object you",
+            "@object me\n  @key: value\n    nested: 1\n  key2:",
+        ],
+    )
+    def test_fast_path_positive(self, content: str):
+        expected = construct(ASTComposer(EventParser(Tokenizer(content))))
+        assert fast_construct(content) == expected
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "@object me /* comment */\nkey1: value1",
+            "@object me\nkey1: value1\nkey1: value2",
+            "@object me\n@object me",
+            "@object me\n    key1: value1\n  key2: value2",
+            "@object me\nkey1 value1",
+            "key1: value1",
+            "@unexistingtag me\nkey1: value1",
+        ],
+    )
+    def test_fast_path_fallback(self, content: str):
+        assert fast_construct(content) is None
+
+    def test_fast_path_negative(self):
+        with pytest.raises(TokenizerError):
+            fast_construct("")
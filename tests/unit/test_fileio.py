@@ -9,7 +9,7 @@ from pathlib import Path
 import pytest
 
 from moon.core import fileio
-from moon.schemas import ReadError, WriteError
+from moon.schemas import ArgumentsError, ReadError, WriteError
 from tests.conftest import BaseFactory
 from tests.utils import compare_files, compare_strings
 
@@ -43,12 +43,87 @@ class TestFileIO(BaseFactory):
         str_buffer.seek(0)
         assert compare_strings(fileio.read(fp=str_buffer), moon_text)
 
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+    def test_read_chunks_positive(self, fixtures_path: Path, chunk_size: int):
+        moon_file = fixtures_path / "mixed.moon"
+        moon_text = moon_file.read_text()
+        chunks = list(fileio.read_chunks(fp=moon_file, chunk_size=chunk_size))
+        assert all(len(chunk) <= chunk_size for chunk in chunks)
+        assert compare_strings("".join(chunks), moon_text)
+
+        str_buffer = io.StringIO(moon_text)
+        chunks = fileio.read_chunks(fp=str_buffer, chunk_size=chunk_size)
+        assert compare_strings("".join(chunks), moon_text)
+
+        # Multibyte chars split between chunks
+        bytes_buffer = io.BytesIO("ключ: значение".encode("utf-8"))
+        chunks = fileio.read_chunks(fp=bytes_buffer, chunk_size=chunk_size)
+        assert "".join(chunks) == "ключ: значение"
+
+    def test_read_chunks_negative(self):
+        with pytest.raises(ReadError):
+            fileio.read_chunks(fp="path/to/somthing.moon")
+
+        with pytest.raises(ReadError):
+            list(fileio.read_chunks(fp=io.BytesIO(b"\xff\xfe\xfa")))
+
+    def test_map_file_positive(self, fixtures_path: Path):
+        moon_file = fixtures_path / "mixed.moon"
+        moon_bytes = moon_file.read_bytes()
+        with fileio.map_file(fp=moon_file) as mapped:
+            assert mapped[:] == moon_bytes
+
+        with open(moon_file, "rb") as f:
+            with fileio.map_file(fp=f) as mapped:
+                assert mapped[:] == moon_bytes
+
+        with fileio.map_file(fp=io.BytesIO(moon_bytes)) as mapped:
+            assert mapped == moon_bytes
+
+        empty_path = Path(tempfile.gettempdir()) / "empty.moon"
+        empty_path.write_bytes(b"")
+        with fileio.map_file(fp=empty_path) as mapped:
+            assert mapped == b""
+
+    def test_map_file_negative(self, fixtures_path: Path):
+        with pytest.raises(ReadError):
+            with fileio.map_file(fp="path/to/somthing.moon"):
+                pass
+
+        with pytest.raises(ArgumentsError):
+            with fileio.map_file(fp=io.StringIO("@object me")):
+                pass
+
+        with pytest.raises(ArgumentsError):
+            with fileio.map_file(fp=fixtures_path / "mixed.moon", encoding="cp1251"):
+                pass
+
     def test_write_path_positive(self, fixtures_path: Path):
         moon_path = Path(tempfile.gettempdir()) / "mixed.moon"
         moon_text = (fixtures_path / "mixed.moon").read_text()
         fileio.write(moon_text, fo=moon_path)
         assert compare_files(moon_path, fixtures_path / "mixed.moon")
 
+    @pytest.mark.parametrize("buffer_size", [1, 10, 4096])
+    def test_write_chunks_positive(self, buffer_size: int):
+        writes = []
+
+        class Buffer(io.StringIO):
+            def write(self, s: str) -> int:
+                writes.append(s)
+                return super().write(s)
+
+        chunks = ["key", ": ", "value\n"] * 100
+        fo = Buffer()
+        fileio.write(iter(chunks), fo=fo, buffer_size=buffer_size)
+        assert fo.getvalue() == "".join(chunks)
+        assert all(len(block) >= buffer_size for block in writes[:-1])
+        if buffer_size > 1:
+            assert len(writes) < len(chunks)
+
+        with pytest.raises(ArgumentsError):
+            fileio.write(chunks, fo=fo, buffer_size=0)
+
     @pytest.mark.parametrize(
         "file_path",
         ["not/existing/path/somthing.moon", tempfile.gettempdir()],
@@ -0,0 +1,46 @@
+"""
+Test strings interning.
+"""
+
+import pytest
+
+from moon.core.constructor import construct_events
+from moon.core.fastpath import fast_construct
+from moon.core.intern import InternTable
+from moon.core.parser import EventParser
+from moon.core.tokenizer import Tokenizer
+from moon.schemas import ArgumentsError
+from tests.conftest import BaseFactory
+
+CONTENT = (
+    "@object a\n  host: db.internal\n  port: 1\n  tls:\n    host: db.internal\n\n"
+    "@object b\n  host: db.internal\n  port: 2"
+)
+
+
+@pytest.mark.order(5)
+class TestIntern(BaseFactory):
+    def test_intern_keys(self):
+        strings = InternTable()
+        res = construct_events(EventParser(Tokenizer(CONTENT)), strings)
+        keys_a, keys_b = list(res["a"]), list(res["b"])
+        assert keys_a[0] is keys_b[0] and keys_a[1] is keys_b[1]
+        assert next(iter(res["a"]["tls"])) is keys_a[0]
+        assert strings.distinct_keys == 3
+        assert strings.distinct_values == 0
+
+    def test_intern_values(self):
+        strings = InternTable(max_value_length=16)
+        for res in (
+            construct_events(EventParser(Tokenizer(CONTENT)), strings),
+            fast_construct(CONTENT, strings),
+        ):
+            assert res["a"]["host"] is res["b"]["host"]
+            assert res["a"]["tls"]["host"] is res["b"]["host"]
+        assert strings.distinct_keys == 3
+        assert strings.distinct_values == 1
+
+    @pytest.mark.parametrize("max_value_length", [-1, 1.5, True])
+    def test_intern_negative(self, max_value_length: object):
+        with pytest.raises(ArgumentsError):
+            InternTable(max_value_length)
@@ -2,13 +2,21 @@
 Test Event parser. Should get tokens and return events.
 """
 
-from typing import List
+import re
+from typing import List, Tuple
 
 import pytest
 
 from moon.core.parser import EventParser
 from moon.core.tokenizer import Tokenizer
-from moon.schemas import Event, EventType, ParserError
+from moon.hooks.tags import ObjectHook, TagHook
+from moon.schemas import (
+    Event,
+    EventType,
+    LevelIndentationError,
+    ParserError,
+    Span,
+)
 from tests.conftest import BaseFactory
 
 
@@ -51,6 +59,7 @@ class TestParser(BaseFactory):
     )
     def test_parser_positive(self, content: str, expected: List[Event]):
         assert list(EventParser(Tokenizer(content))) == expected
+        assert list(EventParser(Tokenizer(content).tabulate())) == expected
 
     @pytest.mark.parametrize(
         "content",
@@ -61,5 +70,59 @@ class TestParser(BaseFactory):
         ],
     )
     def test_parser_negative(self, content: str):
-        with pytest.raises(ParserError):
+        with pytest.raises(ParserError) as streamed:
             list(EventParser(Tokenizer(content)))
+        with pytest.raises(type(streamed.value), match=re.escape(str(streamed.value))):
+            list(EventParser(Tokenizer(content).tabulate()))
+
+    def test_parser_error_position(self):
+        content = "@object me\n    a: 1\n  b: 2"
+        with pytest.raises(LevelIndentationError, match="at 3:3"):
+            list(EventParser(Tokenizer(content)))
+        with pytest.raises(LevelIndentationError, match="at 5:3"):
+            list(EventParser(Tokenizer(content, first_line=3).tabulate()))
+
+    def test_parser_table_fallback(self):
+        # Hooks without `parse_table` parse token objects of the table
+        content = "@object me\n  a: 1\n  b:\n    c: 2\n@object you"
+        table = Tokenizer(content).tabulate()
+        parse_table = TagHook.parse_table.__func__
+
+        def events(parser) -> Tuple[List[Tuple[EventType, str]], int]:
+            stream = parser(ObjectHook, table, 1)
+            res = []
+            while True:
+                try:
+                    event = next(stream)
+                except StopIteration as stop:
+                    return res, stop.value
+                res.append((event.type, str(event.value)))
+
+        expected = events(ObjectHook.parse_table.__func__)
+        assert events(parse_table) == expected
+        assert table.value_at(expected[1]) == "@object"
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "\ufeff@object me\r\n  ключ : x,  y // c\r\n  b:\r\n  c: 1 ",
+            "\ufeff@object me\r\n  ключ : x,  y // c\r\n  b:\r\n  c: 1 ".encode(),
+        ],
+    )
+    def test_parser_spans(self, source):
+        events = list(EventParser(Tokenizer(source)))
+        values = [e.value for e in events if e.type in [EventType.key, EventType.value]]
+        assert all(isinstance(value, Span) for value in values)
+        assert [str(value) for value in values] == [
+            "ключ",
+            "x,  y ",
+            "b",
+            "",
+            "c",
+            "1 ",
+        ]
+        assert values[0] == "ключ" and hash(values[0]) == hash("ключ")
+
+        chunked = list(EventParser(Tokenizer(iter(["@object me\n  a: ", "1"]))))
+        assert [e.value for e in chunked][2:4] == ["a", "1"]
+        assert not any(isinstance(e.value, Span) for e in chunked)
@@ -0,0 +1,83 @@
+"""
+Test objects factories.
+"""
+
+import io
+from collections import OrderedDict
+from typing import Any, Dict
+
+import pytest
+
+import moon
+from moon.core.constructor import construct_events
+from moon.core.parser import EventParser
+from moon.core.records import RecordFactory, convert_objects, object_factory
+from moon.core.tokenizer import Tokenizer
+from moon.schemas import ArgumentsError
+from tests.conftest import BaseFactory
+
+DOCUMENT: Dict[str, Any] = {
+    "a": {"id": 1, "pos": {"x": 1, "y": 2}},
+    "b": {"id": 2, "pos": {"x": 3, "y": 4}},
+    "c": {"class": 1, "my-key": 2},
+}
+
+
+@pytest.mark.order(6)
+class TestRecords(BaseFactory):
+    @pytest.mark.parametrize("kind", ["slots", "namedtuple"])
+    def test_records_positive(self, kind: str):
+        factory = RecordFactory(kind)
+        converted = convert_objects(DOCUMENT, object_pairs_hook=factory)
+        assert converted["a"].pos.y == 2
+        assert type(converted["a"]) is type(converted["b"])
+        assert type(converted["a"].pos) is type(converted["b"].pos)
+        assert converted["c"] == DOCUMENT["c"]
+        assert factory.classes == 2
+        if kind == "slots":
+            assert not hasattr(converted["a"], "__dict__")
+        else:
+            assert converted["a"]._asdict()["id"] == 1
+
+    def test_records_hooks(self):
+        converted = convert_objects(DOCUMENT, object_hook=OrderedDict)
+        assert type(converted["a"]["pos"]) is OrderedDict
+        assert converted == DOCUMENT
+
+        converted = convert_objects(
+            DOCUMENT, object_hook=OrderedDict, object_pairs_hook=list
+        )
+        assert converted["a"] == [("id", 1), ("pos", [("x", 1), ("y", 2)])]
+
+    def test_records_built(self):
+        content = "@object a\n  id: 1\n  pos:\n    x: 1\n    y: 2\n@object b\n  id: 2"
+        document = construct_events(EventParser(Tokenizer(content)))
+        factory = RecordFactory()
+        built = construct_events(
+            EventParser(Tokenizer(content)),
+            objects=object_factory(object_pairs_hook=factory),
+        )
+        assert built["a"].pos.x == 1
+        assert built == convert_objects(document, object_pairs_hook=factory)
+        assert factory.classes == 3
+        assert object_factory() is None
+        assert convert_objects(document) is document
+
+    @pytest.mark.parametrize("kind", ["slots", "namedtuple"])
+    @pytest.mark.parametrize(
+        "key", ["__init__", "__class__", "__dict__", "__slots__", "__x__"]
+    )
+    def test_records_reserved(self, kind: str, key: str):
+        content = f"@object me\n  {key}: 1\n  b:\n    c: 2"
+        document = moon.load(
+            io.StringIO(content), object_pairs_hook=RecordFactory(kind)
+        )
+        assert document["me"][key] == 1
+        assert document["me"]["b"].c == 2
+
+    def test_records_negative(self):
+        with pytest.raises(ArgumentsError):
+            RecordFactory("dict")
+        assert convert_objects(
+            {"a": {"_x": 1}}, object_pairs_hook=RecordFactory("namedtuple")
+        ) == {"a": {"_x": 1}}
@@ -0,0 +1,74 @@
+"""
+Test incremental reloading.
+"""
+
+import io
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+import moon
+from moon.core.reload import Changes, Reloader
+from moon.schemas import DuplicateIdentifierNode, ParserError
+from tests.conftest import BaseFactory
+
+CONTENT = (
+    "// head\n@object a\n  key: 1\n\n@object b\n  nested:\n    key: 2\n\n"
+    "@object c\n  key: 3\n"
+)
+
+
+@pytest.mark.order(6)
+class TestReload(BaseFactory):
+    def test_reload_positive(self, tmp_path: Path):
+        path = tmp_path / "a.moon"
+        path.write_text(CONTENT)
+        reloader = Reloader(path)
+        assert reloader.document == moon.load(path)
+        assert reloader.parsed == 4
+
+        calls: List[Changes] = []
+
+        def subscriber(changes: Changes, document: Dict[str, Any]):
+            calls.append(changes)
+
+        reloader.subscribe(subscriber)
+        nested = reloader.document["b"]
+        content = CONTENT.replace("key: 3", "key: 4").replace("@object a", "@object d")
+        path.write_text(content + "\n// tail")
+        changes = reloader.reload()
+        assert changes == Changes(
+            added=frozenset({"d"}), changed=frozenset({"c"}), removed=frozenset({"a"})
+        )
+        assert reloader.parsed == 2
+        assert reloader.document["b"] is nested
+        assert reloader.document == moon.load(path)
+        assert calls == [changes]
+
+        # Comments only change is not reported
+        path.write_text(content + "\n// other tail")
+        assert not reloader.reload()
+        assert reloader.parsed == 1
+        assert not reloader.reload()
+        assert reloader.parsed == 0
+        assert len(calls) == 1
+
+        reloader.unsubscribe(subscriber)
+        reloader.reload(CONTENT)
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize(
+        ["content", "error"],
+        [
+            [CONTENT + "@object a\n  key: 5", DuplicateIdentifierNode],
+            [CONTENT.replace("    key: 2", "    key: 2\n   bad: 1"), ParserError],
+        ],
+    )
+    def test_reload_negative(self, content: str, error: type):
+        reloader = Reloader(io.StringIO(CONTENT))
+        document = reloader.document
+        with pytest.raises(error):
+            reloader.reload(content)
+        assert reloader.document is document
+        assert not reloader.reload(CONTENT)
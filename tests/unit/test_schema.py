@@ -0,0 +1,115 @@
+"""
+Test schema compiled loaders.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, TypedDict, Union
+
+import pytest
+
+from moon.core.parser import EventParser
+from moon.core.schema import compile_schema, construct_schema
+from moon.core.tokenizer import Tokenizer
+from moon.schemas import DuplicateIdentifierNode, SchemaError
+from tests.conftest import BaseFactory
+
+
+@dataclass
+class Server:
+    host: str
+    port: int
+    debug: bool = False
+    timeout: Optional[float] = None
+
+
+@dataclass
+class Config:
+    server: Server
+    labels: Dict[str, str] = field(default_factory=dict)
+
+
+class ServerDict(TypedDict, total=False):
+    host: str
+    port: Union[int, str]
+
+
+@dataclass
+class Node:
+    child: "Node"
+
+
+CONTENT = (
+    "@object server\n  host: localhost\n  port: 8080\n  timeout: null\n\n"
+    "@object labels\n  env: 1\n  team: core"
+)
+
+
+def load(content: str, schema: Any) -> Any:
+    return construct_schema(EventParser(Tokenizer(content)), schema)
+
+
+@pytest.mark.order(5)
+class TestSchema(BaseFactory):
+    def test_schema_dataclass(self):
+        assert load(CONTENT, Config) == Config(
+            Server("localhost", 8080, timeout=None), {"env": "1", "team": "core"}
+        )
+
+    @pytest.mark.parametrize(
+        ["schema", "expected"],
+        [
+            [
+                {"server": {"host": str, "port": int, "timeout": Any}},
+                {"server": {"host": "localhost", "port": 8080, "timeout": None}},
+            ],
+            [
+                {"server": dict},
+                {"server": {"host": "localhost", "port": 8080, "timeout": None}},
+            ],
+            [{"server": ServerDict}, SchemaError],
+        ],
+    )
+    def test_schema_mapping(self, schema: Any, expected: Any):
+        content = CONTENT.split("\n\n")[0]
+        if expected is SchemaError:
+            with pytest.raises(SchemaError, match="server.timeout: unknown key"):
+                load(content, schema)
+        else:
+            assert load(content, schema) == expected
+
+    def test_schema_typed_dict(self):
+        content = "@object server\n  port: web\n\n@object other\n  port: 80"
+        schema = {"server": ServerDict, "other": ServerDict}
+        assert load(content, schema) == {
+            "server": {"port": "web"},
+            "other": {"port": 80},
+        }
+
+    def test_schema_cache(self):
+        assert compile_schema(Config) is compile_schema(Config)
+        assert compile_schema({"a": {"b": int}}) is compile_schema({"a": {"b": int}})
+
+    @pytest.mark.parametrize(
+        ["content", "match"],
+        [
+            ["@object server\n  host: h\n  port: x", "server.port: expected int"],
+            ["@object server\n  host: h\n  port: 1\n  tls: 1", "server.tls: unknown"],
+            ["@object server\n  host: h", "server.port: missing"],
+            ["@object server\n  host: h\n  port: 1\n  debug: 1", "server.debug"],
+            ["@object server\n  host:\n    a: b\n  port: 1", "server.host"],
+            ["@object other\n  a: 1", "other: unknown identifier"],
+            ["@object labels\n  a: b", "server: missing"],
+        ],
+    )
+    def test_schema_negative(self, content: str, match: str):
+        with pytest.raises(SchemaError, match=match):
+            load(content, Config)
+
+    def test_schema_duplicates(self):
+        with pytest.raises(DuplicateIdentifierNode):
+            load(CONTENT + "\n\n@object labels\n  a: b", Config)
+
+    @pytest.mark.parametrize("schema", [int, Node, {"a": list}, {"a": Dict[int, int]}])
+    def test_schema_unsupported(self, schema: Any):
+        with pytest.raises(SchemaError):
+            compile_schema(schema)
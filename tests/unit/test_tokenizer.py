@@ -2,6 +2,8 @@
 Test tokenizer. Should get text and return parsed tokens.
 """
 
+from typing import Iterable, List, Tuple
+
 import pytest
 
 from moon.core.tokenizer import Tokenizer
@@ -9,6 +11,11 @@ from moon.schemas import Token, TokenizerError, TokenType
 from tests.conftest import BaseFactory
 
 
+def positioned(tokens: Iterable[Token]) -> List[Tuple[int, int, int, TokenType, str]]:
+    """Tokens as tuples with resolved positions."""
+    return [(t.pos, t.line, t.column, t.type, t.value) for t in tokens]
+
+
 @pytest.mark.order(2)
 @pytest.mark.dependency(name="tokenize_ok")
 class TestTokenizer(BaseFactory):
@@ -22,17 +29,107 @@ class TestTokenizer(BaseFactory):
     )
     def test_tokenize_positive(self, content: str):
         expected = [
-            Token(pos=1, line=1, column=1, type=TokenType.word, value="@object"),
-            Token(pos=8, line=1, column=8, type=TokenType.space, value=" "),
-            Token(pos=9, line=1, column=9, type=TokenType.word, value="me"),
-            Token(pos=11, line=1, column=11, type=TokenType.newline, value="\n"),
-            Token(pos=12, line=2, column=1, type=TokenType.word, value="key1"),
-            Token(pos=16, line=2, column=5, type=TokenType.colon, value=":"),
-            Token(pos=17, line=2, column=6, type=TokenType.space, value=" "),
-            Token(pos=18, line=2, column=7, type=TokenType.word, value="value1"),
-            Token(pos=24, line=2, column=13, type=TokenType.eof, value=""),
+            (1, 1, 1, TokenType.word, "@object"),
+            (8, 1, 8, TokenType.whitespace, " "),
+            (9, 1, 9, TokenType.word, "me"),
+            (11, 1, 11, TokenType.newline, "\n"),
+            (12, 2, 1, TokenType.word, "key1"),
+            (16, 2, 5, TokenType.colon, ":"),
+            (17, 2, 6, TokenType.whitespace, " "),
+            (18, 2, 7, TokenType.word, "value1"),
+            (24, 2, 13, TokenType.eof, ""),
+        ]
+        assert positioned(Tokenizer(content)) == expected
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "\ufeff@object me\r\nkey1: value1 // comment\r\n",
+            "  @object me /* multi\rline */\n    key1: value1",
+        ],
+    )
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5])
+    def test_tokenize_chunks(self, content: str, chunk_size: int):
+        chunks = [
+            content[i : i + chunk_size] for i in range(0, len(content), chunk_size)
+        ]
+        assert positioned(Tokenizer(chunks)) == positioned(Tokenizer(content))
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "@object me\nkey1: value1",
+            "\ufeff@object me\nkey1: value1 // comment\n",
+            "  @object me /* multi\nline */\n    key1: value1",
+        ],
+    )
+    def test_tokenize_bytes(self, content: str):
+        assert positioned(Tokenizer(content.encode())) == positioned(Tokenizer(content))
+
+    def test_tokenize_bytes_non_ascii(self):
+        tokens = positioned(Tokenizer("@object я\r\nключ: значение".encode()))
+        assert tokens[2:] == [
+            (9, 1, 9, TokenType.word, "я"),
+            (11, 1, 10, TokenType.newline, "\n"),
+            (13, 2, 1, TokenType.word, "ключ"),
+            (21, 2, 5, TokenType.colon, ":"),
+            (22, 2, 6, TokenType.whitespace, " "),
+            (23, 2, 7, TokenType.word, "значение"),
+            (39, 2, 15, TokenType.eof, ""),
+        ]
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "@object me\nkey1: value1",
+            "@object me /* multi\nline */\n    key1: value1 // comment\n",
+        ],
+    )
+    def test_tokenize_table(self, content: str):
+        tokens = list(Tokenizer(content))
+        table = Tokenizer(content).tabulate()
+        assert len(table) == len(tokens)
+        assert positioned(table) == positioned(tokens)
+        assert [table.type_at(i) for i in range(len(table))] == [
+            token.type for token in tokens
+        ]
+        assert table.value_at(2) == tokens[2].value
+
+    def test_tokenize_table_negative(self):
+        with pytest.raises(TokenizerError):
+            Tokenizer(["@object me"]).tabulate()
+
+    def test_tokenize_whitespace_runs(self):
+        tokens = positioned(Tokenizer("@object me\n        key:   a  b"))
+        assert tokens[4:] == [
+            (12, 2, 1, TokenType.indent, " " * 8),
+            (20, 2, 9, TokenType.word, "key"),
+            (23, 2, 12, TokenType.colon, ":"),
+            (24, 2, 13, TokenType.whitespace, "   "),
+            (27, 2, 16, TokenType.word, "a"),
+            (28, 2, 17, TokenType.whitespace, "  "),
+            (30, 2, 19, TokenType.word, "b"),
+            (31, 2, 20, TokenType.eof, ""),
         ]
-        assert list(Tokenizer(content)) == expected
+
+    @pytest.mark.parametrize(
+        ["content", "comment", "eof"],
+        [
+            [
+                "@object me // comment",
+                (12, 1, 12, TokenType.comment, "// comment"),
+                (22, 1, 22, TokenType.eof, ""),
+            ],
+            [
+                "@object me /* multi\nline */",
+                (12, 1, 12, TokenType.comment, "/* multi\nline */"),
+                (28, 2, 8, TokenType.eof, ""),
+            ],
+        ],
+    )
+    def test_tokenize_comment(self, content: str, comment: Tuple, eof: Tuple):
+        tokens = positioned(Tokenizer(content))
+        assert tokens[-2:] == [comment, eof]
 
     @pytest.mark.parametrize(
         "content",
@@ -43,3 +140,9 @@ class TestTokenizer(BaseFactory):
     def test_tokenize_negative(self, content: str):
         with pytest.raises(TokenizerError):
             list(Tokenizer(content))
+
+        with pytest.raises(TokenizerError):
+            list(Tokenizer(iter(content)))
+
+        with pytest.raises(TokenizerError):
+            list(Tokenizer(content.encode()))
@@ -2,15 +2,38 @@
 Test types resolving. Base resolvers and extensions.
 """
 
-from typing import Any, Type
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, Tuple, Type
 
 import pytest
 
-from moon.hooks.types import represent_type, resolve_type
+from moon.hooks.types import (
+    TypeHook,
+    cache_clear,
+    cache_info,
+    configure_cache,
+    represent_type,
+    resolve_type,
+)
+from moon.hooks.types.hook import _by_first_char, _by_type, _hooks
+from moon.schemas import ArgumentsError
 from tests.conftest import BaseFactory
 
 
 class TestTypes(BaseFactory):
+    @pytest.fixture(autouse=True)
+    def restore_hooks(self) -> Iterator[None]:
+        """Unregister type hooks defined by a test, they are global."""
+        hooks = list(_hooks)
+        maxsize = cache_info().maxsize
+        yield
+        _hooks[:] = hooks
+        _by_first_char.clear()
+        _by_type.clear()
+        configure_cache(maxsize)
+        cache_clear()
+
     @pytest.mark.parametrize(
         ["scalar", "expected_type"],
         [
@@ -41,3 +64,141 @@ class TestTypes(BaseFactory):
     )
     def test_type_represent(self, obj: Any, represented: str):
         assert represent_type(obj) == represented
+
+    def test_type_cache(self):
+        cache_clear()
+        assert resolve_type("true") is True
+        assert resolve_type("true") is True
+        assert resolve_type("8080") == 8080
+        info = cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+        configure_cache(1)
+        assert cache_info().currsize == 1
+        resolve_type("8080")
+        resolve_type("null")
+        assert cache_info().currsize == 1
+        assert cache_info().hits == 2
+        configure_cache(0)
+        resolve_type("null")
+        assert cache_info().currsize == 0
+        configure_cache(1024)
+
+    def test_type_cache_threads(self):
+        values = [str(i % 40) for i in range(50_000)]
+
+        def resolve_all(_: int) -> bool:
+            return all(resolve_type(value) == int(value) for value in values)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        cache_clear()
+        configure_cache(8)
+        try:
+            with ThreadPoolExecutor(8) as executor:
+                assert all(executor.map(resolve_all, range(8)))
+            info = cache_info()
+            assert info.hits + info.misses == 8 * len(values)
+            assert info.currsize == 8
+        finally:
+            sys.setswitchinterval(interval)
+            configure_cache(1024)
+
+    def test_type_cache_hooks(self):
+        assert resolve_type("~list~") == "~list~"
+
+        class ListHook(TypeHook):
+            cacheable = False
+
+            @classmethod
+            def resolve(cls, value: str) -> Tuple[bool, Any]:
+                return value == "~list~", []
+
+            @classmethod
+            def represent(cls, value: Any) -> Tuple[bool, Any]:
+                return False, None
+
+        first = resolve_type("~list~")
+        assert first == []
+        assert resolve_type("~list~") is not first
+
+    @pytest.mark.parametrize("maxsize", [-1, 1.5, None, True])
+    def test_type_cache_negative(self, maxsize: Any):
+        with pytest.raises(ArgumentsError):
+            configure_cache(maxsize)
+
+    @pytest.mark.parametrize(
+        ["scalar", "expected"],
+        [
+            ["007", 7],
+            ["1_000", 1000.0],
+            [" -1.5e3 ", -1500.0],
+            [".5", 0.5],
+            ["-Infinity", float("-inf")],
+            ["1._5", "1._5"],
+            ["True", "True"],
+            ["٣", 3],
+            ["", ""],
+        ],
+    )
+    def test_type_classify(self, scalar: str, expected: Any):
+        cache_clear()
+        assert resolve_type(scalar) == expected
+        assert type(resolve_type(scalar)) is type(expected)
+
+    def test_type_dispatch(self):
+        asked = []
+
+        class HexHook(TypeHook):
+            first_chars = "0"
+            pattern = r"0x[0-9a-f]+"
+
+            @classmethod
+            def resolve(cls, value: str) -> Tuple[bool, Any]:
+                asked.append(value)
+                return True, int(value, 16)
+
+            @classmethod
+            def represent(cls, value: Any) -> Tuple[bool, Any]:
+                return False, None
+
+        assert resolve_type("0xff") == 255
+        assert resolve_type("0xzz") == "0xzz"
+        assert resolve_type("12") == 12
+        assert resolve_type("") == ""
+        assert asked == ["0xff"]
+
+    @pytest.mark.parametrize("attrs", [{"first_chars": ["0"]}, {"pattern": 1}])
+    def test_type_dispatch_negative(self, attrs: dict):
+        with pytest.raises(TypeError):
+            type("BadHook", (TypeHook,), attrs)
+
+    def test_type_represent_dispatch(self):
+        asked = []
+
+        class Version(tuple):
+            pass
+
+        class VersionHook(TypeHook):
+            object_type = tuple
+
+            @classmethod
+            def resolve(cls, value: str) -> Tuple[bool, Any]:
+                return False, None
+
+            @classmethod
+            def represent(cls, value: Any) -> Tuple[bool, Any]:
+                asked.append(value)
+                return True, ".".join(map(str, value))
+
+        assert represent_type(Version((1, 2))) == "1.2"
+        assert represent_type(7) == "7"
+        assert represent_type(None) == "null"
+        assert asked == [(1, 2)]
+        with pytest.raises(TypeError):
+            represent_type([1, 2])
+
+    @pytest.mark.parametrize("object_type", [1, (int, "str")])
+    def test_type_represent_dispatch_negative(self, object_type: Any):
+        with pytest.raises(TypeError):
+            type("BadHook", (TypeHook,), {"object_type": object_type})